@@ -0,0 +1,89 @@
+"""
+    Generic._extract benchmark with pathological websites
+
+    run from the repository root:
+
+        python -m benchmarks.bench_extract
+"""
+import time
+
+from streamlink import Streamlink
+from streamlink.options import Options
+
+from plugins.generic import Generic
+
+SIZE = 20 * 1024
+
+
+def iframes_without_src(size=SIZE):
+    """Every <iframe searches the rest of the website for src= with _iframe_re."""
+    return '<iframe name="x">' * (size // 17) + '<p>end</p>'
+
+
+def equals_before_extension(size=SIZE):
+    """Every = is a possible start of _playlist_re, the URL never ends with a delimiter."""
+    return 'a=' * (size // 2) + 'video.mp4{'
+
+
+def extensions_without_delimiter(size=SIZE):
+    """Every file extension is a possible end of the URL."""
+    return '"' + 'a=.mp4' * (size // 6) + '{'
+
+
+def queries_without_delimiter(size=SIZE):
+    """The query of every playlist URL continues until the end of the website."""
+    return '=x.mp4?;' * (size // 8) + '{'
+
+
+def minified(size=SIZE):
+    """A single line website with many tags, scripts and URLs."""
+    item = ('<div class="item"><a href="/page/{0}">Item {0}</a><img src="/img/{0}.jpg" data-x="a=b">'
+            '<script>var a{0}={{"k":"v{0}","src":"/media/{0}/index.html"}};</script></div>')
+    text = []
+    length = 0
+    i = 0
+    while length < size:
+        text.append(item.format(i))
+        length += len(text[-1])
+        i += 1
+    return '<title>Minified</title>' + ''.join(text) + '<video src="https://example.com/live/master.m3u8">'
+
+
+CORPUS = (
+    iframes_without_src,
+    equals_before_extension,
+    extensions_without_delimiter,
+    queries_without_delimiter,
+    minified,
+)
+
+
+def findall(plugin, text):
+    """Previous implementation, one pass for every pattern."""
+    return (plugin._playlist_re.findall(text), plugin._iframe_re.findall(text),
+            plugin._window_location_re.search(text), plugin._og_title_re.search(text) or plugin._title_re.search(text))
+
+
+def timed(func):
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def main():
+    session = Streamlink()
+    plugin = Generic(session, 'generic://https://example.com', Options())
+    bounded = Generic(session, 'generic://https://example.com', Options({'extract_timeout': 0.5}))
+    print('{0:<32} {1:>10} {2:>10} {3:>10}'.format('website', 'findall', '_extract', 'timeout'))
+    for corpus in CORPUS:
+        text = corpus()
+        print('{0:<32} {1:>9.3f}s {2:>9.3f}s {3:>9.3f}s'.format(
+            corpus.__name__,
+            timed(lambda: findall(plugin, text)),
+            timed(lambda: plugin._extract(text)),
+            timed(lambda: bounded._extract(text)),
+        ))
+
+
+if __name__ == '__main__':
+    main()
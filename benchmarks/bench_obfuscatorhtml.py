@@ -0,0 +1,45 @@
+"""
+    unpack_obfuscatorhtml benchmark
+
+    run from the repository root:
+
+        python -m benchmarks.bench_obfuscatorhtml
+"""
+import base64
+import re
+import timeit
+
+from plugins.generic import _splice_all, obfuscatorhtml_chunk_re, obfuscatorhtml_re, unpack_obfuscatorhtml
+
+from benchmarks.corpus import obfuscator_html
+
+SIZE = 2 * 1024 * 1024
+
+
+def decode_loop(m):
+    """Previous implementation, one chunk and one string concatenation after another."""
+    unpacked = ""
+    chunks = obfuscatorhtml_chunk_re.findall(m.group('chunks'))
+    minus = int(m.group('minus'))
+    for chunk in chunks:
+        int_chunk = int(re.sub(r'\D', '', str(base64.b64decode(chunk))))
+        unpacked += chr(int_chunk - int(minus))
+    return unpacked
+
+
+def main():
+    text = obfuscator_html(SIZE)
+    chunks = len(obfuscatorhtml_chunk_re.findall(text))
+    print('website: {0} chunks, {1:.1f} KB'.format(chunks, len(text) / 1024))
+
+    assert unpack_obfuscatorhtml(text) == _splice_all(obfuscatorhtml_re, text, decode_loop)
+    for name, func in (
+        ('chunk loop', lambda: _splice_all(obfuscatorhtml_re, text, decode_loop)),
+        ('bulk decode', lambda: unpack_obfuscatorhtml(text)),
+    ):
+        seconds = min(timeit.repeat(func, number=1, repeat=3))
+        print('{0:<20} {1:8.3f} s'.format(name, seconds))
+
+
+if __name__ == '__main__':
+    main()
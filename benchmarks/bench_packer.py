@@ -0,0 +1,55 @@
+"""
+    Packer._replacestrings benchmark
+
+    run from the repository root:
+
+        python -m benchmarks.bench_packer
+"""
+import timeit
+
+from plugins.generic import Packer
+
+ENTRIES = 10000
+REFERENCES = 3
+
+
+def replacestrings_loop(source):
+    """Previous implementation, one str.replace per lookup entry."""
+    import re
+    match = re.search(r'var *(_\w+)\=\["(.*?)"\];', source, re.DOTALL)
+    if match:
+        varname, strings = match.groups()
+        startpoint = len(match.group(0))
+        lookup = strings.split('","')
+        variable = '%s[%%d]' % varname
+        for index, value in enumerate(lookup):
+            source = source.replace(variable % index, '"%s"' % value)
+        return source[startpoint:]
+    return source
+
+
+def make_source(entries=ENTRIES, references=REFERENCES):
+    table = '","'.join('value{0}'.format(i) for i in range(entries))
+    body = ';'.join(
+        'a{0}=_0x[{1}]'.format(n, (n * 7919) % entries)
+        for n in range(entries * references)
+    )
+    return 'var _0x=["{0}"];{1}'.format(table, body)
+
+
+def main():
+    source = make_source()
+    packer = Packer()
+    print('source: {0} entries, {1:.1f} KB'.format(ENTRIES, len(source) / 1024))
+
+    assert packer._replacestrings(source) == replacestrings_loop(source)
+    for name, func in (
+        ('str.replace loop', replacestrings_loop),
+        ('single regex pass', packer._replacestrings),
+    ):
+        seconds = min(timeit.repeat(lambda: func(source), number=1, repeat=3))
+        print('{0:<20} {1:8.3f} s'.format(name, seconds))
+
+
+if __name__ == '__main__':
+    main()
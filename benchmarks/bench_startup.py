@@ -0,0 +1,48 @@
+"""
+    plugin load time benchmark
+
+    run from the repository root:
+
+        python -m benchmarks.bench_startup
+
+    Every import runs in a new interpreter, the time of
+    streamlink and its stream modules is measured separately and subtracted.
+"""
+import subprocess
+import sys
+
+from importlib.util import find_spec
+
+REPEAT = 5
+
+CODE = '''
+import time
+started = time.perf_counter()
+{0}
+print(time.perf_counter() - started)
+'''
+
+
+def measure(statement):
+    return min(
+        float(subprocess.check_output([sys.executable, '-c', CODE.format(statement)], text=True))
+        for _ in range(REPEAT)
+    )
+
+
+def main():
+    streamlink = measure('import streamlink.session, streamlink.stream')
+    print('{0:<24} {1:8.3f} s'.format('streamlink', streamlink))
+    plugin = measure('import streamlink.session, streamlink.stream; import plugins.generic')
+    print('{0:<24} {1:8.3f} s'.format('plugins.generic', plugin - streamlink))
+    for name in ('yt_dlp', 'youtube_dl'):
+        if find_spec(name):
+            ytdl = measure('import streamlink.session, streamlink.stream; import plugins.generic; import {0}'.format(name))
+            print('{0:<24} {1:8.3f} s'.format('+ eager ' + name, ytdl - streamlink))
+            break
+    else:
+        print('yt_dlp and youtube_dl are not installed')
+
+
+if __name__ == '__main__':
+    main()
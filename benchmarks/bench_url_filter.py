@@ -0,0 +1,80 @@
+"""
+    _make_url_list URL filter benchmark
+
+    run from the repository root:
+
+        python -m benchmarks.bench_url_filter
+"""
+import timeit
+
+from urllib.parse import urlparse
+
+from streamlink import Streamlink
+from streamlink.options import Options
+
+from plugins.generic import Generic
+
+URLS = 5000
+RULES = 200
+
+
+def check_chain(plugin, parsed_url, url_type, blacklist_path, whitelist_path):
+    """Previous implementation, an if/elif chain with linear path list scans."""
+    if not parsed_url.scheme.startswith(('http')):
+        return 'SCHEME'
+    elif (url_type == 'iframe'
+            and plugin.get_option('whitelist_netloc')
+            and parsed_url.netloc.endswith(tuple(plugin.get_option('whitelist_netloc'))) is False):
+        return 'WL-netloc'
+    elif (url_type == 'iframe'
+            and whitelist_path
+            and plugin.compare_url_path(parsed_url, whitelist_path) is False):
+        return 'WL-path'
+    elif parsed_url.netloc.endswith(plugin.blacklist_netloc):
+        return 'BL-static'
+    elif (plugin.get_option('blacklist_netloc')
+            and parsed_url.netloc.endswith(tuple(plugin.get_option('blacklist_netloc')))):
+        return 'BL-netloc'
+    elif plugin.compare_url_path(parsed_url, blacklist_path) is True:
+        return 'BL-path'
+    elif parsed_url.path.endswith(plugin.blacklist_endswith):
+        return 'BL-ew'
+    elif (plugin.get_option('blacklist_filepath')
+            and parsed_url.path.endswith(tuple(plugin.get_option('blacklist_filepath')))):
+        return 'BL-filepath'
+    elif plugin._ads_path_re.search(parsed_url.path) or parsed_url.netloc.startswith(('ads.')):
+        return 'ADS'
+    elif plugin.compare_url_path(parsed_url, list(plugin.blacklist_path_same), path_status='==') is True:
+        return 'BL-path-same'
+    return None
+
+
+def main():
+    plugin = Generic(Streamlink(), 'generic://https://example.com', Options({
+        'blacklist_netloc': ['blocked{0}.com'.format(i) for i in range(RULES)],
+        'blacklist_path': ['example{0}.com/path{0}'.format(i) for i in range(RULES)],
+        'blacklist_filepath': ['/ignore{0}.m3u8'.format(i) for i in range(RULES)],
+        'whitelist_netloc': ['cdn{0}.net'.format(i) for i in range(RULES)],
+    }))
+    blacklist_path = plugin.merge_path_list(list(plugin.blacklist_path), plugin.get_option('blacklist_path'))
+    urls = [
+        urlparse('https://www{0}.cdn{1}.net/live/{0}/master.m3u8'.format(i, i % (RULES * 2)))
+        for i in range(URLS)
+    ]
+    print('{0} URLs, {1} rules per option'.format(URLS, RULES))
+
+    url_filter = plugin._url_filter()
+    for url_type in ('iframe', 'playlist'):
+        assert [url_filter.check(url, url_type) for url in urls] == [
+            check_chain(plugin, url, url_type, blacklist_path, []) for url in urls]
+
+    for name, func in (
+        ('if/elif chain', lambda: [check_chain(plugin, url, 'iframe', blacklist_path, []) for url in urls]),
+        ('GenericURLFilter', lambda: [url_filter.check(url, 'iframe') for url in urls]),
+    ):
+        seconds = min(timeit.repeat(func, number=1, repeat=3))
+        print('{0:<20} {1:8.3f} s'.format(name, seconds))
+
+
+if __name__ == '__main__':
+    main()
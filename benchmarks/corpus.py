@@ -0,0 +1,114 @@
+"""
+    Synthetic websites for the benchmarks
+
+    Every generator returns the same text for the same arguments,
+    `size` is the approximate length of the text in characters.
+"""
+import base64
+import random
+import re
+
+from plugins.generic import Unbaser
+
+from benchmarks import bench_extract
+
+SIZE = 256 * 1024
+
+PLAYER_SCRIPT = (
+    'var player = videojs("player", {{ autoplay: true, muted: false }});'
+    'player.src({{ type: "application/x-mpegURL", src: "https://cdn{0}.example.com/live/{0}/master.m3u8" }});'
+    'player.on("error", function (event) {{ console.log("error", event, {0}); }});'
+)
+
+
+def _fill(size, item):
+    text = []
+    length = 0
+    i = 0
+    while length < size:
+        text.append(item(i))
+        length += len(text[-1])
+        i += 1
+    return ''.join(text)
+
+
+def pack(source, base=62):
+    """Packs `source` like Dean Edward's p.a.c.k.e.r, `source` has no quotes or backslashes."""
+    words = list(dict.fromkeys(re.findall(r'\b\w+\b', source)))
+    encode = Unbaser.for_base(base).encode
+    index = {word: encode(i) for i, word in enumerate(words)}
+    payload = re.sub(r'\b\w+\b', lambda m: index[m.group(0)], source)
+    return ("eval(function(p,a,c,k,e,d){{e=function(c){{return c}};"
+            "while(c--){{if(k[c]){{p=p.replace(new RegExp(e(c)),k[c])}}}}return p}}"
+            "('{0}',{1},{2},'{3}'.split('|'),0,{{}}))").format(payload, base, len(words), '|'.join(words))
+
+
+def packed_scripts(size=SIZE):
+    """Many small packed player scripts, one per line."""
+    return _fill(size, lambda i: '<script>{0}</script>\n'.format(
+        pack(PLAYER_SCRIPT.format(i).replace('"', ''))))
+
+
+def packed_script(size=SIZE):
+    """One packed script with a big symtab."""
+    source = _fill(size, lambda i: PLAYER_SCRIPT.format(i).replace('"', '') + ';var v{0}=w{0};'.format(i))
+    return pack(source)
+
+
+def obfuscator_html(size=SIZE, seed=0):
+    """Obfuscator HTML, every character of the website is a base64 chunk."""
+    rnd = random.Random(seed)
+    minus = 61247097
+    letters = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+    html = _fill(size // 24, lambda i: '<video src="https://cdn{0}.example.com/{0}/index.m3u8"></video>'.format(i))
+    chunks = ', '.join(
+        '"{0}"'.format(base64.b64encode('{0}{1}{2}'.format(
+            ''.join(rnd.choice(letters) for _ in range(3)),
+            ord(char) + minus,
+            ''.join(rnd.choice(letters) for _ in range(3)),
+        ).encode('ascii')).decode('ascii'))
+        for char in html
+    )
+    return ('<script>var MLF = ""; var ncR = [{0}]; ncR.forEach(function a(value) '
+            '{{ MLF += String.fromCharCode(parseInt(atob(value).replace(/\\D/g,\'\')) - {1}); }} ); '
+            'document.write(decodeURIComponent(escape(MLF)));</script>').format(chunks, minus)
+
+
+def iframes(size=SIZE):
+    """Thousands of iframes between other tags."""
+    return _fill(size, lambda i: (
+        '<div class="embed"><iframe width="640" height="360" src="https://embed{0}.example.com/player/{0}" '
+        'allowfullscreen></iframe><p>Channel {0}</p></div>\n'.format(i % 500)))
+
+
+def playlists(size=SIZE):
+    """Thousands of playlist URLs, some are filtered or repeated."""
+    return _fill(size, lambda i: (
+        '<source src="{0}" type="application/x-mpegURL">\n'.format((
+            'https://cdn{0}.example.com/live/{0}/master.m3u8',
+            '//cdn{0}.example.com/hls/{0}/index.m3u8?token=abc{0}',
+            '/vod/{0}/video_720.mp4',
+            'https://ads.example.com/{0}/preroll.mp4',
+            'https://www.example.com/dash/{0}/manifest.mpd',
+        )[i % 5].format(i % 1000))))
+
+
+def minified(size=SIZE):
+    """A single line website with many tags, scripts and URLs."""
+    return bench_extract.minified(size)
+
+
+def pathological(size=SIZE):
+    """A minified one-liner with many possible but invalid URL starts."""
+    return _fill(size, lambda i: 'a{0}=.mp4?x;b="{0}"+".m3u8",<iframe name="f{0}">'.format(i)) + '{'
+
+
+CORPUS = (
+    packed_scripts,
+    packed_script,
+    obfuscator_html,
+    iframes,
+    playlists,
+    minified,
+    pathological,
+)
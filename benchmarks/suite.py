@@ -0,0 +1,150 @@
+"""
+    Throughput of the unpackers and the extraction with synthetic websites
+
+    run from the repository root:
+
+        python -m benchmarks.suite
+        python -m benchmarks.suite --save benchmarks/baseline.json
+        python -m benchmarks.suite --compare benchmarks/baseline.json
+
+    Every case prints its best time and MB/s of the input text.
+    --compare fails, if a case is slower than the baseline by more than
+    --tolerance, the baseline should be saved on the same computer.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+
+from functools import partial
+
+from streamlink import Streamlink
+from streamlink.options import Options
+
+from plugins.generic import Generic, Packer, repair_url, unpack
+
+from benchmarks import corpus
+
+
+def _plugin():
+    return Generic(Streamlink(), 'generic://https://www.example.com/live', Options())
+
+
+def _url_list(text):
+    return [candidate.value for candidate in _plugin()._extract(text, kinds=('playlist',))]
+
+
+def _make_url_list(urls):
+    plugin = _plugin()
+
+    def run():
+        # without the URLs of the previous run
+        repair_url.cache_clear()
+        return plugin._make_url_list(urls, plugin.url, url_type='playlist')
+    return run
+
+
+# name, corpus, function of the corpus text -> function that is timed
+CASES = (
+    ('unpack', corpus.packed_scripts, lambda text: lambda: unpack(text)),
+    ('unpack', corpus.obfuscator_html, lambda text: lambda: unpack(text)),
+    ('unpack', corpus.minified, lambda text: lambda: unpack(text)),
+    ('Packer.unpack', corpus.packed_script, lambda text: lambda: Packer().unpack(text)),
+    ('_playlist_re', corpus.playlists, lambda text: lambda: Generic._playlist_re.findall(text)),
+    ('_playlist_re', corpus.minified, lambda text: lambda: Generic._playlist_re.findall(text)),
+    ('_iframe_re', corpus.iframes, lambda text: lambda: Generic._iframe_re.findall(text)),
+    ('_iframe_re', corpus.minified, lambda text: lambda: Generic._iframe_re.findall(text)),
+    ('_extract', corpus.playlists, lambda text: partial(_plugin()._extract, text)),
+    ('_extract', corpus.iframes, lambda text: partial(_plugin()._extract, text)),
+    ('_extract', corpus.minified, lambda text: partial(_plugin()._extract, text)),
+    ('_extract', corpus.pathological, lambda text: partial(_plugin()._extract, text)),
+    ('_make_url_list', corpus.playlists, lambda text: _make_url_list(_url_list(text))),
+)
+
+
+def best_time(func, repeat):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def run(size, repeat, select=None):
+    results = {}
+    texts = {}
+    for name, generator, setup in CASES:
+        case = '{0}/{1}'.format(name, generator.__name__)
+        if select and not any(s in case for s in select):
+            continue
+        if generator not in texts:
+            texts[generator] = generator(size)
+        text = texts[generator]
+        seconds = best_time(setup(text), repeat)
+        size_mb = len(text.encode('utf-8')) / 1e6
+        results[case] = {
+            'bytes': len(text.encode('utf-8')),
+            'seconds': round(seconds, 6),
+            'mb_s': round(size_mb / seconds, 3) if seconds else None,
+        }
+        print('{0:<36} {1:>9.4f} s {2:>10.2f} MB/s'.format(case, seconds, results[case]['mb_s'] or 0))
+    return results
+
+
+def compare(results, baseline, tolerance):
+    slower = []
+    print()
+    print('{0:<36} {1:>11} {2:>11} {3:>8}'.format('case', 'baseline', 'now', 'ratio'))
+    for case, result in results.items():
+        base = baseline.get('cases', {}).get(case)
+        if not base:
+            print('{0:<36} {1:>11}'.format(case, 'new'))
+            continue
+        ratio = result['seconds'] / base['seconds'] if base['seconds'] else 1.0
+        print('{0:<36} {1:>9.4f} s {2:>9.4f} s {3:>7.2f}x'.format(case, base['seconds'], result['seconds'], ratio))
+        if ratio > 1 + tolerance:
+            slower.append(case)
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='benchmarks.suite', description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--size', type=int, default=corpus.SIZE, help='size of every website in characters')
+    parser.add_argument('--repeat', type=int, default=5, help='the best time of this many runs is used')
+    parser.add_argument('--select', action='append', metavar='TEXT', help='only cases that contain TEXT')
+    parser.add_argument('--save', metavar='FILE', help='save the results as a baseline')
+    parser.add_argument('--compare', metavar='FILE', help='compare the results with a baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown, 0.25 is 25%%')
+    args = parser.parse_args(argv)
+
+    print('{0} {1}, website size {2} characters'.format(
+        platform.python_implementation(), platform.python_version(), args.size))
+    results = run(args.size, args.repeat, args.select)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'size': args.size,
+                'cases': results,
+            }, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print('Saved {0}'.format(args.save))
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline.get('size') != args.size:
+            print('Baseline size {0} is not {1}'.format(baseline.get('size'), args.size))
+            return 2
+        slower = compare(results, baseline, args.tolerance)
+        if slower:
+            print('Slower than the baseline: {0}'.format(', '.join(slower)))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
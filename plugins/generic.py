@@ -4,22 +4,44 @@
     source: https://github.com/back-to/generic
     issues: https://github.com/back-to/generic/issues
 """
+import argparse
+import asyncio
 import base64
+import binascii
+import bisect
 import codecs
+import contextvars
+import copy
+import hashlib
+import json
 import logging
 import os.path
 import re
-
+import sqlite3
+import sys
+import threading
+import time
+
+from functools import lru_cache, partial, wraps
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
 from html import unescape as html_unescape
+from importlib import import_module
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Pattern
+from typing import Callable, Dict, List, Match, NamedTuple, Optional, Pattern, Tuple
 from urllib.parse import parse_qsl, unquote, urljoin, urlparse
 
+from requests.adapters import HTTPAdapter
+
+from streamlink import Streamlink
 from streamlink.exceptions import (
     FatalPluginError,
     NoPluginError,
     NoStreamsError,
 )
+from streamlink.options import Options
 from streamlink.plugin import Plugin, pluginargument, pluginmatcher
 from streamlink.plugin.api import useragents
 from streamlink.plugin.plugin import HIGH_PRIORITY
@@ -28,15 +50,9 @@ from streamlink.stream.ffmpegmux import MuxedStream
 from streamlink.utils.args import comma_list, num
 from streamlink.utils.url import update_scheme
 
-try:
-    import yt_dlp as youtube_dl
-    HAS_YTDL = True
-except ImportError:
-    try:
-        import youtube_dl
-        HAS_YTDL = True
-    except ImportError:
-        HAS_YTDL = False
+# yt_dlp imports all of its extractors, it is only imported by ytdl_fallback
+YTDL_MODULE = next((name for name in ('yt_dlp', 'youtube_dl') if find_spec(name)), None)
+HAS_YTDL = YTDL_MODULE is not None
 
 GENERIC_VERSION = "2024-10-27"
 
@@ -48,6 +64,7 @@ obfuscatorhtml_re = re.compile(
 )
 unpack_packer_re = re.compile(
     r'''(?P<data>eval\(function\(p,a,c,k,e,(?:d|r)\).*\))''')
+unpack_packer_word_re = re.compile(r'\b\w+\b')
 unpack_unescape_re = re.compile(r"""
     <script[^<>]*>[^>]*
     document.write\(unescape\(\s*
@@ -108,17 +125,30 @@ class Packer(object):
         try:
             if radix == 1:
                 unbase = int
+                encode = str
             else:
-                unbase = Unbaser(radix)
+                unbase = Unbaser.for_base(radix)
+                encode = unbase.encode
         except TypeError:
             raise UnpackingError('Unknown p.a.c.k.e.r. encoding.')
 
+        # the packer encodes the symtab index of every word with the radix,
+        # so all possible replacements are known before the payload is read
+        table = {}
+        for index, word in enumerate(symtab):
+            key = encode(index)
+            table[key] = word or key
+
         def lookup(match):
             """Look up symbols in the synthetic symtab."""
             word = match.group(0)
-            return symtab[unbase(word)] or word
+            try:
+                return table[word]
+            except KeyError:
+                # not encoded by the packer, e.g. a leading zero
+                return symtab[unbase(word)] or word
 
-        source = re.sub(r'\b\w+\b', lookup, payload)
+        source = unpack_packer_word_re.sub(lookup, payload)
         return self._replacestrings(source)
 
     def _filterargs(self, source):
@@ -150,150 +180,961 @@ class Packer(object):
             varname, strings = match.groups()
             startpoint = len(match.group(0))
             lookup = strings.split('","')
-            variable = '%s[%%d]' % varname
-            for index, value in enumerate(lookup):
-                source = source.replace(variable % index, '"%s"' % value)
-            return source[startpoint:]
+
+            def replace(m):
+                index = int(m.group(1))
+                if index < len(lookup):
+                    return '"%s"' % lookup[index]
+                return m.group(0)
+
+            # all references in one pass, inserted values are not searched again
+            # and a longer name like `a_0x[1]` is not a reference of `_0x`
+            variable_re = re.compile(r'(?<![\w$])%s\[(0|[1-9]\d*)\]' % re.escape(varname))
+            return variable_re.sub(replace, source[startpoint:])
         return self.beginstr + source + self.endstr
 
 
 class Unbaser(object):
     """Functor for a given base. Will efficiently convert
-    strings to natural numbers."""
+    strings to natural numbers.
+
+    Use `Unbaser.for_base` to get the shared instance of a base,
+    instances are not modified after they are created."""
     ALPHABET = {
         62: '0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ',
         95: (' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ'
              '[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~')
     }
+    # shared instances by base
+    _instances = {}
 
     def __init__(self, base):
         self.base = base
-        # fill elements 37...61, if necessary
-        if 36 < base < 62:
-            if not hasattr(self.ALPHABET,
-                           self.ALPHABET[62][:base]):
-                self.ALPHABET[base] = self.ALPHABET[62][:base]
-        # attrs = self.ALPHABET
-        # print ', '.join("%s: %s" % item for item in attrs.items())
+        # elements 2...61 are the start of the base 62 alphabet
+        if base <= 62:
+            self.alphabet = self.ALPHABET[62][:base]
+        else:
+            self.alphabet = self.ALPHABET.get(base, '')
+
         # If base can be handled by int() builtin, let it do it for us
         if 2 <= base <= 36:
             self.unbase = lambda s: int(s, base)
         else:
-            # Build conversion dictionary cache
-            try:
-                self.dictionary = dict(
-                    (cipher, index) for index, cipher in enumerate(self.ALPHABET[base]))
-            except KeyError:
+            if base < 2 or not self.alphabet:
                 raise TypeError('Unsupported base encoding.')
+            # Build conversion dictionary cache
+            self.dictionary = dict(
+                (cipher, index) for index, cipher in enumerate(self.alphabet))
+            # every word with one or two ciphers,
+            # packed scripts rarely need longer words
+            self.words = dict(self.dictionary)
+            self.words.update(
+                (first + second, index * base + self.dictionary[second])
+                for first, index in self.dictionary.items()
+                for second in self.alphabet)
             self.unbase = self._dictunbaser
 
+    @classmethod
+    def for_base(cls, base):
+        """Returns the shared Unbaser of `base`."""
+        try:
+            return cls._instances[base]
+        except KeyError:
+            return cls._instances.setdefault(base, cls(base))
+
     def __call__(self, s):
         return self.unbase(s)
 
+    def encode(self, number):
+        """Encodes a natural number, the inverse of `__call__`."""
+        digits = []
+        while True:
+            number, index = divmod(number, self.base)
+            digits.append(self.alphabet[index])
+            if not number:
+                break
+        return ''.join(reversed(digits))
+
     def _dictunbaser(self, s):
         """Decodes a  value to an integer."""
+        try:
+            return self.words[s]
+        except KeyError:
+            pass
         ret = 0
-        for index, cipher in enumerate(s[::-1]):
-            ret += (self.base ** index) * self.dictionary[cipher]
+        for cipher in s:
+            ret = ret * self.base + self.dictionary[cipher]
         return ret
 
 
+def _splice(pattern: Pattern, text: str, repl: Callable[[Match], Optional[str]], group=0):
+    """Replace every copy of the `pattern` matches of `text` in one pass.
+
+    `repl` returns the new text for `group` of a match, or None to keep it.
+    Like str.replace() after every match, every copy of a replaced text is
+    replaced, also where `pattern` does not match. A match that overlaps
+    the copy of an earlier text is left for the next pass, because the
+    earlier text is replaced first.
+    Returns the new text and the number of replaced texts.
+    """
+    # (start, end, new) of every copy, sorted by start
+    spans = []
+
+    def _free(start, end):
+        index = bisect.bisect_left(spans, (start,))
+        if (index and spans[index - 1][1] > start) or (index < len(spans) and spans[index][0] < end):
+            return None
+        return index
+
+    count = 0
+    for m in pattern.finditer(text):
+        if _free(*m.span(group)) is None:
+            continue
+        old = m.group(group)
+        new = repl(m)
+        if new is None or new == old:
+            continue
+        count += 1
+        start = text.find(old)
+        while start != -1:
+            end = start + len(old)
+            index = _free(start, end)
+            if index is None:
+                start = text.find(old, start + 1)
+            else:
+                spans.insert(index, (start, end, new))
+                start = text.find(old, end)
+
+    if not spans:
+        return text, 0
+    segments = []
+    pos = 0
+    for start, end, new in spans:
+        segments.append(text[pos:start])
+        segments.append(new)
+        pos = end
+    segments.append(text[pos:])
+    return ''.join(segments), count
+
+
+def _splice_all(pattern: Pattern, text: str, repl: Callable[[Match], Optional[str]], group=0) -> str:
+    """Like `_splice`, but rescan until the decoded output has no new match.
+
+    Each pass handles every match of the current text at once,
+    the number of passes only depends on how deep the matches are nested.
+    """
+    while True:
+        text, count = _splice(pattern, text, repl, group)
+        if not count:
+            return text
+
+
 def unpack_packer(text: str) -> str:
     """unpack p.a.c.k.e.r"""
     packer = Packer()
-    packer_list = unpack_packer_re.findall(text)
-    if packer_list:
-        for data in packer_list:
-            if packer.detect(data):
-                try:
-                    unpacked = packer.unpack(data).replace('\\', '')
-                    text = text.replace(data, unpacked)
-                except UnpackingError:
-                    pass
-    return text
+
+    def _repl(m):
+        data = m.group('data')
+        if packer.detect(data):
+            try:
+                return packer.unpack(data).replace('\\', '')
+            except UnpackingError:
+                pass
+
+    return _splice(unpack_packer_re, text, _repl)[0]
+
+
+# str() of these bytes has no \x escape, which would add hex digits
+_obfuscatorhtml_plain = bytes(range(0x20, 0x7f)) + b'\t\n\r'
+# everything except the digits and the \x00 between two chunks
+_obfuscatorhtml_not_digit = bytes(b for b in range(256) if b not in b'0123456789\x00')
+
+
+def _obfuscatorhtml_decode_chunks(chunks, minus):
+    """Decodes one chunk after another, used for unusual chunks."""
+    unpacked = []
+    for chunk in chunks:
+        int_chunk = int(re.sub(r'\D', '', str(base64.b64decode(chunk))))
+        unpacked.append(chr(int_chunk - minus))
+    return ''.join(unpacked)
+
+
+def _obfuscatorhtml_decode(m: Match) -> str:
+    chunks = obfuscatorhtml_chunk_re.findall(m.group('chunks'))
+    minus = int(m.group('minus'))
+    # decode all chunks at once, separated by \x00
+    try:
+        data = b'\x00'.join(map(binascii.a2b_base64, chunks))
+    except binascii.Error:
+        return _obfuscatorhtml_decode_chunks(chunks, minus)
+    if data.count(0) == len(chunks) - 1 and not data.translate(None, _obfuscatorhtml_plain + b'\x00'):
+        try:
+            return ''.join([chr(int(digits) - minus)
+                            for digits in data.translate(None, _obfuscatorhtml_not_digit).split(b'\x00')])
+        except ValueError:
+            pass
+    return _obfuscatorhtml_decode_chunks(chunks, minus)
 
 
 def unpack_obfuscatorhtml(text: str) -> str:
     """
     Unpacker for Obfuscator HTML https://github.com/BlueEyesHF/Obfuscator-HTML
     """
-    while True:
-        m = obfuscatorhtml_re.search(text)
-        if m:
-            unpacked = ""
-            chunks = obfuscatorhtml_chunk_re.findall(m.group('chunks'))
-            minus = int(m.group('minus'))
-            for chunk in chunks:
-                int_chunk = int(re.sub(r'\D', '', str(base64.b64decode(chunk))))
-                unpacked += chr(int_chunk - int(minus))
-            text = text.replace(m.group(0), unpacked)
-        else:
-            break
-    return text
+    return _splice_all(obfuscatorhtml_re, text, _obfuscatorhtml_decode)
 
 
 def unpack_unescape(text: str) -> str:
-    while True:
-        m = unpack_unescape_re.search(text)
-        if m:
-            text = text.replace(m.group(0), unquote(m.group(1)))
-        else:
-            break
-    return text
+    return _splice_all(unpack_unescape_re, text, lambda m: unquote(m.group(1)))
+
+
+def _source_url_decode(m: Match) -> str:
+    try:
+        atob = base64.b64decode(m.group("atob")).decode("utf-8")
+    except Exception:
+        atob = 'INVALID unpack_source_url'
+    return "{q}{atob}{q}".format(q=m.group("q"), atob=atob)
 
 
 def unpack_source_url(text: str, _unpack_source_url_re: Pattern) -> str:
-    while True:
-        m1 = _unpack_source_url_re.search(text)
-        if m1:
-            try:
-                atob = base64.b64decode(m1.group("atob")).decode("utf-8")
-            except Exception:
-                atob = 'INVALID unpack_source_url'
+    return _splice_all(_unpack_source_url_re, text, _source_url_decode, group="replace")
 
-            try:
-                atob = "{q}{atob}{q}".format(q=m1.group("q"), atob=atob)
-                text = text.replace(m1.group("replace"), atob)
-            except Exception:
-                pass
-        else:
-            break
-    return text
 
+def _unicode_escape(s: str) -> str:
+    unicode_escape = codecs.getdecoder('unicode_escape')
+    return re.sub(r'\\u[0-9a-fA-F]{4}', lambda m: unicode_escape(m.group(0))[0], s)
 
-def unpack_u_m3u8(text: str) -> str:
-    def _unicode_escape(s: str) -> str:
-        unicode_escape = codecs.getdecoder('unicode_escape')
-        return re.sub(r'\\u[0-9a-fA-F]{4}', lambda m: unicode_escape(m.group(0))[0], s)
 
-    while True:
-        m = unpack_u_m3u8_re.search(text)
-        if m:
-            text = text.replace(m.group(0), _unicode_escape(m.group(0)))
-        else:
-            break
-    return text
+def unpack_u_m3u8(text: str) -> str:
+    return _splice_all(unpack_u_m3u8_re, text, lambda m: _unicode_escape(m.group(0)))
+
+
+# name, trigger token and decoder for every unpack() step,
+# a decoder can only match if its trigger token is part of the text
+UNPACKERS = (
+    ('packer', 'eval(function(p,a,c,k,e,', unpack_packer),
+    ('obfuscatorhtml', '.forEach', unpack_obfuscatorhtml),
+    ('unescape', 'unescape(', unpack_unescape),
+    ('source_url_1', 'atob(', partial(unpack_source_url, _unpack_source_url_re=unpack_source_url_re_1)),
+    ('source_url_2', 'atob(', partial(unpack_source_url, _unpack_source_url_re=unpack_source_url_re_2)),
+    ('source_url_3', 'atob(', partial(unpack_source_url, _unpack_source_url_re=unpack_source_url_re_3)),
+    ('u_m3u8', '\\u0022', unpack_u_m3u8),
+)
 
 
 def unpack(text: str) -> str:
     """ unpack html source code """
-    text = unpack_packer(text)
-    text = unpack_obfuscatorhtml(text)
-    text = unpack_unescape(text)
-    text = unpack_source_url(text, unpack_source_url_re_1)
-    text = unpack_source_url(text, unpack_source_url_re_2)
-    text = unpack_source_url(text, unpack_source_url_re_3)
-    text = unpack_u_m3u8(text)
+    used, skipped = [], []
+    for name, token, decoder in UNPACKERS:
+        # the token is checked against the current text,
+        # an earlier decoder might have added it
+        if token in text:
+            used.append(name)
+            text = decoder(text)
+        else:
+            skipped.append(name)
+    log.debug('Unpack - used: {0} - skipped: {1}'.format(
+        ', '.join(used) or '-', ', '.join(skipped) or '-'))
     return text
 
 
-class GenericCache(object):
-    '''GenericCache is useded as a temporary session cache
-       - GenericCache.blacklist_path
-       - GenericCache.cache_url_list
-       - GenericCache.whitelist_path
+_generic_context = contextvars.ContextVar('generic_context', default=None)
+# (plugin, task) of Generic.astreams(), used by Generic._get_streams
+_resolved_streams = contextvars.ContextVar('generic_resolved_streams', default=None)
+
+
+async def _to_thread(func, *args, **kwargs):
+    """asyncio.to_thread() for Python 3.8, runs `func` in the default executor
+    with the ContextVars of this task, e.g. the GenericContext"""
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(None, partial(context.run, func, *args, **kwargs))
+
+
+class GenericContext(object):
+    '''State of one resolution, shared by the plugin instances of a website
+       and all of its iframes and redirections.
+
+       The active context is stored in a ContextVar, concurrent resolutions
+       in other threads or asyncio tasks don't use the same context.
+
+       - GenericContext.history
+       - GenericContext.hops
+       - GenericContext.validators
+       - GenericContext.stats
+
+       Use `GenericContext.scope()` to resolve several URLs in one context.
+    '''
+    # number of remembered URLs
+    max_urls = 1000
+
+    def __init__(self, max_urls=None):
+        if max_urls:
+            self.max_urls = max_urls
+        self.reset()
+
+    def reset(self):
+        '''Forget every used URL'''
+        # used URLs in order, the newest URL is at the end
+        self.history = deque(maxlen=self.max_urls)
+        # URL -> how often it is in history
+        self._visited = {}
+        # URL -> (ETag, Last-Modified)
+        self.validators = {}
+        # number of opened URLs, not limited by max_urls
+        self.hops = 0
+        self.stats = GenericStats()
+
+    @classmethod
+    def current(cls) -> Optional['GenericContext']:
+        return _generic_context.get()
+
+    @classmethod
+    @contextmanager
+    def scope(cls, context=None):
+        '''Use `context` or a new context, until the with block ends'''
+        context = context or cls()
+        token = _generic_context.set(context)
+        try:
+            yield context
+        finally:
+            _generic_context.reset(token)
+
+    def __contains__(self, url):
+        return url in self._visited
+
+    def add(self, url):
+        if len(self.history) == self.history.maxlen:
+            old_url = self.history[0]
+            if self._visited[old_url] == 1:
+                del self._visited[old_url]
+                self.validators.pop(old_url, None)
+            else:
+                self._visited[old_url] -= 1
+        self.history.append(url)
+        self._visited[url] = self._visited.get(url, 0) + 1
+        self.hops += 1
+
+    @property
+    def referer(self):
+        '''The URL before the newest URL'''
+        if len(self.history) >= 2:
+            return self.history[-2]
+        return self.history[-1] if self.history else None
+
+
+# callbacks for the stats of every resolution, `callback(record)`
+STATS_CALLBACKS: List[Callable[[dict], None]] = []
+
+# megabytes of --generic-unpack-cache-size
+UNPACK_CACHE_SIZE = 16
+
+
+class GenericStats(object):
+    '''Timings and counters of one resolution,
+       used by --generic-stats-file and STATS_CALLBACKS
+
+       - stages: name -> count, wall and CPU seconds,
+         a stage can contain another stage
+       - bytes: size of the opened websites
+       - candidates: URL type -> found and valid URLs
+       - removed: REMOVE reason -> number of URLs
     '''
-    pass
+    _file_lock = threading.Lock()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.monotonic()
+        self.stages = {}
+        self.bytes = 0
+        self.candidates = {}
+        self.removed = Counter()
+
+    @contextmanager
+    def stage(self, name):
+        '''Adds the time of the with block to the stage `name`,
+           CPU time is only measured for the current thread'''
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.thread_time() - cpu
+            with self._lock:
+                stage = self.stages.setdefault(name, {'count': 0, 'wall': 0.0, 'cpu': 0.0})
+                stage['count'] += 1
+                stage['wall'] += wall
+                stage['cpu'] += cpu
+
+    def add_bytes(self, size):
+        with self._lock:
+            self.bytes += size
+
+    def add_candidates(self, url_type, found, valid, removed):
+        with self._lock:
+            candidates = self.candidates.setdefault(url_type or 'other', {'found': 0, 'valid': 0})
+            candidates['found'] += found
+            candidates['valid'] += valid
+            self.removed.update(removed)
+
+    def record(self, **fields):
+        '''Returns the stats as a JSON serializable dict, with `fields`'''
+        with self._lock:
+            return dict(
+                fields,
+                elapsed=round(time.monotonic() - self.started, 6),
+                stages={
+                    name: {
+                        'count': stage['count'],
+                        'wall': round(stage['wall'], 6),
+                        'cpu': round(stage['cpu'], 6),
+                    } for name, stage in self.stages.items()
+                },
+                bytes=self.bytes,
+                candidates={url_type: dict(counts) for url_type, counts in self.candidates.items()},
+                removed=dict(self.removed),
+            )
+
+    @classmethod
+    def write(cls, path, record):
+        '''Appends `record` as a JSON line to `path`'''
+        with cls._file_lock, open(path, 'a') as f:
+            f.write(json.dumps(record) + '\n')
+
+
+def stats_stage(name):
+    '''Adds the time of a Generic method to the stage `name` of its stats'''
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with self.context.stats.stage(name):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def conditional_headers(etag, last_modified):
+    '''Request headers of a cached website with an ETag or Last-Modified header'''
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    return headers
+
+
+class ResolveCacheEntry(NamedTuple):
+    url: str
+    # valid playlist URLs
+    playlists: List[str]
+    # every website URL from the first URL to the website with the playlists
+    chain: List[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires: float
+
+    @property
+    def page_url(self):
+        return self.chain[-1] if self.chain else self.url
+
+    def validators(self):
+        return conditional_headers(self.etag, self.last_modified)
+
+
+class MemoryCache(object):
+    '''Base class of the caches in memory
+
+       The least recently used entries are removed if there are more than
+       `max_entries` or if the `size` of all entries is more than `max_size`.
+    '''
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_size, max_entries=1000):
+        self.max_size = max_size
+        self.max_entries = max_entries
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, max_size, max_entries=1000):
+        '''Returns the cache of this process with the newest limits'''
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(max_size, max_entries)
+            cache = cls._shared
+        cache.resize(max_size, max_entries)
+        return cache
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry):
+        with self._lock:
+            self._remove(key)
+            if entry.size <= self.max_size:
+                self._entries[key] = entry
+                self.size += entry.size
+                self._evict()
+
+    def delete(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def resize(self, max_size, max_entries):
+        with self._lock:
+            self.max_size = max_size
+            self.max_entries = max_entries
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+
+    def _evict(self):
+        while self._entries and (len(self._entries) > self.max_entries or self.size > self.max_size):
+            key, entry = self._entries.popitem(last=False)
+            self.size -= entry.size
+
+
+class DatabaseCache(object):
+    '''Base class of the caches in a sqlite database
+
+       `schema` creates `table`, its primary key is `key` and the column
+       `accessed` is the time of the last use. The least recently used rows
+       are removed if there are more than `max_entries`.
+    '''
+    filename = ''
+    table = ''
+    key = ''
+    schema = ''
+    max_entries = 1000
+    # database file, None disables the database
+    path = None
+    _initialized = set()
+
+    def _create(self, path):
+        '''Uses the database in the directory `path`'''
+        filename = os.path.join(path, self.filename)
+        if filename not in self._initialized:
+            os.makedirs(path, exist_ok=True)
+            with self._connect(filename) as conn:
+                conn.execute(self.schema)
+            self._initialized.add(filename)
+        self.path = filename
+
+    @staticmethod
+    def _connect(filename):
+        return closing(sqlite3.connect(filename, timeout=10, isolation_level=None))
+
+    def _execute(self, *queries):
+        '''Runs `queries` in one connection,
+           returns the first row of every query or None after an error'''
+        try:
+            with self._connect(self.path) as conn:
+                return [conn.execute(*query).fetchone() for query in queries]
+        except sqlite3.Error as e:
+            log.warning('Cache error: {0}'.format(e))
+            return None
+
+    def _evict_query(self):
+        return (
+            'DELETE FROM {0} WHERE {1} NOT IN (SELECT {1} FROM {0} ORDER BY accessed DESC LIMIT ?)'.format(
+                self.table, self.key),
+            (self.max_entries,),
+        )
+
+
+class GenericResolveCache(DatabaseCache):
+    '''Persistent cache of resolved website URLs, used by --generic-cache-dir
+
+       website URL -> playlist URLs and iframe chain,
+       entries expire after `ttl` seconds and the least recently used
+       entries are removed if there are more than `max_entries`.
+    '''
+    filename = 'generic-cache.sqlite3'
+    table = 'resolve'
+    key = 'url'
+    schema = '''CREATE TABLE IF NOT EXISTS resolve (
+        url TEXT PRIMARY KEY,
+        playlists TEXT NOT NULL,
+        chain TEXT NOT NULL,
+        etag TEXT,
+        last_modified TEXT,
+        expires REAL NOT NULL,
+        accessed REAL NOT NULL
+    )'''
+
+    def __init__(self, path, ttl=300, max_entries=1000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._create(path)
+
+    def get(self, url) -> Optional[ResolveCacheEntry]:
+        '''Returns the entry of `url`, expired entries are returned too'''
+        rows = self._execute(
+            ('SELECT url, playlists, chain, etag, last_modified, expires FROM resolve WHERE url = ?', (url,)),
+            ('UPDATE resolve SET accessed = ? WHERE url = ?', (time.time(), url)),
+        )
+        if not rows or rows[0] is None:
+            return None
+        url, playlists, chain, etag, last_modified, expires = rows[0]
+        return ResolveCacheEntry(url, json.loads(playlists), json.loads(chain),
+                                 etag, last_modified, expires)
+
+    def set(self, url, playlists, chain, etag=None, last_modified=None):
+        now = time.time()
+        self._execute(
+            ('INSERT OR REPLACE INTO resolve VALUES (?, ?, ?, ?, ?, ?, ?)',
+             (url, json.dumps(list(playlists)), json.dumps(list(chain)),
+              etag, last_modified, now + self.ttl, now)),
+            self._evict_query(),
+        )
+
+    def refresh(self, url):
+        '''Extends the expiry time of a validated entry'''
+        self._execute(('UPDATE resolve SET expires = ? WHERE url = ?', (time.time() + self.ttl, url)))
+
+    def delete(self, url):
+        self._execute(('DELETE FROM resolve WHERE url = ?', (url,)))
+
+
+class ResText(NamedTuple):
+    '''Text and HTTP status code of a website, returned by Generic._res_text'''
+    text: str
+    # 304 when the validators of the caller are still valid
+    status: int
+
+
+class ResponseCacheEntry(NamedTuple):
+    # URL of the conditional request, the URL after permanent redirects
+    url: str
+    text: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+    @property
+    def size(self):
+        return len(self.text)
+
+    def validators(self):
+        return conditional_headers(self.etag, self.last_modified)
+
+
+class GenericResponseCache(MemoryCache):
+    '''In memory cache of the opened websites, used by --generic-response-cache-size
+
+       website URL -> text, ETag, Last-Modified and the URL after permanent
+       redirects, a cached website is only used after a conditional request
+       returned 304. Its unpacked text is kept by GenericUnpackCache.
+
+       One cache is shared by all resolutions of a process.
+    '''
+    _shared = None
+
+
+class UnpackCacheEntry(NamedTuple):
+    unpacked: str
+    # _extract() of the unpacked text, added after the first search
+    candidates: Optional[List['ExtractCandidate']] = None
+
+    @property
+    def size(self):
+        return len(self.unpacked) + sum(len(candidate.value) for candidate in self.candidates or ())
+
+
+class GenericUnpackCache(MemoryCache, DatabaseCache):
+    '''Cache of unpack() and _extract(), used by --generic-unpack-cache-size
+
+       SHA-1 of the website text -> unpacked text and its candidates,
+       identical websites of different URLs are only unpacked and
+       searched once.
+
+       With --generic-unpack-cache-dir the entries are also saved in
+       a database, for the next processes.
+
+       One cache is shared by all resolutions of a process.
+    '''
+    _shared = None
+    filename = 'generic-unpack.sqlite3'
+    table = 'unpack'
+    key = 'digest'
+    schema = '''CREATE TABLE IF NOT EXISTS unpack (
+        digest TEXT PRIMARY KEY,
+        unpacked TEXT NOT NULL,
+        candidates TEXT,
+        accessed REAL NOT NULL
+    )'''
+
+    def __init__(self, max_size, max_entries=1000, path=None):
+        super().__init__(max_size, max_entries)
+        self.set_path(path)
+
+    @classmethod
+    def shared(cls, max_size, max_entries=1000, path=None) -> 'GenericUnpackCache':
+        cache = super().shared(max_size, max_entries)
+        cache.set_path(path)
+        return cache
+
+    @staticmethod
+    def digest(text) -> str:
+        return hashlib.sha1(text.encode('utf-8', 'surrogatepass')).hexdigest()
+
+    def set_path(self, path):
+        '''Uses the database in the directory `path`, None disables it'''
+        if path is None:
+            self.path = None
+            return
+        try:
+            self._create(path)
+        except (OSError, sqlite3.Error) as e:
+            log.warning('Unpack cache directory disabled: {0}'.format(e))
+            self.path = None
+
+    def get(self, digest) -> Optional[UnpackCacheEntry]:
+        entry = super().get(digest)
+        if entry is not None or not self.path:
+            return entry
+        rows = self._execute(
+            ('SELECT unpacked, candidates FROM unpack WHERE digest = ?', (digest,)),
+            ('UPDATE unpack SET accessed = ? WHERE digest = ?', (time.time(), digest)),
+        )
+        if not rows or rows[0] is None:
+            return None
+        unpacked, candidates = rows[0]
+        if candidates is not None:
+            candidates = [ExtractCandidate(*candidate) for candidate in json.loads(candidates)]
+        entry = UnpackCacheEntry(unpacked, candidates)
+        super().set(digest, entry)
+        return entry
+
+    def set(self, digest, entry):
+        super().set(digest, entry)
+        if self.path:
+            candidates = entry.candidates
+            self._execute(
+                ('INSERT OR REPLACE INTO unpack VALUES (?, ?, ?, ?)',
+                 (digest, entry.unpacked, None if candidates is None else json.dumps(candidates),
+                  time.time())),
+                self._evict_query(),
+            )
+
+
+class CandidateURL(str):
+    '''An URL of _make_url_list, with its parsed URL'''
+
+    def __new__(cls, url, parsed=None):
+        self = super().__new__(cls, url)
+        self.parsed = parsed or urlparse(url)
+        return self
+
+
+class ExtractCandidate(NamedTuple):
+    '''A playlist, iframe, redirect, title or og:title of a website'''
+    kind: str
+    value: str
+    # position of the whole pattern match in the website
+    start: int
+    end: int
+
+
+# second level domains of country code domains, like co.uk or com.au
+_site_second_levels = frozenset(('ac', 'co', 'com', 'edu', 'gov', 'ne', 'net', 'or', 'org'))
+
+
+def site_domain(host):
+    '''Returns the domain of a website, www.bbc.co.uk -> bbc.co.uk'''
+    labels = host.split('.')
+    if labels[-1].isdigit():
+        # IPv4 address
+        return host
+    if len(labels) > 2 and len(labels[-1]) == 2 and labels[-2] in _site_second_levels:
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
+
+
+@lru_cache(maxsize=4096)
+def repair_url(url, base_url, stream_base='') -> CandidateURL:
+    '''Returns a valid absolute URL of a raw URL from a website,
+       the result of every (url, base_url, stream_base) is cached'''
+    # remove \
+    new_url = url.replace('\\', '')
+    # repairs broken scheme
+    if new_url.startswith('http&#58;//'):
+        new_url = 'http:' + new_url[9:]
+    elif new_url.startswith('https&#58;//'):
+        new_url = 'https:' + new_url[10:]
+    new_url = unquote(new_url)
+    # creates a valid url from path only urls
+    # and adds missing scheme for // urls
+    if stream_base and new_url[1] != '/':
+        if new_url[0] == '/':
+            new_url = new_url[1:]
+        new_url = urljoin(stream_base, new_url)
+    else:
+        new_url = urljoin(base_url, new_url)
+    return CandidateURL(new_url)
+
+
+def parse_path_list(path_list):
+    '''Returns (netloc, path) tuples of "example.com/path" strings'''
+    new_list = []
+    for _path_url in path_list:
+        if not _path_url.startswith(('http', '//')):
+            _path_url = update_scheme('http://', _path_url, force=False)
+        _parsed_path_url = urlparse(_path_url)
+        if _parsed_path_url.netloc and _parsed_path_url.path:
+            new_list += [(_parsed_path_url.netloc, _parsed_path_url.path)]
+    return new_list
+
+
+class AffixSet(object):
+    '''str.startswith or str.endswith with many strings,
+       there is one set lookup for every string length,
+       instead of one test for every string'''
+
+    def __init__(self, affixes, suffix=True):
+        self.suffix = suffix
+        lengths = {}
+        for affix in affixes:
+            lengths.setdefault(len(affix), set()).add(affix)
+        self._lengths = sorted(lengths.items())
+
+    def __bool__(self):
+        return bool(self._lengths)
+
+    def matches(self, text):
+        '''Yields every string of this set, that `text` starts or ends with'''
+        size = len(text)
+        for length, affixes in self._lengths:
+            if length > size:
+                break
+            affix = text[size - length:] if self.suffix else text[:length]
+            if affix in affixes:
+                yield affix
+
+    def match(self, text):
+        size = len(text)
+        for length, affixes in self._lengths:
+            if length > size:
+                break
+            if (text[size - length:] if self.suffix else text[:length]) in affixes:
+                return True
+        return False
+
+
+class PathRules(object):
+    '''(netloc, path) rules, the netloc is compared with str.endswith
+       and the path with str.startswith or =='''
+
+    def __init__(self, rules):
+        paths = {}
+        for netloc, path in rules:
+            paths.setdefault(netloc, []).append(path)
+        self._netlocs = AffixSet(paths)
+        self._prefixes = {netloc: AffixSet(_paths, suffix=False) for netloc, _paths in paths.items()}
+        self._paths = {netloc: frozenset(_paths) for netloc, _paths in paths.items()}
+
+    def __bool__(self):
+        return bool(self._netlocs)
+
+    def startswith(self, parsed_url):
+        for netloc in self._netlocs.matches(parsed_url.netloc):
+            if self._prefixes[netloc].match(parsed_url.path):
+                return True
+        return False
+
+    def equals(self, parsed_url):
+        for netloc in self._netlocs.matches(parsed_url.netloc):
+            if parsed_url.path in self._paths[netloc]:
+                return True
+        return False
+
+
+class GenericURLFilter(object):
+    '''Static and user rules of _make_url_list,
+       compiled once for every combination of rules
+
+       check() returns the reason why an URL is removed, or None
+    '''
+
+    def __init__(self, static_netloc=(), static_path=(), static_path_same=(), static_endswith=(),
+                 ads_path_re=None, blacklist_netloc=(), blacklist_path=(), blacklist_filepath=(),
+                 whitelist_netloc=(), whitelist_path=()):
+        self.whitelist_netloc = AffixSet(whitelist_netloc)
+        self.whitelist_path = PathRules(parse_path_list(whitelist_path))
+        self.static_netloc = AffixSet(static_netloc)
+        self.blacklist_netloc = AffixSet(blacklist_netloc)
+        self.blacklist_path = PathRules(list(static_path) + parse_path_list(blacklist_path))
+        self.static_endswith = AffixSet(static_endswith)
+        self.blacklist_filepath = AffixSet(blacklist_filepath)
+        self.ads_path_re = ads_path_re
+        self.static_path_same = PathRules(static_path_same)
+
+    @classmethod
+    @lru_cache(maxsize=32)
+    def compile(cls, **rules) -> 'GenericURLFilter':
+        '''Returns the filter of `rules`, every rule has to be a tuple'''
+        return cls(**rules)
+
+    def check(self, parsed_url, url_type=''):
+        netloc = parsed_url.netloc
+        path = parsed_url.path
+        if not parsed_url.scheme.startswith('http'):
+            # Allow only an url with a valid scheme
+            return 'SCHEME'
+        elif (url_type == 'iframe'
+                and self.whitelist_netloc
+                and not self.whitelist_netloc.match(netloc)):
+            # Allow only whitelisted domains for iFrames
+            # --generic-whitelist-netloc
+            return 'WL-netloc'
+        elif (url_type == 'iframe'
+                and self.whitelist_path
+                and not self.whitelist_path.startswith(parsed_url)):
+            # Allow only whitelisted paths from a domain for iFrames
+            # --generic-whitelist-path
+            return 'WL-path'
+        elif self.static_netloc.match(netloc):
+            # Removes blacklisted domains from a static list
+            # Generic.blacklist_netloc
+            return 'BL-static'
+        elif self.blacklist_netloc.match(netloc):
+            # Removes blacklisted domains
+            # --generic-blacklist-netloc
+            return 'BL-netloc'
+        elif self.blacklist_path.startswith(parsed_url):
+            # Removes blacklisted paths from a domain
+            # Generic.blacklist_path and --generic-blacklist-path
+            return 'BL-path'
+        elif self.static_endswith.match(path):
+            # Removes unwanted endswith images and chatrooms
+            return 'BL-ew'
+        elif self.blacklist_filepath.match(path):
+            # Removes blacklisted file paths
+            # --generic-blacklist-filepath
+            return 'BL-filepath'
+        elif (self.ads_path_re and self.ads_path_re.search(path)) or netloc.startswith('ads.'):
+            # Removes obviously AD URL
+            return 'ADS'
+        elif self.static_path_same.equals(parsed_url):
+            # Removes blacklisted same paths from a domain
+            return 'BL-path-same'
+        return None
 
 
 @pluginmatcher(re.compile(r'((?:generic|resolve)://)(?P<url>.+)'), priority=HIGH_PRIORITY)
@@ -309,6 +1150,61 @@ class GenericCache(object):
 
     Default is 5"""
 )
+@pluginargument(
+    "playlist-workers",
+    default=1,
+    metavar="NUMBER",
+    type=num(int, ge=1, le=25),
+    help="""
+    Number of playlist URLs that are opened at the same time.
+
+    The streams are still added in the order of the playlist URLs.
+
+    Default is 1"""
+)
+@pluginargument(
+    "playlist-timeout",
+    metavar="SECONDS",
+    type=num(float, gt=0),
+    help="""
+    Skip a playlist URL that could not be opened in this time.
+
+    Default is no timeout, other than --http-timeout."""
+)
+@pluginargument(
+    "pool-size",
+    metavar="NUMBER",
+    type=num(int, ge=1, le=100),
+    help="""
+    Number of connections per host that are kept open for the next request.
+
+    Useful with --generic-playlist-workers or --generic-iframe-fanout,
+    when many playlists or iframes are opened from the same host.
+    The HTTP adapters of the session are replaced once, the other plugins
+    use them too.
+
+    Default is the pool size of the session, 10."""
+)
+@pluginargument(
+    "first-match",
+    action="store_true",
+    help="""
+    Stop opening playlist URLs after the first playlist with streams.
+
+    Same as --generic-stream-target best"""
+)
+@pluginargument(
+    "stream-target",
+    metavar="STREAMS",
+    type=comma_list,
+    help="""
+    Stop opening playlist URLs as soon as these streams were found,
+    by using a comma-separated list:
+
+        "720p,best"
+
+    best and worst are found with any stream."""
+)
 @pluginargument(
     "playlist-referer",
     metavar="URL",
@@ -385,6 +1281,38 @@ class GenericCache(object):
     where the main iframe always has the same path.
     """
 )
+@pluginargument(
+    "iframe-explore",
+    action="store_true",
+    help="""
+    Open all iframes of a website at the same time, instead of asking
+    which iframe should be used.
+
+    The iframes are searched level by level, the first iframe with
+    working streams is used. Iframes with playlist URLs are used first.
+    """
+)
+@pluginargument(
+    "iframe-depth",
+    default=3,
+    metavar="NUMBER",
+    type=num(int, ge=1, le=10),
+    help="""
+    Number of iframe levels that are searched with --generic-iframe-explore.
+
+    Default is 3"""
+)
+@pluginargument(
+    "iframe-fanout",
+    default=5,
+    metavar="NUMBER",
+    type=num(int, ge=1, le=25),
+    help="""
+    Number of iframes per level that are opened at the same time
+    with --generic-iframe-explore.
+
+    Default is 5"""
+)
 @pluginargument(
     "ignore-same-url",
     action="store_true",
@@ -396,6 +1324,130 @@ class GenericCache(object):
     Be careful this might result in an infinity loop.
     """
 )
+@pluginargument(
+    "max-bytes",
+    metavar="BYTES",
+    type=num(int, ge=0),
+    help="""
+    Stop reading a website after this amount of bytes.
+
+    Useful for very big websites, where the playlist or iframe
+    is near the top of the HTML code.
+
+    Default is 0, which reads the whole website."""
+)
+@pluginargument(
+    "early-stop",
+    action="store_true",
+    help="""
+    Stop reading a website as soon as a valid playlist URL was found.
+
+    Playlist URLs that are only available after unpacking
+    the whole website might not be found with this option.
+    """
+)
+@pluginargument(
+    "extract-timeout",
+    metavar="SECONDS",
+    type=num(float, gt=0),
+    help="""
+    Maximum time to search a website for playlists and iframes.
+
+    Every pattern match is limited to a part of the website, after
+    this time the rest of the website is searched with a faster,
+    less exact search.
+
+    Useful for very big or broken websites."""
+)
+@pluginargument(
+    "cache-dir",
+    metavar="DIR",
+    help="""
+    Cache resolved playlist URLs of a website in this directory,
+    so the website and its iframes are not opened again.
+    """
+)
+@pluginargument(
+    "cache-ttl",
+    metavar="SECONDS",
+    type=num(int, ge=0),
+    default=300,
+    help="""
+    Time after which a --generic-cache-dir entry has to be validated
+    with its ETag or Last-Modified header, or is opened again.
+
+    Default is 300"""
+)
+@pluginargument(
+    "cache-max",
+    metavar="NUMBER",
+    type=num(int, ge=1),
+    default=1000,
+    help="""
+    Maximum number of --generic-cache-dir entries,
+    the least recently used entries will be removed.
+
+    Default is 1000"""
+)
+@pluginargument(
+    "response-cache-size",
+    metavar="MEGABYTES",
+    type=num(float, ge=0),
+    help="""
+    Keep the opened websites in memory, up to this size.
+
+    A website with an ETag or Last-Modified header is revalidated with
+    a conditional request, the cached website is used if it was not modified,
+    see --generic-unpack-cache-size for its unpacked text.
+
+    Useful if many URLs are resolved in one process, see plugins/generic.py --help
+
+    Default is 0, which disables the cache."""
+)
+@pluginargument(
+    "response-cache-max",
+    metavar="NUMBER",
+    type=num(int, ge=1),
+    default=1000,
+    help="""
+    Maximum number of --generic-response-cache-size entries,
+    the least recently used entries will be removed.
+
+    Default is 1000"""
+)
+@pluginargument(
+    "unpack-cache-size",
+    metavar="MEGABYTES",
+    type=num(float, ge=0),
+    default=UNPACK_CACHE_SIZE,
+    help=f"""
+    Keep the unpacked websites and their playlist and iframe URLs
+    in memory, up to this size.
+
+    Identical websites of different URLs are only unpacked
+    and searched once in a process.
+
+    Default is {UNPACK_CACHE_SIZE}, 0 disables the cache."""
+)
+@pluginargument(
+    "unpack-cache-max",
+    metavar="NUMBER",
+    type=num(int, ge=1),
+    default=1000,
+    help="""
+    Maximum number of --generic-unpack-cache-size entries,
+    in memory and in --generic-unpack-cache-dir.
+
+    Default is 1000"""
+)
+@pluginargument(
+    "unpack-cache-dir",
+    metavar="DIR",
+    help="""
+    Also save the --generic-unpack-cache-size entries in this directory,
+    for the next streamlink processes.
+    """
+)
 @pluginargument(
     "ytdl-disable",
     action="store_true",
@@ -408,6 +1460,14 @@ class GenericCache(object):
     Disable generic plugin and use only youtube-dl.
     """
 )
+@pluginargument(
+    "stats-file",
+    metavar="FILENAME",
+    help="""
+    Append the timings and counters of every resolution to this file,
+    as one JSON line per website URL.
+    """
+)
 @pluginargument(
     "debug",
     action="store_true",
@@ -453,6 +1513,58 @@ class Generic(Plugin):
         <script[^<]+window\.location\.href\s?=\s?["']
         (?P<url>[^"']+)["'];[^<>]+
     ''')
+    # website title
+    _og_title_re = re.compile(r'<meta\s*property="og:title"\s*content="(?P<title>[^<>]+)"\s*/?>')
+    _title_re = re.compile(r'<title[^<>]*>(?P<title>[^<>]+)</title>')
+    # _extract, the first characters of every pattern
+    # and the file extension of a playlist URL
+    _extract_lead_re = re.compile(r'''(?x)
+        (?i:<ifr)|<script|<title|<meta
+        |\.(?:m3u8|mp3|mp4|mpd)
+    ''')
+    # _extract_lead_re without the playlists, which are found with _playlist_re
+    _extract_tag_lead_re = re.compile(r'(?i:<ifr)|<script|<title|<meta')
+    # one _playlist_re.finditer() is faster than testing the leads,
+    # if the website has more than one ".m" per 256 characters
+    _extract_playlist_density = 256
+    # _playlist_re searches the rest of an URL again from every "=" in it,
+    # the playlists of an URL with more than 16 "=" are found with the leads
+    _extract_many_equals_re = re.compile(r'''=(?:[^"'<>\s;{}=]*=){16}''')
+    _extract_lead_kinds = {
+        '<ifr': 'iframe',
+        '<script': 'redirect',
+        '<title': 'title',
+        '<meta': 'og:title',
+    }
+    # characters that are not allowed in the URL of _playlist_re,
+    # except for whitespace
+    _extract_url_stop = frozenset('"\'<>;{}')
+    # start of _iframe_re, until the lazy .*?
+    _extract_iframe_head_re = re.compile(r'''(?isx)
+        <ifr(?:["']\s?\+\s?["'])?ame
+        (?!\sname=["']g_iFrame)
+    ''')
+    # --generic-extract-timeout, maximum length of a pattern match
+    _extract_window = 64 * 1024
+    # --generic-extract-timeout, linear time search after the timeout
+    _token_iframe_re = re.compile(r'''(?isx)
+        <ifr(?:["']\s?\+\s?["'])?ame
+        (?!\sname=["']g_iFrame)
+        [^<>]*
+    ''')
+    _token_src_re = re.compile(r'''(?i)src=["'](?P<url>[^"'\s<>]+)\s?["']''')
+    _token_playlist_re = re.compile(r'\.(?:m3u8|mp3|mp4|mpd)')
+    _token_url_re = re.compile(r'''[^"'<>\s;{}]*''')
+    # playlist ranking, names of master playlists
+    _playlist_master_re = re.compile(r'''(?ix)
+        (?:master|manifest|playlist|main)[^/]*\.m3u8
+    ''')
+    # playlist ranking, playlists that are probably not the main video
+    _playlist_unwanted_re = re.compile(r'''(?ix)
+        (?:^|[/_.-])
+        (?:ads?|advert\w*|preroll|preview|trailer|teaser|promo|thumbs?|sample)
+        (?:[/_.-]|\d|$)
+    ''')
     # obviously ad paths
     _ads_path_re = re.compile(r'''(?x)
         /ads?/?(?:\w+)?
@@ -486,26 +1598,49 @@ class Generic(Plugin):
         'javascript:false',
         'accounts.google.com',
     )
+    # Not allowed paths of a netloc, the path is compared with startswith
+    blacklist_path = (
+        ('facebook.com', '/connect'),
+        ('facebook.com', '/plugins'),
+        ('google.com', '/recaptcha/'),
+        ('youtube.com', '/['),
+    )
+    # Not allowed paths of a netloc, the path is compared with ==
+    blacklist_path_same = (
+        ('player.vimeo.com', '/video/'),
+        ('youtube.com', '/embed/'),
+    )
     # END - _make_url_list
 
+    # _http_pool_size, concurrent resolutions of one session
+    _pool_size_lock = threading.Lock()
+    # --generic-max-bytes and --generic-early-stop
+    _stream_chunk_size = 64 * 1024
+    # a playlist URL between two chunks is found, if it is shorter than this
+    _stream_overlap = 4 * 1024
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.url = update_scheme('http://', self.match.group('url'), force=False)
         self.html_text = ''
-
-        # START - cache every used url and set a referer
-        if hasattr(GenericCache, 'cache_url_list'):
-            GenericCache.cache_url_list += [self.url]
-            # set the last url as a referer
-            self.referer = GenericCache.cache_url_list[-2]
-        else:
-            GenericCache.cache_url_list = [self.url]
-            self.referer = self.url
-        self.session.http.headers.update({'Referer': self.referer})
+        # (html_text, candidates) of _extracted
+        self._extract_cache = None
+        # id of an unpacked text -> (unpacked text, --generic-unpack-cache-size key)
+        self._unpack_digests: Dict[int, Tuple[str, str]] = {}
+
+        # START - use the context of the previous website
+        # or start a new one, cache every used url and set a referer
+        context = GenericContext.current()
+        self._context_owner = context is None
+        self.context = context or GenericContext()
+        self.context.add(self.url)
+        # set the last url as a referer,
+        # it is only used for the requests of this plugin
+        self.referer = self.context.referer
         # END
 
         # START - how often _get_streams already run
-        self._run = len(GenericCache.cache_url_list)
+        self._run = self.context.hops
         # END
 
     def compare_url_path(self, parsed_url, check_list,
@@ -524,128 +1659,53 @@ class Generic(Plugin):
         return status
 
     def merge_path_list(self, static, user):
-        for _path_url in user:
-            if not _path_url.startswith(('http', '//')):
-                _path_url = update_scheme('http://', _path_url, force=False)
-            _parsed_path_url = urlparse(_path_url)
-            if _parsed_path_url.netloc and _parsed_path_url.path:
-                static += [(_parsed_path_url.netloc, _parsed_path_url.path)]
+        static += parse_path_list(user)
         return static
 
     def repair_url(self, url, base_url, stream_base=''):
-        # remove \
-        new_url = url.replace('\\', '')
-        # repairs broken scheme
-        if new_url.startswith('http&#58;//'):
-            new_url = 'http:' + new_url[9:]
-        elif new_url.startswith('https&#58;//'):
-            new_url = 'https:' + new_url[10:]
-        new_url = unquote(new_url)
-        # creates a valid url from path only urls
-        # and adds missing scheme for // urls
-        if stream_base and new_url[1] != '/':
-            if new_url[0] == '/':
-                new_url = new_url[1:]
-            new_url = urljoin(stream_base, new_url)
-        else:
-            new_url = urljoin(base_url, new_url)
-        return new_url
-
-    def _make_url_list(self, old_list, base_url, url_type=''):
-        # START - List for not allowed URL Paths
-        # --generic-blacklist-path
-        if not hasattr(GenericCache, 'blacklist_path'):
-
-            # static list
-            blacklist_path = [
-                ('facebook.com', '/connect'),
-                ('facebook.com', '/plugins'),
-                ('google.com', '/recaptcha/'),
-                ('youtube.com', '/['),
-            ]
-
-            # merge user and static list
-            blacklist_path_user = self.get_option('blacklist_path')
-            if blacklist_path_user is not None:
-                blacklist_path = self.merge_path_list(
-                    blacklist_path, blacklist_path_user)
-
-            GenericCache.blacklist_path = blacklist_path
-        # END
-
-        blacklist_path_same = [
-            ('player.vimeo.com', '/video/'),
-            ('youtube.com', '/embed/'),
-        ]
-
-        # START - List of only allowed URL Paths for Iframes
-        # --generic-whitelist-path
-        if not hasattr(GenericCache, 'whitelist_path'):
-            whitelist_path = []
-            whitelist_path_user = self.get_option('whitelist_path')
-            if whitelist_path_user is not None:
-                whitelist_path = self.merge_path_list(
-                    [], whitelist_path_user)
-            GenericCache.whitelist_path = whitelist_path
-        # END
+        return repair_url(url, base_url, stream_base)
+
+    def _url_filter(self) -> GenericURLFilter:
+        return GenericURLFilter.compile(
+            static_netloc=self.blacklist_netloc,
+            static_path=self.blacklist_path,
+            static_path_same=self.blacklist_path_same,
+            static_endswith=self.blacklist_endswith,
+            ads_path_re=self._ads_path_re,
+            blacklist_netloc=tuple(self.get_option('blacklist_netloc') or ()),
+            blacklist_path=tuple(self.get_option('blacklist_path') or ()),
+            blacklist_filepath=tuple(self.get_option('blacklist_filepath') or ()),
+            whitelist_netloc=tuple(self.get_option('whitelist_netloc') or ()),
+            whitelist_path=tuple(self.get_option('whitelist_path') or ()),
+        )
 
+    @stats_stage('make_url_list')
+    def _make_url_list(self, old_list, base_url, url_type='', stats=True):
+        '''Repairs, filters and sorts URLs, `stats` counts them for --generic-stats-file'''
+        url_filter = self._url_filter()
         allow_same_url = (self.get_option('ignore_same_url'))
 
         new_list = []
-        for url in old_list:
-            new_url = self.repair_url(url, base_url)
-            # parse the url
-            parse_new_url = urlparse(new_url)
+        removed = Counter()
+        # the same raw URL is only checked once
+        for url in dict.fromkeys(old_list):
+            new_url = repair_url(url, base_url)
+            parse_new_url = new_url.parsed
 
             # START
-            REMOVE = False
-            if new_url in GenericCache.cache_url_list and not allow_same_url:
+            if new_url in self.context and not allow_same_url:
                 # Removes an already used url
                 # ignored if --hls-session-reload is used
                 REMOVE = 'SAME-URL'
-            elif (not parse_new_url.scheme.startswith(('http'))):
-                # Allow only an url with a valid scheme
-                REMOVE = 'SCHEME'
-            elif (url_type == 'iframe'
-                    and self.get_option('whitelist_netloc')
-                    and parse_new_url.netloc.endswith(tuple(self.get_option('whitelist_netloc'))) is False):
-                # Allow only whitelisted domains for iFrames
-                # --generic-whitelist-netloc
-                REMOVE = 'WL-netloc'
-            elif (url_type == 'iframe'
-                    and GenericCache.whitelist_path
-                    and self.compare_url_path(parse_new_url, GenericCache.whitelist_path) is False):
-                # Allow only whitelisted paths from a domain for iFrames
-                # --generic-whitelist-path
-                REMOVE = 'WL-path'
-            elif (parse_new_url.netloc.endswith(self.blacklist_netloc)):
-                # Removes blacklisted domains from a static list
-                # self.blacklist_netloc
-                REMOVE = 'BL-static'
-            elif (self.get_option('blacklist_netloc')
-                  and parse_new_url.netloc.endswith(tuple(self.get_option('blacklist_netloc')))):
-                # Removes blacklisted domains
-                # --generic-blacklist-netloc
-                REMOVE = 'BL-netloc'
-            elif (self.compare_url_path(parse_new_url, GenericCache.blacklist_path) is True):
-                # Removes blacklisted paths from a domain
-                # --generic-blacklist-path
-                REMOVE = 'BL-path'
-            elif (parse_new_url.path.endswith(self.blacklist_endswith)):
-                # Removes unwanted endswith images and chatrooms
-                REMOVE = 'BL-ew'
-            elif (self.get_option('blacklist_filepath')
-                  and parse_new_url.path.endswith(tuple(self.get_option('blacklist_filepath')))):
-                # Removes blacklisted file paths
-                # --generic-blacklist-filepath
-                REMOVE = 'BL-filepath'
-            elif (self._ads_path_re.search(parse_new_url.path) or parse_new_url.netloc.startswith(('ads.'))):
-                # Removes obviously AD URL
-                REMOVE = 'ADS'
-            elif (self.compare_url_path(parse_new_url, blacklist_path_same, path_status='==') is True):
-                # Removes blacklisted same paths from a domain
-                REMOVE = 'BL-path-same'
-            elif parse_new_url.netloc == 'cdn.embedly.com' and parse_new_url.path == '/widgets/media.html':
+            else:
+                # --generic-blacklist-* and --generic-whitelist-*
+                REMOVE = url_filter.check(parse_new_url, url_type)
+            if REMOVE:
+                log.debug('{0} - Removed: {1}'.format(REMOVE, new_url))
+                removed[REMOVE] += 1
+                continue
+
+            if parse_new_url.netloc == 'cdn.embedly.com' and parse_new_url.path == '/widgets/media.html':
                 # do not use the direct URL for 'cdn.embedly.com', search the query for a new URL
                 params = dict(parse_qsl(parse_new_url.query))
                 embedly_new_url = params.get('url') or params.get('src')
@@ -654,117 +1714,461 @@ class Generic(Plugin):
                 else:
                     log.error('Missing params URL or SRC for {0}'.format(new_url))
                 continue
-            else:
-                # valid URL
-                new_list += [new_url]
-                continue
 
-            log.debug('{0} - Removed: {1}'.format(REMOVE, new_url))
+            # valid URL
+            new_list += [new_url]
             # END
 
-        # Remove duplicates
+        # Remove duplicates, the first URL is used
         log.debug('List length: {0} (with duplicates)'.format(len(new_list)))
-        new_list = sorted(list(set(new_list)))
+        new_list = list(dict.fromkeys(new_list))
+        if url_type == 'playlist':
+            new_list = self._rank_playlists(new_list, base_url)
+        if stats:
+            self.context.stats.add_candidates(url_type, len(old_list), len(new_list), removed)
         return new_list
 
+    def _rank_playlists(self, playlist_list, base_url):
+        '''Sorts playlist URLs, the best playlist is used first
+
+           1. no ad, preview, trailer or thumbnail URL
+           2. HLS master, HLS, DASH, HTTP
+           3. same domain as the website
+           URLs with the same rank stay in the order of the website.
+        '''
+        base_domain = site_domain(urlparse(base_url).hostname or '')
+
+        def rank(url):
+            parsed_url = getattr(url, 'parsed', None) or urlparse(url)
+            playlist_type = self._playlist_type(parsed_url)
+            if playlist_type == 'hls':
+                type_rank = 0 if self._playlist_master_re.search(url) else 1
+            else:
+                type_rank = {'dash': 2, 'http': 3}.get(playlist_type, 4)
+            host = parsed_url.hostname or ''
+            return (
+                bool(self._playlist_unwanted_re.search(parsed_url.path)),
+                type_rank,
+                not (host == base_domain or host.endswith('.' + base_domain)),
+            )
+
+        return sorted(playlist_list, key=rank)
+
     def _window_location(self):
-        match = self._window_location_re.search(self.html_text)
-        if match:
-            temp_url = urljoin(self.url, match.group('url'))
-            if temp_url not in GenericCache.cache_url_list:
+        redirect_list = self._extracted('redirect')
+        if redirect_list:
+            temp_url = urljoin(self.url, redirect_list[0])
+            if temp_url not in self.context:
                 log.debug('Found window_location: {0}'.format(temp_url))
                 return temp_url
 
         log.trace('No window_location')
         return False
 
-    def _resolve_playlist(self, playlist_all):
-        playlist_referer = self.get_option('playlist_referer') or self.url
-        self.session.http.headers.update({'Referer': playlist_referer})
+    @stats_stage('extract')
+    def _extract(self, text, kinds=None, url=None) -> List[ExtractCandidate]:
+        '''Finds playlists, iframes, redirects, titles and og:titles in one pass
+
+           Only the positions of _extract_lead_re are tested with the
+           patterns, the values are the same as findall() of every pattern.
+           Use `kinds` to find only some of them.
+
+           Without --generic-extract-timeout the playlists of a website with
+           many file extensions are found with _playlist_re.finditer(),
+           unless an URL of the website has many "=".
+
+           With --generic-extract-timeout every match is limited to
+           _extract_window characters, after the timeout the rest of
+           `text` is searched with _extract_tokens.
+
+           A failed match stops the search for the next iframes
+           or for the next "=" in the same URL, they would fail too.
+        '''
+        patterns = {
+            'iframe': self._iframe_re,
+            'og:title': self._og_title_re,
+            'playlist': self._playlist_re,
+            'redirect': self._window_location_re,
+            'title': self._title_re,
+        }
+        timeout = self.get_option('extract_timeout')
+        deadline = time.monotonic() + timeout if timeout else None
+        # end of the last match of every pattern, matches don't overlap
+        next_pos = dict.fromkeys(patterns, 0)
+        candidates = []
+        # playlist URLs, start of the current URL and the position
+        # until which the URL was already used
+        url_start = -1
+        url_checked = 0
+        # a failed match after "=" fails for every "=" after it in the same URL
+        url_failed = False
+        # a failed iframe match fails for every iframe after it
+        iframe_failed = False
+        lead_re = self._extract_lead_re
+        if kinds and 'playlist' not in kinds:
+            lead_re = self._extract_tag_lead_re
+        elif (not deadline
+              and text.count('.m') * self._extract_playlist_density > len(text)
+              and not self._extract_many_equals_re.search(text)):
+            lead_re = self._extract_tag_lead_re
+            candidates += [
+                ExtractCandidate('playlist', m.group(1), m.start(), m.end())
+                for m in self._playlist_re.finditer(text)
+            ]
+        for lead in lead_re.finditer(text):
+            if deadline and time.monotonic() > deadline:
+                log.warning('Extract timeout after {0}s, using a faster search - {1}'.format(
+                    timeout, url or self.url))
+                candidates += [
+                    candidate for candidate in self._extract_tokens(text, lead.start(), kinds)
+                    if candidate.start >= next_pos[candidate.kind]
+                ]
+                break
+
+            token = lead.group()
+            kind = 'playlist' if token[0] == '.' else self._extract_lead_kinds[token.lower()]
+            if kinds and kind not in kinds:
+                continue
+            if kind == 'iframe' and iframe_failed:
+                continue
+            if kind != 'playlist':
+                starts = (lead.start(),)
+            else:
+                # the playlist pattern starts at a quote or &quot; before the URL
+                # or at every = in the URL before the file extension
+                pos = lead.start()
+                start = pos
+                while start > url_checked and not self._extract_url_stop_char(text[start - 1]):
+                    start -= 1
+                starts = []
+                if start == url_checked and url_start >= 0:
+                    start = url_checked
+                else:
+                    url_start = start
+                    url_failed = False
+                    if start > 0 and text[start - 1] in '"\'':
+                        starts.append(start - 1)
+                    elif start >= 6 and text.startswith('&quot;', start - 6):
+                        starts.append(start - 6)
+                if not url_failed:
+                    equals = text.find('=', start, pos)
+                    while equals >= 0:
+                        starts.append(equals)
+                        equals = text.find('=', equals + 1, pos)
+                url_checked = pos
+
+            for start in starts:
+                if start < next_pos[kind]:
+                    continue
+                if deadline:
+                    m = patterns[kind].match(text, start, start + self._extract_window)
+                else:
+                    m = patterns[kind].match(text, start)
+                if m:
+                    candidates.append(ExtractCandidate(kind, m.group(1), start, m.end()))
+                    next_pos[kind] = m.end()
+                elif kind == 'playlist' and text[start] == '=':
+                    url_failed = True
+                    break
+                elif kind == 'iframe' and self._extract_iframe_head_re.match(text, start):
+                    iframe_failed = True
+
+        candidates.sort(key=lambda candidate: candidate.start)
+        return candidates
+
+    def _extract_tokens(self, text, pos=0, kinds=None) -> List[ExtractCandidate]:
+        '''Linear time search for iframes and playlist URLs,
+           used by _extract after --generic-extract-timeout
+
+           The results are similar to _extract, but not always the same.
+        '''
+        candidates = []
+        if not kinds or 'iframe' in kinds:
+            for m in self._token_iframe_re.finditer(text, pos):
+                src = self._token_src_re.search(m.group())
+                if src:
+                    candidates.append(ExtractCandidate('iframe', src.group('url'), m.start(), m.end()))
+
+        if not kinds or 'playlist' in kinds:
+            url_end = pos
+            for lead in self._token_playlist_re.finditer(text, pos):
+                if lead.start() < url_end:
+                    continue
+                url_end = self._token_url_re.match(text, lead.end()).end()
+                start = lead.start()
+                while start > pos and not self._extract_url_stop_char(text[start - 1]):
+                    start -= 1
+                if start > 0 and text[start - 1] in '"\'' or start >= 6 and text.startswith('&quot;', start - 6):
+                    if text.endswith(('title=', 'title":', "title':"), 0, start - 1):
+                        continue
+                else:
+                    equals = text.find('=', start, lead.start())
+                    if equals < 0:
+                        continue
+                    start = equals + 1
+                # the URL ends with the file extension and an optional query
+                end = lead.end()
+                if text.startswith('?', end):
+                    end = text.find('\\', end, url_end)
+                    end = url_end if end < 0 else end
+                if text.startswith('/', end):
+                    end += 1
+                    playlist_url = text[start:end - 1]
+                else:
+                    playlist_url = text[start:end]
+                if not (end < len(text) and (text[end] in '"\'>' or text[end].isspace())
+                        or text.startswith(('\\"', "\\'", '\\&quot;'), end)):
+                    continue
+                candidates.append(ExtractCandidate('playlist', playlist_url, start, end))
+
+        candidates.sort(key=lambda candidate: candidate.start)
+        return candidates
+
+    def _extract_url_stop_char(self, char):
+        return char in self._extract_url_stop or char.isspace()
+
+    def _extract_cached(self, text, kinds=None, url=None) -> List[ExtractCandidate]:
+        '''_extract() of a text of _unpack(), the candidates of an
+           identical website are reused with --generic-unpack-cache-size'''
+        cache = self._unpack_cache()
+        key = self._unpack_digests.get(id(text))
+        # the results of --generic-extract-timeout depend on the time
+        if cache is None or key is None or key[0] is not text or self.get_option('extract_timeout'):
+            return self._extract(text, kinds=kinds, url=url)
+        digest = key[1]
+        entry = cache.get(digest)
+        if entry is not None and entry.candidates is not None:
+            log.debug('Unpack cache: {0} (candidates)'.format(url or self.url))
+            candidates = entry.candidates
+        else:
+            candidates = self._extract(text, url=url)
+            cache.set(digest, UnpackCacheEntry(text, candidates))
+        if kinds:
+            return [candidate for candidate in candidates if candidate.kind in kinds]
+        return candidates
+
+    def _extracted(self, kind):
+        '''Returns the values of `kind` in self.html_text'''
+        if self._extract_cache is None or self._extract_cache[0] is not self.html_text:
+            self._extract_cache = (self.html_text, self._extract_cached(self.html_text, url=self.url))
+        return [candidate.value for candidate in self._extract_cache[1] if candidate.kind == kind]
+
+    def _playlist_candidates(self, playlist_all, page_url=None):
+        '''Returns (url, playlist_type, headers) of the valid playlist URLs'''
+        page_url = page_url or self.url
+        playlist_referer = self.get_option('playlist_referer') or page_url
+        playlist_headers = {'Referer': playlist_referer}
+
+        o = urlparse(page_url)
+        origin_tuple = (
+            '.cloudfront.net',
+        )
+        origin_headers = dict(playlist_headers, Origin='{0}://{1}'.format(o.scheme, o.netloc))
+
+        playlist_candidates = []
+        for url in playlist_all:
+            parsed_url = getattr(url, 'parsed', None) or urlparse(url)
+            playlist_type = self._playlist_type(parsed_url)
+            if playlist_type is None:
+                log.error('parsed URL - {0}'.format(url))
+                continue
+            if parsed_url.netloc.endswith(origin_tuple):
+                playlist_candidates.append((url, playlist_type, origin_headers))
+            else:
+                playlist_candidates.append((url, playlist_type, playlist_headers))
+        return playlist_candidates
+
+    def _resolve_playlist(self, playlist_all, page_url=None):
+        '''Returns the streams of the playlist URLs, see _aresolve_playlist'''
+        return self._run_async(self._aresolve_playlist(playlist_all, page_url=page_url))
 
+    async def _aresolve_playlist(self, playlist_all, page_url=None):
+        '''Opens up to --generic-playlist-workers playlists at the same time,
+           the streams are still used in the order of the playlist URLs'''
+        playlist_candidates = self._playlist_candidates(playlist_all, page_url=page_url)
         playlist_max = self.get_option('playlist_max') or 5
         count_playlist = {
             'dash': 0,
             'hls': 0,
             'http': 0,
         }
+        workers = self.get_option('playlist_workers') or 1
+        timeout = self.get_option('playlist_timeout')
 
-        o = urlparse(self.url)
-        origin_tuple = (
-            '.cloudfront.net',
-        )
-
-        for url in playlist_all:
-            parsed_url = urlparse(url)
-            if parsed_url.netloc.endswith(origin_tuple):
-                self.session.http.headers.update({
-                    'Origin': '{0}://{1}'.format(o.scheme, o.netloc),
-                })
+        stream_targets = set(self.get_option('stream_target') or ())
+        if self.get_option('first_match'):
+            stream_targets.add('best')
+        stream_names = set()
 
-            if (parsed_url.path.endswith(('.m3u8'))
-                    or parsed_url.query.endswith(('.m3u8'))):
-                if count_playlist['hls'] >= playlist_max:
+        all_streams = []
+        tasks = {}
+        next_index = 0
+        try:
+            for index, (url, playlist_type, headers) in enumerate(playlist_candidates):
+                # keep the next playlists loading,
+                # a playlist type that is already complete stays complete
+                while next_index < len(playlist_candidates) and next_index < index + workers:
+                    _url, _playlist_type, _headers = playlist_candidates[next_index]
+                    if count_playlist[_playlist_type] < playlist_max:
+                        tasks[next_index] = asyncio.ensure_future(asyncio.wait_for(
+                            _to_thread(self._probe_playlist, _url, _playlist_type, _headers),
+                            timeout,
+                        ))
+                    next_index += 1
+
+                if index not in tasks or count_playlist[playlist_type] >= playlist_max:
                     log.debug('Skip - {0}'.format(url))
                     continue
+
                 try:
-                    streams = HLSStream.parse_variant_playlist(self.session, url).items()
-                    if not streams:
-                        yield 'live', HLSStream(self.session, url)
-                    for s in streams:
-                        yield s
-                    log.debug('HLS URL - {0}'.format(url))
-                    count_playlist['hls'] += 1
-                except Exception as e:
-                    log.error('Skip HLS with error {0}'.format(str(e)))
-            elif (parsed_url.path.endswith(('.mp3', '.mp4'))
-                    or parsed_url.query.endswith(('.mp3', '.mp4'))):
-                if count_playlist['http'] >= playlist_max:
-                    log.debug('Skip - {0}'.format(url))
+                    streams = await tasks.pop(index)
+                except asyncio.TimeoutError:
+                    log.error('Skip {0} with error timeout after {1}s'.format(
+                        self._playlist_type_names[playlist_type], timeout))
                     continue
-                try:
-                    name = 'vod'
-                    m = self._httpstream_bitrate_re.search(url)
-                    if m:
-                        bitrate = m.group('bitrate')
-                        resolution = m.group('resolution')
-                        if bitrate:
-                            if bitrate in self._httpstream_common_resolution_list:
-                                name = '{0}p'.format(m.group('bitrate'))
-                            else:
-                                name = '{0}k'.format(m.group('bitrate'))
-                        elif resolution:
-                            name = resolution
-                    yield name, HTTPStream(self.session, url)
-                    log.debug('HTTP URL - {0}'.format(url))
-                    count_playlist['http'] += 1
                 except Exception as e:
-                    log.error('Skip HTTP with error {0}'.format(str(e)))
-            elif (parsed_url.path.endswith(('.mpd'))
-                    or parsed_url.query.endswith(('.mpd'))):
-                if count_playlist['dash'] >= playlist_max:
-                    log.debug('Skip - {0}'.format(url))
+                    log.error('Skip {0} with error {1}'.format(self._playlist_type_names[playlist_type], str(e)))
                     continue
-                try:
-                    for s in DASHStream.parse_manifest(self.session,
-                                                       url).items():
-                        yield s
-                    log.debug('DASH URL - {0}'.format(url))
-                    count_playlist['dash'] += 1
-                except Exception as e:
-                    log.error('Skip DASH with error {0}'.format(str(e)))
-            else:
-                log.error('parsed URL - {0}'.format(url))
 
-    def _res_text(self, url):
+                all_streams.extend(streams)
+                count_playlist[playlist_type] += 1
+                if stream_targets:
+                    stream_names.update(name for name, stream in streams)
+                    if self._stream_targets_found(stream_targets, stream_names):
+                        log.debug('Found streams: {0}, skip the other playlists'.format(
+                            ', '.join(sorted(stream_targets))))
+                        break
+        finally:
+            # a playlist that is still loading in its thread is not awaited
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+        return all_streams
+
+    def _stream_targets_found(self, stream_targets, stream_names):
+        if not stream_names:
+            return False
+        return all(name in ('best', 'worst') or name in stream_names
+                   for name in stream_targets)
+
+    def _playlist_type(self, parsed_url):
+        if (parsed_url.path.endswith(('.m3u8'))
+                or parsed_url.query.endswith(('.m3u8'))):
+            return 'hls'
+        elif (parsed_url.path.endswith(('.mp3', '.mp4'))
+                or parsed_url.query.endswith(('.mp3', '.mp4'))):
+            return 'http'
+        elif (parsed_url.path.endswith(('.mpd'))
+                or parsed_url.query.endswith(('.mpd'))):
+            return 'dash'
+        return None
+
+    @stats_stage('probe_playlist')
+    def _probe_playlist(self, url, playlist_type, headers=None):
+        '''Returns the streams of a playlist URL,
+           `headers` are used for the playlist and its streams'''
+        headers = dict(headers or {})
+        if playlist_type == 'hls':
+            streams = list(HLSStream.parse_variant_playlist(self.session, url, headers=headers).items())
+            if not streams:
+                streams = [('live', HLSStream(self.session, url, headers=headers))]
+            log.debug('HLS URL - {0}'.format(url))
+            return streams
+        elif playlist_type == 'http':
+            name = 'vod'
+            m = self._httpstream_bitrate_re.search(url)
+            if m:
+                bitrate = m.group('bitrate')
+                resolution = m.group('resolution')
+                if bitrate:
+                    if bitrate in self._httpstream_common_resolution_list:
+                        name = '{0}p'.format(m.group('bitrate'))
+                    else:
+                        name = '{0}k'.format(m.group('bitrate'))
+                elif resolution:
+                    name = resolution
+            log.debug('HTTP URL - {0}'.format(url))
+            return [(name, HTTPStream(self.session, url, headers=headers))]
+        elif playlist_type == 'dash':
+            streams = list(DASHStream.parse_manifest(self.session, url, headers=headers).items())
+            log.debug('DASH URL - {0}'.format(url))
+            return streams
+
+    _playlist_type_names = {
+        'dash': 'DASH',
+        'hls': 'HLS',
+        'http': 'HTTP',
+    }
+
+    def _request_headers(self, headers=None):
+        '''Headers of a request of this plugin, `headers` are used
+           instead of the default headers, the session headers are not changed'''
+        request_headers = {'Referer': self.referer} if self.referer else {}
+        request_headers.update(headers or {})
+        return request_headers
+
+    def _response_cache(self) -> Optional[GenericResponseCache]:
+        size = self.get_option('response_cache_size')
+        if not size:
+            return None
+        return GenericResponseCache.shared(
+            int(size * 1024 * 1024),
+            max_entries=self.get_option('response_cache_max') or 1000,
+        )
+
+    def _unpack_cache(self) -> Optional[GenericUnpackCache]:
+        size = self.get_option('unpack_cache_size')
+        if size is None:
+            size = UNPACK_CACHE_SIZE
+        if not size:
+            return None
+        path = self.get_option('unpack_cache_dir')
+        return GenericUnpackCache.shared(
+            int(size * 1024 * 1024),
+            max_entries=self.get_option('unpack_cache_max') or 1000,
+            path=os.path.expanduser(path) if path else None,
+        )
+
+    @stats_stage('unpack')
+    def _unpack(self, text, url=None):
+        '''Unpacks `text` of `url`, the unpacked text of an identical website is reused'''
+        cache = self._unpack_cache()
+        if cache is None:
+            return unpack(text)
+        digest = cache.digest(text)
+        entry = cache.get(digest)
+        if entry is None:
+            entry = UnpackCacheEntry(unpack(text))
+            cache.set(digest, entry)
+        else:
+            log.debug('Unpack cache: {0}'.format(url or self.url))
+        # _extract_cached uses the key of the unpacked text
+        self._unpack_digests[id(entry.unpacked)] = (entry.unpacked, digest)
+        return entry.unpacked
+
+    @stats_stage('res_text')
+    def _res_text(self, url, headers=None):
+        stream = bool(self.get_option('max_bytes') or self.get_option('early_stop'))
+        # --generic-max-bytes and --generic-early-stop don't read the whole website,
+        # a request with its own validators is handled by the caller
+        cache = None if stream else self._response_cache()
+        cached = None
+        if cache is not None and not any(name.lower() in ('if-none-match', 'if-modified-since') for name in headers or ()):
+            cached = cache.get(url)
+        headers = self._request_headers(headers)
+        request_url = url
+        if cached:
+            headers.update(cached.validators())
+            request_url = cached.url
         try:
-            res = self.session.http.get(url, allow_redirects=True)
+            res = self.session.http.get(request_url, headers=headers, allow_redirects=True, stream=stream)
         except Exception as e:
             if 'Received response with content-encoding: gzip' in str(e):
-                headers = {
+                headers = dict(headers, **{
                     'User-Agent': useragents.FIREFOX,
                     'Accept-Encoding': 'deflate'
-                }
-                res = self.session.http.get(url, headers=headers, allow_redirects=True)
+                })
+                res = self.session.http.get(request_url, headers=headers, allow_redirects=True, stream=stream)
             elif '403 Client Error' in str(e):
                 log.error('Website Access Denied/Forbidden, you might be geo-'
                           'blocked or other params are missing.')
@@ -779,7 +2183,223 @@ class Generic(Plugin):
             for resp in res.history:
                 log.debug('Redirect: {0} - {1}'.format(resp.status_code, resp.url))
             log.debug('URL: {0}'.format(res.url))
-        return res.text
+        if cached and res.status_code == 304:
+            log.debug('Response cache: {0} (not modified)'.format(url))
+            self.context.validators[url] = (cached.etag, cached.last_modified)
+            return ResText(cached.text, res.status_code)
+        etag, last_modified = res.headers.get('ETag'), res.headers.get('Last-Modified')
+        self.context.validators[url] = (etag, last_modified)
+        if stream:
+            return ResText(self._res_text_stream(res), res.status_code)
+        self.context.stats.add_bytes(len(res.content))
+        text = res.text
+        if cache is not None and res.status_code == 200 and (etag or last_modified):
+            # a temporary redirect is requested again
+            permanent = all(resp.status_code in (301, 308) for resp in res.history)
+            cache.set(url, ResponseCacheEntry(res.url if permanent else url, text, etag, last_modified))
+        elif cached:
+            cache.delete(url)
+        return ResText(text, res.status_code)
+
+    def _res_text_stream(self, res):
+        '''Read the website in chunks, until the end or until
+           --generic-max-bytes or --generic-early-stop is reached'''
+        max_bytes = self.get_option('max_bytes')
+        early_stop = self.get_option('early_stop')
+
+        try:
+            decoder = codecs.getincrementaldecoder(res.encoding or 'utf-8')(errors='replace')
+        except LookupError:
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+        text = []
+        size = 0
+        # end of the already searched text, for URLs between two chunks
+        tail = ''
+        try:
+            for chunk in res.iter_content(chunk_size=self._stream_chunk_size):
+                if max_bytes:
+                    chunk = chunk[:max_bytes - size]
+                size += len(chunk)
+                text.append(decoder.decode(chunk))
+                if max_bytes and size >= max_bytes:
+                    log.debug('Stop reading after {0} bytes (max-bytes)'.format(size))
+                    # without a character that is split at max-bytes
+                    return ''.join(text)
+                if early_stop:
+                    window = tail + text[-1]
+                    if self._early_stop_playlists(window):
+                        log.debug('Stop reading after {0} bytes (early-stop)'.format(size))
+                        break
+                    tail = window[-self._stream_overlap:]
+            text.append(decoder.decode(b'', final=True))
+        finally:
+            res.close()
+            self.context.stats.add_bytes(size)
+        return ''.join(text)
+
+    def _early_stop_playlists(self, text):
+        playlist_all = [candidate.value for candidate in self._extract(text, kinds=('playlist',))]
+        if not playlist_all:
+            return False
+        # the whole website is searched again, it is counted once
+        return bool(self._make_url_list(playlist_all, self.url, url_type='playlist', stats=False))
+
+    async def _explore_iframes(self, iframe_list, cache=None):
+        '''Breadth-first search of the iframes, without asking for an iframe.
+
+           Every level is opened at the same time, the iframes with playlist
+           URLs are used first, then iframes of other plugins.
+           Returns the streams of the first working iframe or None.
+
+           The iframes to the working playlists are stored in `cache`.'''
+        max_depth = self.get_option('iframe_depth') or 3
+        fanout = self.get_option('iframe_fanout') or 5
+        # before the iframes are added to the context
+        chain = self._resolve_cache_chain()
+        # iframe URL -> the website of the iframe
+        parents = {}
+        level = [(url, self.url) for url in iframe_list[:fanout]]
+        for depth in range(1, max_depth + 1):
+            log.info('Explore iframes - level {0}: {1}'.format(depth, len(level)))
+            plugin_branches = []
+            page_branches = []
+            for url, referer in level:
+                parents.setdefault(url, referer)
+                self.context.add(url)
+                if self._explore_plugin(url):
+                    plugin_branches.append((url, referer))
+                else:
+                    page_branches.append((url, referer))
+
+            pages = [asyncio.ensure_future(_to_thread(self._explore_page, url, referer))
+                     for url, referer in page_branches]
+            try:
+                next_level = []
+                for (url, referer), page in zip(page_branches, pages):
+                    playlist_list, new_iframe_list = await page
+                    if playlist_list:
+                        log.info('Found Playlists: {0} (valid) - {1}'.format(len(playlist_list), url))
+                        streams = await self._aresolve_playlist(playlist_list, page_url=url)
+                        if streams:
+                            if cache:
+                                path = [url]
+                                while parents[path[-1]] != self.url:
+                                    path.append(parents[path[-1]])
+                                self._resolve_cache_store(cache, playlist_list, chain + path[::-1])
+                            return streams
+                    next_level.extend((new_url, url) for new_url in new_iframe_list)
+            finally:
+                await asyncio.gather(*pages, return_exceptions=True)
+
+            for url, referer in plugin_branches:
+                streams = await self._explore_plugin_streams(url, referer)
+                if streams:
+                    return streams
+
+            # the first website of an iframe is used as its referer
+            level = []
+            seen = set()
+            for url, referer in next_level:
+                if url in seen or url in self.context:
+                    continue
+                seen.add(url)
+                level.append((url, referer))
+                if len(level) >= fanout:
+                    break
+            if not level:
+                break
+        return None
+
+    def _explore_plugin(self, url):
+        '''Returns True if another plugin than Generic is used for this URL'''
+        try:
+            pluginclass = self.session.resolve_url(url, follow_redirect=False)[1]
+        except NoPluginError:
+            return False
+        return not issubclass(pluginclass, Generic)
+
+    def _explore_page(self, url, referer):
+        '''Returns the valid playlist and iframe URLs of an iframe'''
+        try:
+            html_text = self._unpack(self._res_text(url, headers={'Referer': referer}).text, url)
+        except Exception as e:
+            log.error('Skip iframe {0} with error {1}'.format(url, str(e)))
+            return [], []
+        candidates = self._extract_cached(html_text, kinds=('playlist', 'iframe'), url=url)
+        playlist_all = [candidate.value for candidate in candidates if candidate.kind == 'playlist']
+        iframe_list = [candidate.value for candidate in candidates if candidate.kind == 'iframe']
+        return (
+            self._make_url_list(playlist_all, url, url_type='playlist') if playlist_all else [],
+            self._make_url_list(iframe_list, url, url_type='iframe') if iframe_list else [],
+        )
+
+    async def _plugin_streams(self, url, referer):
+        '''Returns the streams of `url`, from Generic or another plugin'''
+        pluginname, pluginclass, resolved_url = await _to_thread(self.session.resolve_url, url)
+        if issubclass(pluginclass, Generic):
+            # Generic uses the context, the options and the event loop of this website
+            return await pluginclass(self.session, resolved_url, self.options).astreams()
+        plugin = pluginclass(self._referer_session(url, referer), resolved_url)
+        return await _to_thread(plugin.streams)
+
+    def _referer_session(self, url, referer):
+        '''A copy of the session for another plugin, which only uses the session headers
+
+           The copy has its own headers with the Referer, the connections,
+           cookies, options and plugins are shared with the session.
+           Concurrent resolutions do not overwrite the Referer of each other.'''
+        session = copy.copy(self.session)
+        # requests.Session.__getstate__ does not copy the attributes of HTTPSession
+        session.http = object.__new__(type(self.session.http))
+        session.http.__dict__.update(self.session.http.__dict__)
+        session.http.headers = self.session.http.headers.copy()
+        # the Dailymotion Plugin does not work with this Referer
+        if 'dailymotion.com' not in url:
+            session.http.headers['Referer'] = referer
+        return session
+
+    async def _explore_plugin_streams(self, url, referer):
+        try:
+            return await self._plugin_streams(url, referer)
+        except Exception as e:
+            log.error('Skip iframe {0} with error {1}'.format(url, str(e)))
+            return None
+
+    def _resolve_cache(self):
+        cache_dir = self.get_option('cache_dir')
+        if not cache_dir:
+            return None
+        ttl = self.get_option('cache_ttl')
+        try:
+            return GenericResolveCache(
+                os.path.expanduser(cache_dir),
+                ttl=300 if ttl is None else ttl,
+                max_entries=self.get_option('cache_max') or 1000,
+            )
+        except (OSError, sqlite3.Error) as e:
+            log.warning('Cache disabled: {0}'.format(e))
+            return None
+
+    async def _resolve_cache_entry(self, cache, entry):
+        streams = await self._aresolve_playlist(entry.playlists, page_url=entry.page_url)
+        if not streams:
+            log.debug('Cache removed: {0}'.format(entry.url))
+            cache.delete(entry.url)
+        return streams
+
+    def _resolve_cache_chain(self):
+        '''The website URLs from the first URL to this website'''
+        chain = [url for url in dict.fromkeys(self.context.history) if url != self.url]
+        chain.append(self.url)
+        return chain
+
+    def _resolve_cache_store(self, cache, playlist_list, chain=None):
+        # every website of this iframe chain gets the same playlists
+        chain = chain or self._resolve_cache_chain()
+        for url in chain:
+            etag, last_modified = self.context.validators.get(url, (None, None))
+            cache.set(url, playlist_list, chain, etag, last_modified)
 
     def get_author(self):
         parsed = urlparse(self.url)
@@ -793,12 +2413,12 @@ class Generic(Plugin):
     def get_title(self):
         if self.title is None:
             if not self.html_text:
-                self.html_text = self._res_text(self.url)
-            _og_title_re = re.compile(r'<meta\s*property="og:title"\s*content="(?P<title>[^<>]+)"\s*/?>')
-            _title_re = re.compile(r'<title[^<>]*>(?P<title>[^<>]+)</title>')
-            m = _og_title_re.search(self.html_text) or _title_re.search(self.html_text)
-            if m:
-                self.title = re.sub(r'[\s]+', ' ', m.group('title'))
+                # streams of --generic-cache-dir or youtube-dl,
+                # an identical website was probably unpacked already
+                self.html_text = self._unpack(self._res_text(self.url).text, self.url)
+            title_list = self._extracted('og:title') or self._extracted('title')
+            if title_list:
+                self.title = re.sub(r'[\s]+', ' ', title_list[0])
                 self.title = re.sub(r'^\s*|\s*$', '', self.title)
                 self.title = html_unescape(self.title)
             if self.title is None:
@@ -806,8 +2426,14 @@ class Generic(Plugin):
                 self.title = self.url
         return self.title
 
+    @stats_stage('ytdl_fallback')
     def ytdl_fallback(self):
         '''Basic support for m3u8 URLs with youtube-dl'''
+        try:
+            youtube_dl = import_module(YTDL_MODULE)
+        except ImportError as e:
+            log.error(f'Fallback {YTDL_MODULE} is not available: {e}')
+            return
         log.debug(f'Fallback {youtube_dl.__name__} {youtube_dl.version.__version__}')
 
         class YTDL_Logger(object):
@@ -895,9 +2521,120 @@ class Generic(Plugin):
                                 ))
         return streams
 
+    def _http_pool_size(self):
+        '''--generic-pool-size, keep more connections per host open
+
+           New adapters with this pool size are mounted once for the session,
+           the old adapters are closed.'''
+        pool_size = self.get_option('pool_size')
+        if not pool_size:
+            return
+        with self._pool_size_lock:
+            # an adapter can be mounted for many prefixes
+            mounted = {}
+            for prefix, adapter in list(self.session.http.adapters.items()):
+                if not isinstance(adapter, HTTPAdapter):
+                    continue
+                pool_kw = adapter.poolmanager.connection_pool_kw
+                if pool_kw.get('maxsize') == pool_size:
+                    continue
+                if adapter not in mounted:
+                    log.debug('Pool size: {0} {1}'.format(prefix, pool_size))
+                    new_adapter = type(adapter)(pool_maxsize=pool_size, max_retries=adapter.max_retries)
+                    # e.g. source_address of --interface
+                    new_adapter.poolmanager.connection_pool_kw.update(
+                        (key, value) for key, value in pool_kw.items() if key != 'maxsize')
+                    mounted[adapter] = new_adapter
+                self.session.http.mount(prefix, mounted[adapter])
+            for adapter in mounted:
+                adapter.close()
+
+    @staticmethod
+    def _run_async(coro):
+        '''Runs `coro` in a new event loop and returns its result,
+           in a new thread if this thread already runs an event loop'''
+        def run():
+            loop = asyncio.new_event_loop()
+            try:
+                return loop.run_until_complete(coro)
+            finally:
+                # threads of a timeout are not awaited
+                loop.close()
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return run()
+        context = contextvars.copy_context()
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='generic-async') as executor:
+            return executor.submit(context.run, run).result()
+
     def _get_streams(self):
+        # Plugin.streams() of astreams() uses the task that already resolved the streams
+        resolved = _resolved_streams.get()
+        if resolved is not None and resolved[0] is self:
+            return resolved[1].result()
+        return self._run_async(self._aget_streams())
+
+    async def astreams(self, **params):
+        '''Async version of Plugin.streams(),
+           for an event loop that resolves many URLs at the same time.
+
+           The blocking requests of the session run in the default executor
+           of the event loop, its size limits the number of requests.'''
+        task = asyncio.ensure_future(self._aget_streams())
+        try:
+            await asyncio.wait([task])
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        # Plugin.streams() handles the errors and sorts the streams,
+        # which are already resolved
+        token = _resolved_streams.set((self, task))
+        try:
+            return self.streams(**params)
+        finally:
+            _resolved_streams.reset(token)
+
+    async def _aget_streams(self):
+        if not self._context_owner:
+            return await self._resolve_streams()
+        self._http_pool_size()
+        # websites opened by this resolution use the same context
+        error = None
+        with GenericContext.scope(self.context):
+            try:
+                return await self._resolve_streams()
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                self._emit_stats(error)
+
+    def _emit_stats(self, error=None):
+        '''--generic-stats-file and STATS_CALLBACKS'''
+        stats_file = self.get_option('stats_file')
+        if not stats_file and not STATS_CALLBACKS:
+            return
+        record = self.context.stats.record(
+            url=self.url,
+            hops=self.context.hops,
+            error='{0}: {1}'.format(type(error).__name__, error) if error else None,
+        )
+        for callback in STATS_CALLBACKS:
+            try:
+                callback(record)
+            except Exception as e:
+                log.error('Stats callback {0!r} failed: {1}'.format(callback, e))
+        if stats_file:
+            try:
+                GenericStats.write(os.path.expanduser(stats_file), record)
+            except OSError as e:
+                log.warning('Stats file: {0}'.format(e))
+
+    async def _resolve_streams(self):
         if HAS_YTDL and not self.get_option('ytdl-disable') and self.get_option('ytdl-only'):
-            ___streams = self.ytdl_fallback()
+            ___streams = await _to_thread(self.ytdl_fallback)
             if ___streams and len(___streams) >= 1:
                 return (s for s in ___streams)
             if self.get_option('ytdl-only'):
@@ -909,10 +2646,36 @@ class Generic(Plugin):
         new_url = False
         log.info('  {0}. URL={1}'.format(self._run, self.url))
 
+        # START - --generic-cache-dir
+        cache = self._resolve_cache()
+        entry = cache.get(self.url) if cache else None
+        if entry and entry.expires > time.time():
+            log.debug('Cache: {0}'.format(self.url))
+            streams = await self._resolve_cache_entry(cache, entry)
+            if streams:
+                return streams
+            entry = None
+        elif entry and not entry.validators():
+            cache.delete(self.url)
+            entry = None
+        # END
+
         # GET website content
-        self.html_text = self._res_text(self.url)
+        res_text = await _to_thread(
+            self._res_text, self.url, headers=entry.validators() if entry else None)
+        self.html_text = res_text.text
+        if entry:
+            if res_text.status == 304:
+                log.debug('Cache: {0} (not modified)'.format(self.url))
+                cache.refresh(self.url)
+                streams = await self._resolve_cache_entry(cache, entry)
+                if streams:
+                    return streams
+                self.html_text = (await _to_thread(self._res_text, self.url)).text
+            else:
+                cache.delete(self.url)
         # unpack common javascript codes
-        self.html_text = unpack(self.html_text)
+        self.html_text = await _to_thread(self._unpack, self.html_text, self.url)
 
         if self.get_option('debug'):
             _valid_filepath = re.sub(r'(?u)[^-\w.]', '', str(self.url).strip().replace(' ', '_'))
@@ -926,7 +2689,7 @@ class Generic(Plugin):
                 pass
 
         # Playlist URL
-        playlist_all = self._playlist_re.findall(self.html_text)
+        playlist_all = await _to_thread(self._extracted, 'playlist')
         if playlist_all:
             log.debug('Found Playlists: {0}'.format(len(playlist_all)))
             playlist_list = self._make_url_list(playlist_all,
@@ -936,19 +2699,25 @@ class Generic(Plugin):
             if playlist_list:
                 log.info('Found Playlists: {0} (valid)'.format(
                     len(playlist_list)))
-                return self._resolve_playlist(playlist_list)
+                if cache:
+                    self._resolve_cache_store(cache, playlist_list)
+                return await self._aresolve_playlist(playlist_list)
         else:
             log.trace('No Playlists')
 
         # iFrame URL
-        iframe_list = self._iframe_re.findall(self.html_text)
+        iframe_list = self._extracted('iframe')
         if iframe_list:
             log.debug('Found Iframes: {0}'.format(len(iframe_list)))
             # repair and filter iframe url list
             new_iframe_list = self._make_url_list(iframe_list,
                                                   self.url,
                                                   url_type='iframe')
-            if new_iframe_list:
+            if new_iframe_list and self.get_option('iframe_explore'):
+                streams = await self._explore_iframes(new_iframe_list, cache)
+                if streams:
+                    return streams
+            elif new_iframe_list:
                 number_iframes = len(new_iframe_list)
                 if number_iframes == 1:
                     new_url = new_iframe_list[0]
@@ -959,8 +2728,8 @@ class Generic(Plugin):
                     log.info('--- IFRAMES ---')
 
                     try:
-                        number = int(self.input_ask(
-                            'Choose an iframe number from above').split(' ')[0])
+                        number = int((await _to_thread(
+                            self.input_ask, 'Choose an iframe number from above')).split(' ')[0])
                         new_url = new_iframe_list[number - 1]
                     except FatalPluginError:
                         new_url = new_iframe_list[0]
@@ -979,17 +2748,100 @@ class Generic(Plugin):
             new_url = self._window_location()
 
         if new_url:
-            # the Dailymotion Plugin does not work with this Referer
-            if 'dailymotion.com' in new_url:
-                del self.session.http.headers['Referer']
-            return self.session.streams(new_url)
+            return await self._plugin_streams(new_url, self.url)
 
         if HAS_YTDL and not self.get_option('ytdl-disable') and not self.get_option('ytdl-only'):
-            ___streams = self.ytdl_fallback()
+            ___streams = await _to_thread(self.ytdl_fallback)
             if ___streams and len(___streams) >= 1:
                 return (s for s in ___streams)
 
         raise NoPluginError
 
 
+def _stream_info(stream):
+    try:
+        url = stream.to_url()
+    except TypeError:
+        url = None
+    return {'type': stream.shortname(), 'url': url}
+
+
+def bulk_resolve(urls, session=None, options=None, workers=4):
+    '''Resolves many website URLs in one process,
+       returns a result dict per URL in the order of `urls`.
+
+       The session with its connection pools, the compiled URL filters
+       and --generic-cache-dir are shared, every URL has its own GenericContext.
+
+       A result has the streams, the error, the elapsed time
+       and the GenericStats record of its URL.
+    '''
+    if session is None:
+        session = Streamlink()
+        session.plugins.update({'generic': Generic})
+    options = options or Options()
+
+    def resolve(url):
+        started = time.monotonic()
+        result = {'url': url, 'streams': {}, 'error': None}
+        plugin = Generic(session, 'generic://' + url, options)
+        try:
+            streams = plugin.streams()
+            result['streams'] = {name: _stream_info(stream) for name, stream in streams.items()}
+        except Exception as e:
+            result['error'] = '{0}: {1}'.format(type(e).__name__, e)
+        result['elapsed'] = round(time.monotonic() - started, 3)
+        result['stats'] = plugin.context.stats.record(hops=plugin.context.hops)
+        return result
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='generic-bulk') as executor:
+        yield from executor.map(resolve, urls)
+
+
+def _read_urls(files):
+    for filename in files:
+        f = sys.stdin if filename == '-' else open(filename)
+        try:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    yield line
+        finally:
+            if f is not sys.stdin:
+                f.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='generic',
+        description='Resolve the streams of many website URLs, one JSON line per URL.',
+    )
+    parser.add_argument('files', nargs='*', default=['-'], metavar='FILE',
+                        help='file with one URL per line, - reads from stdin (default)')
+    parser.add_argument('--workers', type=num(int, ge=1, le=100), default=4, metavar='NUMBER',
+                        help='number of URLs that are resolved at the same time (default: 4)')
+    parser.add_argument('--cache-dir', metavar='PATH',
+                        help='same as --generic-cache-dir')
+    parser.add_argument('--response-cache-size', type=num(float, ge=0), default=0, metavar='MEGABYTES',
+                        help='same as --generic-response-cache-size')
+    parser.add_argument('--ytdl-disable', action='store_true',
+                        help='same as --generic-ytdl-disable')
+    parser.add_argument('--loglevel', default='warning', choices=('error', 'warning', 'info', 'debug'))
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(stream=sys.stderr, level=args.loglevel.upper())
+    options = Options({
+        'cache_dir': args.cache_dir,
+        'response_cache_size': args.response_cache_size,
+        'ytdl_disable': args.ytdl_disable,
+    })
+    for result in bulk_resolve(list(_read_urls(args.files)), options=options, workers=args.workers):
+        sys.stdout.write(json.dumps(result) + '\n')
+        sys.stdout.flush()
+    return 0
+
+
 __plugin__ = Generic
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,52 @@
+import os.path
+import sys
+import unittest
+
+from unittest.mock import patch
+
+import requests_mock
+
+from streamlink import Streamlink
+from streamlink.options import Options
+
+sys.path.insert(0, os.path.abspath('..'))
+from plugins.generic import Generic, GenericResponseCache, GenericUnpackCache  # noqa
+
+
+def text_master_hls(bandwidth=640000):
+    return """#EXTM3U
+#EXT-X-VERSION:3
+#EXT-X-STREAM-INF:PROGRAM-ID=1,BANDWIDTH={0}
+index.m3u8
+""".format(bandwidth)
+
+
+# HLS master playlist with a 640k stream
+text_hls = text_master_hls()
+
+
+class PluginTestCase(unittest.TestCase):
+    '''Base class of the tests that resolve URLs with Generic
+
+       The requests of `self.session` are answered by `self.mocker`,
+       the caches of the process are new for every test.
+    '''
+    # options of every plugin of the test case
+    options = {'ytdl_disable': True}
+
+    def setUp(self):
+        self.session = Streamlink()
+        self.session.plugins.update({'generic': Generic})
+        for cache in (GenericResponseCache, GenericUnpackCache):
+            patcher = patch.object(cache, '_shared', None)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.mocker = requests_mock.Mocker()
+        self.mocker.start()
+        self.addCleanup(self.mocker.stop)
+
+    def plugin(self, url, **options):
+        return Generic(self.session, 'generic://' + url, Options(dict(self.options, **options)))
+
+    def streams(self, url, **options):
+        return dict(self.plugin(url, **options)._get_streams())
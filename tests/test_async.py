@@ -0,0 +1,75 @@
+import asyncio
+import os.path
+import sys
+import threading
+
+from unittest.mock import patch
+
+from streamlink.exceptions import NoPluginError
+
+sys.path.insert(0, os.path.abspath('..'))
+from plugins.generic import Generic, GenericContext  # noqa
+from tests.common import PluginTestCase, text_hls  # noqa
+
+
+class TestAsyncStreams(PluginTestCase):
+
+    def test_astreams(self):
+        self.mocker.get('http://mocked/page', text='<iframe src="http://mocked/iframe"></iframe>')
+        self.mocker.get('http://mocked/iframe', text='<video src="http://mocked/master.m3u8">')
+        self.mocker.get('http://mocked/master.m3u8', text=text_hls)
+
+        plugin = self.plugin('http://mocked/page')
+        streams = asyncio.run(plugin.astreams())
+        self.assertEqual(sorted(streams), ['640k', 'best', 'worst'])
+        self.assertEqual(list(plugin.context.history), ['http://mocked/page', 'http://mocked/iframe'])
+        self.assertIsNone(GenericContext.current())
+
+    def test_astreams_error(self):
+        self.mocker.get('http://mocked/page', text='<p>empty</p>')
+        plugin = self.plugin('http://mocked/page')
+        with self.assertRaises(NoPluginError):
+            asyncio.run(plugin.astreams())
+        # the sync API resolves the website again
+        self.mocker.get('http://mocked/page', text='<video src="http://mocked/master.m3u8">')
+        self.mocker.get('http://mocked/master.m3u8', text=text_hls)
+        self.assertEqual(sorted(plugin.streams()), ['640k', 'best', 'worst'])
+
+    def test_astreams_twice(self):
+        page = self.mocker.get('http://mocked/page', text='<video src="http://mocked/master.m3u8">')
+        self.mocker.get('http://mocked/master.m3u8', text=text_hls)
+
+        plugin = self.plugin('http://mocked/page')
+        for _ in range(2):
+            self.assertEqual(sorted(asyncio.run(plugin.astreams())), ['640k', 'best', 'worst'])
+        self.assertEqual(page.call_count, 2)
+
+    def test_concurrent(self):
+        # every website waits until all websites are resolved at the same time
+        barrier = threading.Barrier(4, timeout=5)
+
+        def probe(plugin, url, playlist_type, headers=None):
+            barrier.wait()
+            return [('live', None)]
+
+        urls = ['http://mocked/{0}'.format(i) for i in range(1, 5)]
+        for url in urls:
+            self.mocker.get(url, text='<video src="{0}/master.m3u8">'.format(url))
+
+        async def resolve():
+            return await asyncio.gather(*(self.plugin(url)._aget_streams() for url in urls))
+
+        with patch.object(Generic, '_probe_playlist', probe):
+            results = asyncio.run(resolve())
+        self.assertFalse(barrier.broken)
+        self.assertEqual(results, [[('live', None)]] * 4)
+
+    def test_sync_in_event_loop(self):
+        self.mocker.get('http://mocked/page', text='<video src="http://mocked/master.m3u8">')
+        self.mocker.get('http://mocked/master.m3u8', text=text_hls)
+
+        async def resolve():
+            # a plugin without astreams() can still use the sync API
+            return self.plugin('http://mocked/page')._get_streams()
+
+        self.assertEqual([name for name, stream in asyncio.run(resolve())], ['640k'])
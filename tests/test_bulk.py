@@ -0,0 +1,53 @@
+import io
+import json
+import os.path
+import sys
+import tempfile
+
+from contextlib import redirect_stdout
+
+from streamlink.options import Options
+
+sys.path.insert(0, os.path.abspath('..'))
+from plugins.generic import bulk_resolve, main  # noqa
+from tests.common import PluginTestCase, text_hls  # noqa
+
+
+class TestBulkResolve(PluginTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.mocker.get('http://mocked/1', text='<video src="http://mocked/1/master.m3u8">')
+        self.mocker.get('http://mocked/1/master.m3u8', text=text_hls)
+        self.mocker.get('http://mocked/2', text='<video src="http://mocked/2/video_720.mp4">')
+        self.mocker.get('http://mocked/3', text='<p>empty</p>')
+
+    def test_bulk_resolve(self):
+        urls = ['http://mocked/1', 'http://mocked/2', 'http://mocked/3']
+        results = list(bulk_resolve(urls, session=self.session, options=Options(self.options), workers=2))
+
+        self.assertEqual([result['url'] for result in results], urls)
+        self.assertEqual(results[0]['streams']['640k'],
+                         {'type': 'hls', 'url': 'http://mocked/1/index.m3u8'})
+        self.assertEqual(results[1]['streams']['720p'],
+                         {'type': 'http', 'url': 'http://mocked/2/video_720.mp4'})
+        self.assertIsNone(results[1]['error'])
+        self.assertEqual(results[2]['streams'], {})
+        self.assertEqual(results[2]['error'], 'NoPluginError: ')
+        for result in results:
+            self.assertGreaterEqual(result['elapsed'], 0)
+            self.assertEqual(result['stats']['hops'], 1)
+        self.assertEqual(results[0]['stats']['candidates']['playlist'], {'found': 1, 'valid': 1})
+
+    def test_main(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            f.write('# comment\nhttp://mocked/1\n\nhttp://mocked/3\n')
+        self.addCleanup(os.unlink, f.name)
+
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            self.assertEqual(main([f.name, '--ytdl-disable', '--workers', '2']), 0)
+        results = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual([result['url'] for result in results], ['http://mocked/1', 'http://mocked/3'])
+        self.assertIn('640k', results[0]['streams'])
+        self.assertIsNotNone(results[1]['error'])
@@ -0,0 +1,105 @@
+import os.path
+import sys
+import threading
+import unittest
+
+import requests_mock
+
+from streamlink import Streamlink
+from streamlink.exceptions import NoPluginError
+from streamlink.options import Options
+
+sys.path.insert(0, os.path.abspath('..'))
+from plugins.generic import Generic, GenericContext  # noqa
+
+
+class TestGenericContext(unittest.TestCase):
+
+    def test_add(self):
+        context = GenericContext()
+        self.assertIsNone(context.referer)
+        context.add('http://mocked/1')
+        self.assertEqual(context.referer, 'http://mocked/1')
+        context.add('http://mocked/2')
+        self.assertEqual(context.referer, 'http://mocked/1')
+        self.assertIn('http://mocked/1', context)
+        self.assertIn('http://mocked/2', context)
+        self.assertNotIn('http://mocked/3', context)
+        self.assertEqual(context.hops, 2)
+
+    def test_max_urls(self):
+        context = GenericContext(max_urls=3)
+        for url in ('http://mocked/1', 'http://mocked/2', 'http://mocked/1', 'http://mocked/3'):
+            context.add(url)
+            context.validators[url] = ('"etag"', None)
+        # the first http://mocked/1 is removed from the history, the second one is still there
+        self.assertIn('http://mocked/1', context)
+        context.add('http://mocked/4')
+        self.assertNotIn('http://mocked/2', context)
+        self.assertNotIn('http://mocked/2', context.validators)
+        self.assertEqual(list(context.history), ['http://mocked/1', 'http://mocked/3', 'http://mocked/4'])
+        self.assertEqual(context.hops, 5)
+
+    def test_reset(self):
+        context = GenericContext()
+        context.add('http://mocked/1')
+        context.validators['http://mocked/1'] = ('"etag"', None)
+        context.reset()
+        self.assertNotIn('http://mocked/1', context)
+        self.assertEqual(context.validators, {})
+        self.assertEqual(context.hops, 0)
+
+    def test_scope(self):
+        self.assertIsNone(GenericContext.current())
+        with GenericContext.scope() as context:
+            self.assertIs(GenericContext.current(), context)
+            with GenericContext.scope() as inner:
+                self.assertIs(GenericContext.current(), inner)
+            self.assertIs(GenericContext.current(), context)
+        self.assertIsNone(GenericContext.current())
+
+    def test_scope_thread(self):
+        result = []
+        with GenericContext.scope():
+            thread = threading.Thread(target=lambda: result.append(GenericContext.current()))
+            thread.start()
+            thread.join()
+        self.assertEqual(result, [None])
+
+
+class TestGenericContextPlugin(unittest.TestCase):
+
+    def setUp(self):
+        self.session = Streamlink()
+
+    def plugin(self, url):
+        return Generic(self.session, 'generic://' + url, Options({'ytdl_disable': True}))
+
+    def test_new_context(self):
+        plugin_1 = self.plugin('http://mocked/1')
+        plugin_2 = self.plugin('http://mocked/1')
+        self.assertIsNot(plugin_1.context, plugin_2.context)
+        self.assertEqual(plugin_2._run, 1)
+        self.assertEqual(plugin_2.referer, 'http://mocked/1')
+
+    def test_scope(self):
+        with GenericContext.scope() as context:
+            plugin_1 = self.plugin('http://mocked/1')
+            plugin_2 = self.plugin('http://mocked/2')
+        self.assertIs(plugin_1.context, context)
+        self.assertIs(plugin_2.context, context)
+        self.assertEqual(plugin_2._run, 2)
+        self.assertEqual(plugin_2.referer, 'http://mocked/1')
+
+    def test_iframe(self):
+        self.session.plugins.update({'generic': Generic})
+        with requests_mock.Mocker() as mock:
+            mock.get('http://mocked/page', text='<iframe src="http://mocked/iframe"></iframe>')
+            iframe = mock.get('http://mocked/iframe', text='<iframe src="http://mocked/page"></iframe>')
+            plugin = self.plugin('http://mocked/page')
+            with self.assertRaises(NoPluginError):
+                plugin._get_streams()
+            # the iframe uses the context of its website, the website is not opened again
+            self.assertEqual(iframe.call_count, 1)
+            self.assertEqual(list(plugin.context.history), ['http://mocked/page', 'http://mocked/iframe'])
+            self.assertIsNone(GenericContext.current())
@@ -0,0 +1,200 @@
+import itertools
+import os.path
+import sys
+import time
+import unittest
+
+from unittest.mock import patch
+
+from streamlink import Streamlink
+from streamlink.options import Options
+
+sys.path.insert(0, os.path.abspath('..'))
+from plugins.generic import ExtractCandidate, Generic  # noqa
+from tests.test_generic import (  # noqa
+    iframe_re_data,
+    iframe_re_false_data,
+    playlist_re_data,
+    playlist_re_false_data,
+    window_location_re_data,
+)
+
+
+def seconds(func, *args):
+    '''Best time of three runs of `func`'''
+    times = []
+    for _ in range(3):
+        started = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+class TestExtract(unittest.TestCase):
+    '''Generic._extract has to find the same values as the single patterns'''
+
+    def setUp(self):
+        self.plugin = Generic(Streamlink(), 'generic://https://example.com', Options())
+
+    def values(self, text, kind):
+        return [candidate.value for candidate in self.plugin._extract(text) if candidate.kind == kind]
+
+    def assertSameAsFindall(self, text):
+        for kind, pattern in (
+            ('iframe', self.plugin._iframe_re),
+            ('og:title', self.plugin._og_title_re),
+            ('playlist', self.plugin._playlist_re),
+            ('redirect', self.plugin._window_location_re),
+            ('title', self.plugin._title_re),
+        ):
+            self.assertEqual(self.values(text, kind), pattern.findall(text), kind)
+
+    def test_iframe(self):
+        for test_dict in iframe_re_data:
+            self.assertListEqual(sorted(test_dict['result']), sorted(self.values(test_dict['data'], 'iframe')))
+            self.assertSameAsFindall(test_dict['data'])
+
+    def test_iframe_false(self):
+        for data in iframe_re_false_data:
+            self.assertEqual(self.values(data, 'iframe'), [])
+
+    def test_playlist(self):
+        for test_dict in playlist_re_data:
+            self.assertEqual(self.values(test_dict['data'], 'playlist')[0], test_dict['result'])
+            self.assertSameAsFindall(test_dict['data'])
+
+    def test_playlist_false(self):
+        for data in playlist_re_false_data:
+            self.assertEqual(self.values(data, 'playlist'), [])
+
+    def test_redirect(self):
+        for test_dict in window_location_re_data:
+            self.assertEqual(self.values(test_dict['data'], 'redirect'), [test_dict['result']])
+
+    def test_all(self):
+        text = ''.join(
+            [test_dict['data'] for test_dict in iframe_re_data + playlist_re_data + window_location_re_data]
+            + iframe_re_false_data + playlist_re_false_data
+        )
+        self.assertSameAsFindall(text)
+
+    def test_candidates(self):
+        title = '<title>Title</title>'
+        og_title = '<meta property="og:title" content="OG Title" />'
+        iframe = '<iframe src="https://example.com/iframe">'
+        playlist = '"https://example.com/live.m3u8"'
+        text = title + og_title + iframe + '</iframe><video src=' + playlist + '>'
+        playlist_start = text.index(playlist)
+        self.assertEqual(self.plugin._extract(text), [
+            ExtractCandidate('title', 'Title', 0, len(title)),
+            ExtractCandidate('og:title', 'OG Title', len(title), len(title + og_title)),
+            ExtractCandidate('iframe', 'https://example.com/iframe', len(title + og_title), len(title + og_title + iframe)),
+            ExtractCandidate('playlist', 'https://example.com/live.m3u8', playlist_start, playlist_start + len(playlist)),
+        ])
+        self.assertEqual(self.plugin._extract(text, kinds=('playlist',)), [
+            ExtractCandidate('playlist', 'https://example.com/live.m3u8', playlist_start, playlist_start + len(playlist)),
+        ])
+
+    def test_playlist_search(self):
+        playlists = ''.join(test_dict['data'] for test_dict in playlist_re_data)
+        filler = '<p>{0}</p>'.format('x' * 1000)
+        many_equals = '<a href="/?{0}">'.format('&'.join('a{0}=b'.format(i) for i in range(20)))
+        for text in (
+            # _playlist_re.finditer()
+            playlists,
+            # the leads
+            filler + playlists + filler * 100,
+            playlists + many_equals,
+        ):
+            self.assertSameAsFindall(text)
+            self.assertEqual(self.values(text, 'playlist'),
+                             [c.value for c in self.plugin._extract(text, kinds=('playlist',))])
+
+    def test_playlist_delimiter(self):
+        for text in (
+            'a=1&b=https://example.com/live.m3u8 ',
+            'x = "a=b/c.mp4.mp4"',
+            '&quot;https://example.com/a.mpd&quot;',
+            '\\&quot;https://example.com/a.mpd\\&quot;',
+            'url="https://example.com/a.mp4?x=1;y=2" src=\'b.mp3\'',
+            'title="a.mp4" src="b.mp4"',
+        ):
+            self.assertSameAsFindall(text)
+
+
+class TestExtractPathological(unittest.TestCase):
+    '''Websites where the single patterns need quadratic time'''
+
+    corpus = (
+        # every <iframe searches the rest of the website for src=
+        lambda size: '<iframe name="x">' * (size // 17) + '<p>end</p>',
+        # every = is a possible start of a playlist URL
+        lambda size: 'a=' * (size // 2) + 'video.mp4{',
+        # every file extension is a possible end of a playlist URL
+        lambda size: '"' + 'a=.mp4' * (size // 6) + '{',
+    )
+
+    def setUp(self):
+        self.plugin = Generic(Streamlink(), 'generic://https://example.com', Options())
+
+    def test_same_as_findall(self):
+        for corpus in self.corpus:
+            text = corpus(2000) + '<iframe src="https://example.com/iframe"> "https://example.com/live.m3u8"'
+            candidates = self.plugin._extract(text)
+            for kind, pattern in (('iframe', self.plugin._iframe_re), ('playlist', self.plugin._playlist_re)):
+                self.assertEqual([c.value for c in candidates if c.kind == kind], pattern.findall(text))
+
+    def test_linear(self):
+        # 4 times the text needs about 4 times as long, not 16 times
+        for corpus in self.corpus:
+            small = seconds(self.plugin._extract, corpus(64 * 1024))
+            large = seconds(self.plugin._extract, corpus(256 * 1024))
+            self.assertLess(large, max(small, 0.001) * 10)
+
+
+class TestExtractTimeout(unittest.TestCase):
+
+    def setUp(self):
+        self.plugin = Generic(Streamlink(), 'generic://https://example.com', Options({'extract_timeout': 0.5}))
+
+    def test_timeout(self):
+        text = ('<iframe src="https://example.com/iframe"></iframe>'
+                '<video src="https://example.com/live.m3u8?token=1">'
+                '{"file":"https:\\/\\/example.com\\/vod.mp4\\"}')
+        with patch('time.monotonic', side_effect=itertools.count()):
+            with self.assertLogs('plugins.generic', level='WARNING') as cm:
+                candidates = self.plugin._extract(text, url='https://example.com/page')
+        self.assertEqual([r.getMessage() for r in cm.records], [
+            'Extract timeout after 0.5s, using a faster search - https://example.com/page',
+        ])
+        self.assertEqual([(c.kind, c.value) for c in candidates], [
+            ('iframe', 'https://example.com/iframe'),
+            ('playlist', 'https://example.com/live.m3u8?token=1'),
+            ('playlist', 'https:\\/\\/example.com\\/vod.mp4'),
+        ])
+
+    def test_no_timeout(self):
+        text = '<iframe src="https://example.com/iframe"></iframe>'
+        with patch('time.monotonic', return_value=0.0):
+            self.assertEqual(self.plugin._extract(text), [
+                ExtractCandidate('iframe', 'https://example.com/iframe', 0, len('<iframe src="https://example.com/iframe">')),
+            ])
+
+    def test_tokens(self):
+        for test_dict in playlist_re_data:
+            self.assertEqual(self.plugin._extract_tokens(test_dict['data'])[0].value, test_dict['result'])
+        for test_dict in iframe_re_data:
+            self.assertEqual(sorted(c.value for c in self.plugin._extract_tokens(test_dict['data'])),
+                             sorted(test_dict['result']))
+        for data in playlist_re_false_data + iframe_re_false_data:
+            self.assertEqual(self.plugin._extract_tokens(data), [])
+
+    def test_tokens_pathological(self):
+        def text(size):
+            return '=x.mp4?;' * size + '{'
+
+        self.assertEqual(self.plugin._extract_tokens(text(64 * 1024)), [])
+        # 4 times the text needs about 4 times as long, not 16 times
+        small = seconds(self.plugin._extract_tokens, text(8 * 1024))
+        large = seconds(self.plugin._extract_tokens, text(32 * 1024))
+        self.assertLess(large, max(small, 0.001) * 10)
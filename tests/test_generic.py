@@ -165,6 +165,312 @@ stream_data = {
 }
 
 
+iframe_re_data = [
+    {
+        "data": """
+                        <iframe src="http://local2.local">    </iframe>
+                        <iframe frameborder="0" src="http://local.local" width="650">iframe</iframe>""",
+        "result": ["http://local.local", "http://local2.local"]
+    },
+    {
+        "data": """<iframe src="http://local3.local" width="800px"></iframe>""",
+        "result": ["http://local3.local"]
+    },
+    {
+        "data": """<iframe height="600px" src="http://local4.local"></iframe>""",
+        "result": ["http://local4.local"]
+    },
+    {
+        "data": """<iframe height='600px' src='http://local5.local'></iframe>""",
+        "result": ["http://local5.local"]
+    },
+    {
+        "data": """</div>
+                        <script type="text/javascript">_satellite.pageBottom();</script>
+                        <iframe style="height:0px;width:0px;visibility:hidden" src="https://example.com/">
+                            this frame prevents back forward cache
+                            </iframe>
+                        </body>""",
+        "result": ["https://example.com/"]
+    },
+    {
+        "data": """
+                        <iframe src="https://example.com/123.php" width="720" height="500" allowtransparency="true"/>
+                        """,
+        "result": ["https://example.com/123.php"]
+    },
+    {
+        "data": """
+                        <script>
+                            document.write('<ifr' + 'ame id="video" src="https://example.com/123.php" height="500" ></ifr' + 'ame>');
+                        </script>
+                        """,
+        "result": ["https://example.com/123.php"]
+    },
+    {
+        "data": """
+                        <script>
+                            document.write('<ifr'+'ame id="video" src="https://example.com/123.php" height="500" ></ifr'+'ame>');
+                        </script>
+                        """,
+        "result": ["https://example.com/123.php"]
+    },
+    {
+        "data": """
+                        <iframe src="https://player.twitch.tv/?channel=monstercat" frameborder="0" allowfullscreen="true" scrolling="no" height="378" width="620"></iframe>
+                        """,
+        "result": ["https://player.twitch.tv/?channel=monstercat"]
+    },
+    {
+        "data": """
+                        <iframe width="560" height="315" src="https://www.youtube.com/embed/aqz-KE-bpKQ" frameborder="0" gesture="media" allow="encrypted-media" allowfullscreen></iframe>
+                        """,
+        "result": ["https://www.youtube.com/embed/aqz-KE-bpKQ"]
+    },
+    {
+        "data": """
+                        <iframe frameborder="0" width="480" height="270" src="//www.dailymotion.com/embed/video/xigbvx" allowfullscreen></iframe>
+                        """,
+        "result": ["//www.dailymotion.com/embed/video/xigbvx"]
+    },
+    {
+        "data": """
+                        <iframe src="https://player.vgtrk.com/iframe/live/id/2961/showZoomBtn/false/isPlay/true/" scrolling="No" border="0" frameborder="0" width="660" height="494" mozallowfullscreen webkitallowfullscreen allowfullscreen></iframe>
+                        """,
+        "result": ["https://player.vgtrk.com/iframe/live/id/2961/showZoomBtn/false/isPlay/true/"]
+    },
+    {
+        "data": """
+                        <iframe SRC="/web/playeriframe.jsp"  frameborder="0" WIDTH=500 HEIGHT=400></iframe>
+                        """,
+        "result": ["/web/playeriframe.jsp"]
+    },
+    {
+        "data": """
+                        <iframe width="470" height="270" src="http&#58;//example.example/live/ABC123ABC" frameborder="0"></iframe>
+                        """,
+        "result": ["http&#58;//example.example/live/ABC123ABC"]
+    },
+    {
+        "data": """
+                    <iframe     id="random"
+                        name="iframe"
+                        src="https://example.com/dotall/iframe"
+                        width="100%"
+                        height="500"
+                        scrolling="auto"
+                        frameborder="1"
+                        class="wrapper">
+                        </iframe>
+                    </div></div></div>
+                    """,
+        "result": ["https://example.com/dotall/iframe"]
+    },
+    {
+        "data": """
+                    <iframe src="https://example.com/123.php" width="720" height="500" allowtransparency="true"/>
+                    """,
+        "result": ["https://example.com/123.php"]
+    },
+    {
+        "data": """
+                        <iframe width="720" height="405" src="//rutube.ru/play/embed/11063587" frameborder="0"
+                            webkitAllowFullScreen mozallowfullscreen allowfullscreen></iframe>
+                        """,
+        "result": ["//rutube.ru/play/embed/11063587"]
+    },
+    {
+        "data": """
+                <iframe src="https://player/" frameborder="0">
+                """,
+        "result": ["https://player/"]
+    },
+    {
+        "data": """
+                <iframe src="https://player2/" frameborder="0" />
+                """,
+        "result": ["https://player2/"]
+    },
+    {
+        "data": """
+                <iframe src="https://player3/">
+                """,
+        "result": ["https://player3/"]
+    },
+    {
+        "data": """
+                <iframe src="https://player4/ ">
+                """,
+        "result": ["https://player4/"]
+    },
+]
+
+
+iframe_re_false_data = [
+    """<iframe id="iframe" title="" frameborder="0" width="0" height="0" src=""></iframe>""",
+    """<iframe name="g_iFrame1" width="70" src="logo"></iframe>""",
+    """<iframe id="<%- uploadIframe %>" name="" style="display:none;"></iframe>
+               <img src="<%- val.thumbUrl %>" alt=""/>""",
+    """<iframe id="<%- uploadIframe %>" name="" style="display:none;"></iframe>
+               <img src="<%-val.thumbUrl%>" alt=""/>""",
+    """<iframe src="invalid url" />""",
+]
+
+
+playlist_re_data = [
+    {
+        "data": """<player frameborder="0" src="http://local.m3u8">""",
+        "result": "http://local.m3u8"
+    },
+    {
+        "data": """<player frameborder="0" src="http://local.m3u8?local">""",
+        "result": "http://local.m3u8?local"
+    },
+    {
+        "data": """<player frameborder="0" src="//local.m3u8?local">""",
+        "result": "//local.m3u8?local"
+    },
+    {
+        "data": """
+                        file: "http://example.com:8081/edge/playlist.m3u8?wmsAuthSign=c9JnZbWludXR4",
+                        """,
+        "result": "http://example.com:8081/edge/playlist.m3u8?wmsAuthSign=c9JnZbWludXR4"
+    },
+    {
+        "data": """
+                        "hlsLivestreamURL": "https:\\/\\/live-http.example.com\\/live\\/_definst_\\/mp4:123\\/playlist.m3u8",
+                        "appnameLive": "live",
+                        "streaming": "true",
+                        "autostart": "true",
+                        """,
+        "result": "https:\\/\\/live-http.example.com\\/live\\/_definst_\\/mp4:123\\/playlist.m3u8"
+    },
+    {
+        "data": """
+                        var player = new Clappr.Player({source: '/tv/tv.m3u8', mimeType: 'application/x-mpegURL'
+                        """,
+        "result": "/tv/tv.m3u8"
+    },
+    {
+        "data": """
+                        <player frameborder="0" src="local.m3u8?local">
+                        """,
+        "result": "local.m3u8?local"
+    },
+    {
+        "data": """<video src="http://local.mp3">""",
+        "result": "http://local.mp3"
+    },
+    {
+        "data": """<video src="http://local.mp4">""",
+        "result": "http://local.mp4"
+    },
+    {
+        "data": """<video src="//example.com/local.mp4">""",
+        "result": "//example.com/local.mp4"
+    },
+    {
+        "data": """
+                        <video id='player_el' src='//example.com/video.mp4' width='100%' height='100%'
+                        """,
+        "result": "//example.com/video.mp4"
+    },
+    {
+        "data": """
+                        document.write( "<video src=http://999.999.999.999/live/playlist.m3u8?at=123 autoplay png> </video>");
+                        """,
+        "result": "http://999.999.999.999/live/playlist.m3u8?at=123"
+    },
+    {
+        "data": """
+                        document.write( "<video src=http://999.999.999.999/live/playlist.m3u8?at=123> </video>");
+                        """,
+        "result": "http://999.999.999.999/live/playlist.m3u8?at=123"
+    },
+    {
+        "data": """
+                        \\&quot;hlsMasterPlaylistUrl\\&quot;:\\&quot;https://example.com/hls/video.m3u8?p\\&quot;,
+                        """,
+        "result": "https://example.com/hls/video.m3u8?p"
+    },
+    {
+        "data": """
+                        data-stream="https://example.com/livestream?url=/live/24.m3u8"
+                        """,
+        "result": "https://example.com/livestream?url=/live/24.m3u8"
+    },
+    {
+        "data": """
+                        <script type="text/javascript" charset="utf-8">
+                        var VideoStatus = {
+                            "status" : "",
+                            "liveStream" : "{ \\"resolutions\\" : [ {
+                                              \\"cdnUrl\\" : \\"https://hls/stream/playlist.m3u8?foo=bar\\" } ] }",
+                            "viewType" : "live"
+                        }
+                        </script>
+                        """,
+        "result": "https://hls/stream/playlist.m3u8?foo=bar"
+    },
+    {
+        "data": """
+                    "sourceURL": "https%3A%2F%2Fabc.streamlock.net%2Flive%2Fsmil%3Alive.smil%2Fplaylist.m3u8"
+                    """,
+        "result": "https%3A%2F%2Fabc.streamlock.net%2Flive%2Fsmil%3Alive.smil%2Fplaylist.m3u8"
+    },
+]
+
+
+playlist_re_false_data = [
+    """<player frameborder="0" src="local.apk?local">""",
+    """<player frameborder="0" src="http://local.mpk">""",
+    """meta title="broken_title_url.mp4">""",
+    """video">broken_title_url22.mp4</span></div><div style="float""",
+    """video">broken_title_url22.mp4"float""",
+    """if(options.livestream==true){
+                 PlayerSetup.source.hls=options.m3u8;
+               }
+            """,
+    """getCurrentVideoSrc: function(){
+                 return $("#player").data("player").mp4;
+               },
+            """,
+    """
+                data-u="{upload_url=https://example.com/mobile.mp4,poster=https://example.com/mobile.jpg,id=123,flow=full}"
+            """,
+    """
+                <img src="http://example.com/images/123.mp40-480p.jpg " />
+            """,
+    """<title>VID_12345.mp4</title>""",
+    """
+                "title":"VID_123467.mp4"
+            """,
+    """
+                title="VID_12345678.mp4"
+            """,
+]
+
+
+window_location_re_data = [
+    {
+        "data": """
+                    <script type="text/javascript">
+                    window.location.href = 'http://mocked/default/iframe';
+                    </script>
+                """,
+        "result": "http://mocked/default/iframe",
+    },
+    {
+        "data": """
+                    <script type="text/javascript">
+                    window.location.href = "http://mocked/default/iframe2";
+                    </script>
+                """,
+        "result": "http://mocked/default/iframe2",
+    },
+]
+
+
 class PluginResolveTestMeta(type):
     def __new__(mcs, name, bases, dict):
 
@@ -362,307 +668,29 @@ class TestPluginResolve(unittest.TestCase):
             self.assertIsNotNone(m)
 
     def test_iframe_re(self):
-        test_list = [
-            {
-                "data": """
-                        <iframe src="http://local2.local">    </iframe>
-                        <iframe frameborder="0" src="http://local.local" width="650">iframe</iframe>""",
-                "result": ["http://local.local", "http://local2.local"]
-            },
-            {
-                "data": """<iframe src="http://local3.local" width="800px"></iframe>""",
-                "result": ["http://local3.local"]
-            },
-            {
-                "data": """<iframe height="600px" src="http://local4.local"></iframe>""",
-                "result": ["http://local4.local"]
-            },
-            {
-                "data": """<iframe height='600px' src='http://local5.local'></iframe>""",
-                "result": ["http://local5.local"]
-            },
-            {
-                "data": """</div>
-                        <script type="text/javascript">_satellite.pageBottom();</script>
-                        <iframe style="height:0px;width:0px;visibility:hidden" src="https://example.com/">
-                            this frame prevents back forward cache
-                            </iframe>
-                        </body>""",
-                "result": ["https://example.com/"]
-            },
-            {
-                "data": """
-                        <iframe src="https://example.com/123.php" width="720" height="500" allowtransparency="true"/>
-                        """,
-                "result": ["https://example.com/123.php"]
-            },
-            {
-                "data": """
-                        <script>
-                            document.write('<ifr' + 'ame id="video" src="https://example.com/123.php" height="500" ></ifr' + 'ame>');
-                        </script>
-                        """,
-                "result": ["https://example.com/123.php"]
-            },
-            {
-                "data": """
-                        <script>
-                            document.write('<ifr'+'ame id="video" src="https://example.com/123.php" height="500" ></ifr'+'ame>');
-                        </script>
-                        """,
-                "result": ["https://example.com/123.php"]
-            },
-            {
-                "data": """
-                        <iframe src="https://player.twitch.tv/?channel=monstercat" frameborder="0" allowfullscreen="true" scrolling="no" height="378" width="620"></iframe>
-                        """,
-                "result": ["https://player.twitch.tv/?channel=monstercat"]
-            },
-            {
-                "data": """
-                        <iframe width="560" height="315" src="https://www.youtube.com/embed/aqz-KE-bpKQ" frameborder="0" gesture="media" allow="encrypted-media" allowfullscreen></iframe>
-                        """,
-                "result": ["https://www.youtube.com/embed/aqz-KE-bpKQ"]
-            },
-            {
-                "data": """
-                        <iframe frameborder="0" width="480" height="270" src="//www.dailymotion.com/embed/video/xigbvx" allowfullscreen></iframe>
-                        """,
-                "result": ["//www.dailymotion.com/embed/video/xigbvx"]
-            },
-            {
-                "data": """
-                        <iframe src="https://player.vgtrk.com/iframe/live/id/2961/showZoomBtn/false/isPlay/true/" scrolling="No" border="0" frameborder="0" width="660" height="494" mozallowfullscreen webkitallowfullscreen allowfullscreen></iframe>
-                        """,
-                "result": ["https://player.vgtrk.com/iframe/live/id/2961/showZoomBtn/false/isPlay/true/"]
-            },
-            {
-                "data": """
-                        <iframe SRC="/web/playeriframe.jsp"  frameborder="0" WIDTH=500 HEIGHT=400></iframe>
-                        """,
-                "result": ["/web/playeriframe.jsp"]
-            },
-            {
-                "data": """
-                        <iframe width="470" height="270" src="http&#58;//example.example/live/ABC123ABC" frameborder="0"></iframe>
-                        """,
-                "result": ["http&#58;//example.example/live/ABC123ABC"]
-            },
-            {
-                "data": """
-                    <iframe     id="random"
-                        name="iframe"
-                        src="https://example.com/dotall/iframe"
-                        width="100%"
-                        height="500"
-                        scrolling="auto"
-                        frameborder="1"
-                        class="wrapper">
-                        </iframe>
-                    </div></div></div>
-                    """,
-                "result": ["https://example.com/dotall/iframe"]
-            },
-            {
-                "data": """
-                    <iframe src="https://example.com/123.php" width="720" height="500" allowtransparency="true"/>
-                    """,
-                "result": ["https://example.com/123.php"]
-            },
-            {
-                "data": """
-                        <iframe width="720" height="405" src="//rutube.ru/play/embed/11063587" frameborder="0"
-                            webkitAllowFullScreen mozallowfullscreen allowfullscreen></iframe>
-                        """,
-                "result": ["//rutube.ru/play/embed/11063587"]
-            },
-            {
-                "data": """
-                <iframe src="https://player/" frameborder="0">
-                """,
-                "result": ["https://player/"]
-            },
-            {
-                "data": """
-                <iframe src="https://player2/" frameborder="0" />
-                """,
-                "result": ["https://player2/"]
-            },
-            {
-                "data": """
-                <iframe src="https://player3/">
-                """,
-                "result": ["https://player3/"]
-            },
-            {
-                "data": """
-                <iframe src="https://player4/ ">
-                """,
-                "result": ["https://player4/"]
-            },
-        ]
-        for test_dict in test_list:
+        for test_dict in iframe_re_data:
             result_url_list = self.res_plugin._iframe_re.findall(test_dict["data"])
             self.assertIsNotNone(result_url_list)
             self.assertListEqual(sorted(test_dict["result"]), sorted(result_url_list))
 
     def test_iframe_re_false(self):
-        regex_test_list = [
-            """<iframe id="iframe" title="" frameborder="0" width="0" height="0" src=""></iframe>""",
-            """<iframe name="g_iFrame1" width="70" src="logo"></iframe>""",
-            """<iframe id="<%- uploadIframe %>" name="" style="display:none;"></iframe>
-               <img src="<%- val.thumbUrl %>" alt=""/>""",
-            """<iframe id="<%- uploadIframe %>" name="" style="display:none;"></iframe>
-               <img src="<%-val.thumbUrl%>" alt=""/>""",
-            """<iframe src="invalid url" />""",
-        ]
         if not hasattr(self, 'assertNotRegex'):
             self.assertNotRegex = self.assertNotRegexpMatches
 
-        for data in regex_test_list:
+        for data in iframe_re_false_data:
             self.assertNotRegex(data, self.res_plugin._iframe_re)
 
     def test_playlist_re(self):
-        regex_test_list = [
-            {
-                "data": """<player frameborder="0" src="http://local.m3u8">""",
-                "result": "http://local.m3u8"
-            },
-            {
-                "data": """<player frameborder="0" src="http://local.m3u8?local">""",
-                "result": "http://local.m3u8?local"
-            },
-            {
-                "data": """<player frameborder="0" src="//local.m3u8?local">""",
-                "result": "//local.m3u8?local"
-            },
-            {
-                "data": """
-                        file: "http://example.com:8081/edge/playlist.m3u8?wmsAuthSign=c9JnZbWludXR4",
-                        """,
-                "result": "http://example.com:8081/edge/playlist.m3u8?wmsAuthSign=c9JnZbWludXR4"
-            },
-            {
-                "data": """
-                        "hlsLivestreamURL": "https:\\/\\/live-http.example.com\\/live\\/_definst_\\/mp4:123\\/playlist.m3u8",
-                        "appnameLive": "live",
-                        "streaming": "true",
-                        "autostart": "true",
-                        """,
-                "result": "https:\\/\\/live-http.example.com\\/live\\/_definst_\\/mp4:123\\/playlist.m3u8"
-            },
-            {
-                "data": """
-                        var player = new Clappr.Player({source: '/tv/tv.m3u8', mimeType: 'application/x-mpegURL'
-                        """,
-                "result": "/tv/tv.m3u8"
-            },
-            {
-                "data": """
-                        <player frameborder="0" src="local.m3u8?local">
-                        """,
-                "result": "local.m3u8?local"
-            },
-            {
-                "data": """<video src="http://local.mp3">""",
-                "result": "http://local.mp3"
-            },
-            {
-                "data": """<video src="http://local.mp4">""",
-                "result": "http://local.mp4"
-            },
-            {
-                "data": """<video src="//example.com/local.mp4">""",
-                "result": "//example.com/local.mp4"
-            },
-            {
-                "data": """
-                        <video id='player_el' src='//example.com/video.mp4' width='100%' height='100%'
-                        """,
-                "result": "//example.com/video.mp4"
-            },
-            {
-                "data": """
-                        document.write( "<video src=http://999.999.999.999/live/playlist.m3u8?at=123 autoplay png> </video>");
-                        """,
-                "result": "http://999.999.999.999/live/playlist.m3u8?at=123"
-            },
-            {
-                "data": """
-                        document.write( "<video src=http://999.999.999.999/live/playlist.m3u8?at=123> </video>");
-                        """,
-                "result": "http://999.999.999.999/live/playlist.m3u8?at=123"
-            },
-            {
-                "data": """
-                        \\&quot;hlsMasterPlaylistUrl\\&quot;:\\&quot;https://example.com/hls/video.m3u8?p\\&quot;,
-                        """,
-                "result": "https://example.com/hls/video.m3u8?p"
-            },
-            {
-                "data": """
-                        data-stream="https://example.com/livestream?url=/live/24.m3u8"
-                        """,
-                "result": "https://example.com/livestream?url=/live/24.m3u8"
-            },
-            {
-                "data": """
-                        <script type="text/javascript" charset="utf-8">
-                        var VideoStatus = {
-                            "status" : "",
-                            "liveStream" : "{ \\"resolutions\\" : [ {
-                                              \\"cdnUrl\\" : \\"https://hls/stream/playlist.m3u8?foo=bar\\" } ] }",
-                            "viewType" : "live"
-                        }
-                        </script>
-                        """,
-                "result": "https://hls/stream/playlist.m3u8?foo=bar"
-            },
-            {
-                "data": """
-                    "sourceURL": "https%3A%2F%2Fabc.streamlock.net%2Flive%2Fsmil%3Alive.smil%2Fplaylist.m3u8"
-                    """,
-                "result": "https%3A%2F%2Fabc.streamlock.net%2Flive%2Fsmil%3Alive.smil%2Fplaylist.m3u8"
-            },
-        ]
-        for test_dict in regex_test_list:
+        for test_dict in playlist_re_data:
             m = self.res_plugin._playlist_re.search(test_dict["data"])
             self.assertIsNotNone(m)
             self.assertEqual(test_dict["result"], m.group("url"))
 
     def test_playlist_re_false(self):
-        regex_test_list = [
-            """<player frameborder="0" src="local.apk?local">""",
-            """<player frameborder="0" src="http://local.mpk">""",
-            """meta title="broken_title_url.mp4">""",
-            """video">broken_title_url22.mp4</span></div><div style="float""",
-            """video">broken_title_url22.mp4"float""",
-            """if(options.livestream==true){
-                 PlayerSetup.source.hls=options.m3u8;
-               }
-            """,
-            """getCurrentVideoSrc: function(){
-                 return $("#player").data("player").mp4;
-               },
-            """,
-            """
-                data-u="{upload_url=https://example.com/mobile.mp4,poster=https://example.com/mobile.jpg,id=123,flow=full}"
-            """,
-            """
-                <img src="http://example.com/images/123.mp40-480p.jpg " />
-            """,
-            """<title>VID_12345.mp4</title>""",
-            """
-                "title":"VID_123467.mp4"
-            """,
-            """
-                title="VID_12345678.mp4"
-            """,
-        ]
         if not hasattr(self, 'assertNotRegex'):
             self.assertNotRegex = self.assertNotRegexpMatches
 
-        for data in regex_test_list:
+        for data in playlist_re_false_data:
             self.assertNotRegex(data, self.res_plugin._playlist_re)
 
     def test_httpstream_bitrate_re(self):
@@ -751,25 +779,7 @@ class TestPluginResolve(unittest.TestCase):
             self.assertNotRegex(data, self.res_plugin._httpstream_bitrate_re)
 
     def test_window_location_re(self):
-        regex_test_list = [
-            {
-                "data": """
-                    <script type="text/javascript">
-                    window.location.href = 'http://mocked/default/iframe';
-                    </script>
-                """,
-                "result": "http://mocked/default/iframe",
-            },
-            {
-                "data": """
-                    <script type="text/javascript">
-                    window.location.href = "http://mocked/default/iframe2";
-                    </script>
-                """,
-                "result": "http://mocked/default/iframe2",
-            },
-        ]
-        for test_dict in regex_test_list:
+        for test_dict in window_location_re_data:
             m = self.res_plugin._window_location_re.search(test_dict["data"])
             self.assertIsNotNone(m)
             self.assertEqual(test_dict["result"], m.group("url"))
@@ -0,0 +1,103 @@
+import os.path
+import re
+import sys
+import threading
+
+from streamlink.plugin import Plugin, pluginmatcher
+from streamlink.stream import HTTPStream
+
+sys.path.insert(0, os.path.abspath('..'))
+from tests.common import PluginTestCase, text_hls  # noqa
+
+
+@pluginmatcher(re.compile(r'https?://other/'))
+class Other(Plugin):
+    # session headers of the last _get_streams
+    headers = None
+
+    def _get_streams(self):
+        Other.headers = dict(self.session.http.headers)
+        return {'other': HTTPStream(self.session, self.url)}
+
+
+@pluginmatcher(re.compile(r'https?://delegate/'))
+class Delegate(Plugin):
+    def _get_streams(self):
+        return self.session.streams('generic://http://mocked/inner')
+
+
+class TestRequestHeaders(PluginTestCase):
+
+    def test_session_headers(self):
+        self.mocker.get('http://mocked/page', text='<iframe src="http://mocked/iframe"></iframe>')
+        iframe = self.mocker.get('http://mocked/iframe', text='<video src="http://mocked/master.m3u8">')
+        playlist = self.mocker.get('http://mocked/master.m3u8', text=text_hls)
+
+        streams = self.streams('http://mocked/page')
+        self.assertEqual(iframe.last_request.headers['Referer'], 'http://mocked/page')
+        self.assertEqual(playlist.last_request.headers['Referer'], 'http://mocked/iframe')
+        # the streams use the same headers as the playlist
+        self.assertEqual(streams['640k'].args['headers']['Referer'], 'http://mocked/iframe')
+        self.assertNotIn('Referer', self.session.http.headers)
+        self.assertNotIn('Origin', self.session.http.headers)
+
+    def test_origin(self):
+        self.mocker.get('http://mocked/page', text=(
+            '<video src="http://mocked/master.m3u8">\n'
+            '<video src="https://abc.cloudfront.net/master.m3u8">\n'
+        ))
+        playlist = self.mocker.get('http://mocked/master.m3u8', status_code=404)
+        cloudfront = self.mocker.get('https://abc.cloudfront.net/master.m3u8', text=text_hls)
+
+        self.assertIn('640k', self.streams('http://mocked/page'))
+        self.assertNotIn('Origin', playlist.last_request.headers)
+        self.assertEqual(cloudfront.last_request.headers['Origin'], 'http://mocked')
+        self.assertEqual(cloudfront.last_request.headers['Referer'], 'http://mocked/page')
+        self.assertNotIn('Origin', self.session.http.headers)
+
+    def test_other_plugin(self):
+        self.session.plugins.update({'other': Other})
+        self.mocker.get('http://mocked/page', text='<iframe src="http://other/embed"></iframe>')
+
+        self.assertIn('other', self.streams('http://mocked/page'))
+        # other plugins only use the session headers
+        self.assertEqual(Other.headers['Referer'], 'http://mocked/page')
+        self.assertNotIn('Referer', self.session.http.headers)
+
+        self.session.http.headers['Referer'] = 'http://mocked/old'
+        self.streams('http://mocked/page')
+        self.assertEqual(Other.headers['Referer'], 'http://mocked/page')
+        self.assertEqual(self.session.http.headers['Referer'], 'http://mocked/old')
+
+    def test_nested_plugins(self):
+        self.session.plugins.update({'delegate': Delegate, 'other': Other})
+        self.mocker.get('http://mocked/page', text='<iframe src="http://delegate/embed"></iframe>')
+        self.mocker.get('http://mocked/inner', text='<iframe src="http://other/embed"></iframe>')
+
+        streams = {}
+        thread = threading.Thread(target=lambda: streams.update(self.streams('http://mocked/page')), daemon=True)
+        thread.start()
+        thread.join(10)
+        self.assertFalse(thread.is_alive())
+        self.assertIn('other', streams)
+        self.assertEqual(Other.headers['Referer'], 'http://mocked/inner')
+        self.assertNotIn('Referer', self.session.http.headers)
+
+    def test_pool_size(self):
+        self.mocker.get('http://mocked/page', text='<video src="http://mocked/master.m3u8">')
+        self.mocker.get('http://mocked/master.m3u8', text=text_hls)
+        self.session.set_option('interface', '127.0.0.1')
+        old_adapters = dict(self.session.http.adapters)
+
+        self.streams('http://mocked/page', pool_size=25)
+        adapters = dict(self.session.http.adapters)
+        for scheme in ('http://', 'https://'):
+            self.assertIsNot(adapters[scheme], old_adapters[scheme])
+            self.assertIs(type(adapters[scheme]), type(old_adapters[scheme]))
+            pool_kw = adapters[scheme].poolmanager.connection_pool_kw
+            self.assertEqual(pool_kw['maxsize'], 25)
+            self.assertEqual(pool_kw['source_address'], ('127.0.0.1', 0))
+
+        # the adapters are only replaced once
+        self.streams('http://mocked/page', pool_size=25)
+        self.assertEqual(self.session.http.adapters, adapters)
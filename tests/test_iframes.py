@@ -0,0 +1,118 @@
+import os.path
+import re
+import sys
+import tempfile
+
+from streamlink.exceptions import NoPluginError
+from streamlink.plugin import Plugin, pluginmatcher
+from streamlink.stream import HTTPStream
+
+sys.path.insert(0, os.path.abspath('..'))
+from plugins.generic import GenericResolveCache  # noqa
+from tests.common import PluginTestCase, text_master_hls  # noqa
+
+
+@pluginmatcher(re.compile(r'https?://other/'))
+class Other(Plugin):
+    def _get_streams(self):
+        return {'other': HTTPStream(self.session, self.url)}
+
+
+def iframes(*urls):
+    return ''.join('<iframe src="{0}"></iframe>\n'.format(url) for url in urls)
+
+
+class TestExploreIframes(PluginTestCase):
+    options = dict(PluginTestCase.options, iframe_explore=True)
+
+    def test_playlist_first(self):
+        self.mocker.get('http://mocked/page', text=iframes(
+            'http://mocked/empty', 'http://mocked/nested', 'http://mocked/live'))
+        self.mocker.get('http://mocked/empty', text='<p>empty</p>')
+        self.mocker.get('http://mocked/nested', text=iframes('http://mocked/nested/live'))
+        nested = self.mocker.get('http://mocked/nested/live',
+                                 text='<video src="http://mocked/nested/master.m3u8">')
+        self.mocker.get('http://mocked/master.m3u8', text=text_master_hls(1000000))
+        self.mocker.get('http://mocked/live', text='<video src="http://mocked/master.m3u8">')
+
+        self.assertIn('1000k', self.streams('http://mocked/page'))
+        # the next level is not opened
+        self.assertEqual(nested.call_count, 0)
+
+    def test_depth(self):
+        self.mocker.get('http://mocked/page', text=iframes('http://mocked/empty', 'http://mocked/nested'))
+        self.mocker.get('http://mocked/empty', text='<p>empty</p>')
+        self.mocker.get('http://mocked/nested', text=iframes('http://mocked/nested/live'))
+        live = self.mocker.get('http://mocked/nested/live',
+                               text='<video src="http://mocked/nested/master.m3u8">')
+        playlist = self.mocker.get('http://mocked/nested/master.m3u8', text=text_master_hls(2000000))
+
+        self.assertIn('2000k', self.streams('http://mocked/page'))
+        self.assertEqual(live.last_request.headers['Referer'], 'http://mocked/nested')
+        self.assertEqual(playlist.last_request.headers['Referer'], 'http://mocked/nested/live')
+
+        with self.assertRaises(NoPluginError):
+            self.streams('http://mocked/page', iframe_depth=1)
+
+    def test_invalid_playlist(self):
+        self.mocker.get('http://mocked/page', text=iframes('http://mocked/broken', 'http://mocked/live'))
+        self.mocker.get('http://mocked/broken', text='<video src="http://mocked/broken.m3u8">')
+        self.mocker.get('http://mocked/broken.m3u8', status_code=404)
+        self.mocker.get('http://mocked/live', text='<video src="http://mocked/master.m3u8">')
+        self.mocker.get('http://mocked/master.m3u8', text=text_master_hls(1000000))
+
+        self.assertIn('1000k', self.streams('http://mocked/page'))
+
+    def test_plugin(self):
+        self.session.plugins.update({'other': Other})
+        self.mocker.get('http://mocked/page', text=iframes('http://other/embed', 'http://mocked/live'))
+        self.mocker.get('http://mocked/live', text='<video src="http://mocked/master.m3u8">')
+        self.mocker.get('http://mocked/master.m3u8', text='invalid')
+
+        streams = self.streams('http://mocked/page')
+        self.assertEqual(list(streams), ['other', 'worst', 'best'])
+        self.assertNotIn('Referer', self.session.http.headers)
+
+    def test_fanout(self):
+        urls = ['http://mocked/{0}'.format(i) for i in range(1, 5)]
+        self.mocker.get('http://mocked/page', text=iframes(*urls))
+        mocks = [self.mocker.get(url, text='<p>empty</p>') for url in urls]
+
+        with self.assertRaises(NoPluginError):
+            self.streams('http://mocked/page', iframe_fanout=2)
+        self.assertEqual([m.call_count for m in mocks], [1, 1, 0, 0])
+
+    def test_loop(self):
+        self.mocker.get('http://mocked/page', text=iframes('http://mocked/a', 'http://mocked/b'))
+        a = self.mocker.get('http://mocked/a', text=iframes('http://mocked/page', 'http://mocked/b'))
+        b = self.mocker.get('http://mocked/b', text=iframes('http://mocked/a'))
+
+        with self.assertRaises(NoPluginError):
+            self.streams('http://mocked/page')
+        self.assertEqual(a.call_count, 1)
+        self.assertEqual(b.call_count, 1)
+
+    def test_cache_dir(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        page = self.mocker.get('http://mocked/page', text=iframes('http://mocked/empty', 'http://mocked/nested'))
+        self.mocker.get('http://mocked/empty', text='<p>empty</p>')
+        self.mocker.get('http://mocked/nested', text=iframes('http://mocked/nested/live'))
+        live = self.mocker.get('http://mocked/nested/live',
+                               text='<video src="http://mocked/nested/master.m3u8">')
+        playlist = self.mocker.get('http://mocked/nested/master.m3u8', text=text_master_hls(2000000))
+
+        self.assertIn('2000k', self.streams('http://mocked/page', cache_dir=tmpdir.name))
+        chain = ['http://mocked/page', 'http://mocked/nested', 'http://mocked/nested/live']
+        cache = GenericResolveCache(tmpdir.name)
+        for url in chain:
+            entry = cache.get(url)
+            self.assertEqual(entry.playlists, ['http://mocked/nested/master.m3u8'])
+            self.assertEqual(entry.chain, chain)
+        self.assertIsNone(cache.get('http://mocked/empty'))
+
+        # the iframes are not opened again
+        self.assertIn('2000k', self.streams('http://mocked/page', cache_dir=tmpdir.name))
+        self.assertEqual(page.call_count, 1)
+        self.assertEqual(live.call_count, 1)
+        self.assertEqual(playlist.last_request.headers['Referer'], 'http://mocked/nested/live')
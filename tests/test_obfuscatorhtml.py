@@ -1,3 +1,4 @@
+import base64
 import os.path
 import sys
 import unittest
@@ -103,3 +104,13 @@ class TestObfuscatorHTML(unittest.TestCase):
 ]; uPf.forEach(function iMn(value) { aKG += String.fromCharCode(parseInt(atob(value).replace(/\\D/g,'')) - 42007926); } ); document.write(decodeURIComponent(escape(aKG))); </script>"""
         javascript_output = """<!DOCTYPE html><html><body><script type="text/javascript">"JavaScript Livecli";</script></body></html>\r\n"""
         self.assertEqual(unpack_obfuscatorhtml(javascript_input), javascript_output)
+
+    def test_unpack_obfuscatorhtml_escaped_bytes(self):
+        # str() of a chunk with other bytes has \x escapes with more digits,
+        # these chunks are decoded one after another
+        chunks = [base64.b64encode(data).decode('ascii') for data in (b'ab65c', b'\x01\x0072', b'x68\ny')]
+        javascript_input = (
+            '<script>var a = ""; var b = [{0}]; b.forEach(function c(value) '
+            '{{ a += String.fromCharCode(parseInt(atob(value).replace(/\\D/g,\'\')) - 0); }} );</script>'
+        ).format(', '.join('"{0}"'.format(chunk) for chunk in chunks))
+        self.assertEqual(unpack_obfuscatorhtml(javascript_input), 'A' + chr(10072) + 'D')
@@ -3,7 +3,7 @@ import sys
 import unittest
 
 sys.path.insert(0, os.path.abspath('..'))
-from plugins.generic import UnpackingError, Packer, unpack_packer  # noqa
+from plugins.generic import UnpackingError, Packer, Unbaser, unpack_packer  # noqa
 
 
 class TestPacker(unittest.TestCase):
@@ -88,6 +88,27 @@ class TestPacker(unittest.TestCase):
         for _text, _r in test_list:
             self.assertEqual(self.my_unpacker.unpack(_text), _r)
 
+    def test_unpack_table(self):
+        alphabet = '0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+        words = [alphabet[i // 62] + alphabet[i % 62] if i >= 62 else alphabet[i] for i in range(200)]
+        symtab = ['' if i % 10 == 0 else 'w{0}'.format(i) for i in range(200)]
+        text = ("eval(function(p,a,c,k,e,d){{}}('{0}',62,200,'{1}'.split('|'),0,{{}}))".format(
+            ' '.join(words), '|'.join(symtab)))
+        result = ' '.join(symtab[i] or words[i] for i in range(200))
+        self.assertEqual(self.my_unpacker.unpack(text), result)
+
+    def test_unpack_table_not_encoded(self):
+        # "01" is not an encoded word, but it is still resolved like before
+        self.assertEqual(
+            self.my_unpacker.unpack("eval(function(p,a,c,k,e,d){}('0 01 2',10,3,'a|b|c'.split('|'),0,{}))"),
+            'a b c')
+
+    def test_replacestrings(self):
+        self.assertEqual(
+            self.my_unpacker._replacestrings(
+                'var _0x=["a","_0x[0]","c"];f(_0x[0],_0x[1],_0x[2]);g(a_0x[1],_0x[3],_0x[10])'),
+            'f("a","_0x[0]","c");g(a_0x[1],_0x[3],_0x[10])')
+
     def test_unpack_packer(self):
         self.assertEqual(unpack_packer("""
 <html>
@@ -125,3 +146,51 @@ eval(function(p,a,c,k,e,r){e=String;if(!''.replace(/^/,String)){while(c--)r[c]=k
 <iframe src="https://example4.com"></iframe>
 </html>
 """)
+
+
+class TestUnbaser(unittest.TestCase):
+    supported = list(range(2, 63)) + [95]
+
+    def test_unbase(self):
+        self.assertEqual(Unbaser(10)('123'), 123)
+        self.assertEqual(Unbaser(16)('ff'), 255)
+        self.assertEqual(Unbaser(36)('zz'), 1295)
+        self.assertEqual(Unbaser(37)('A'), 36)
+        self.assertEqual(Unbaser(62)('Z'), 61)
+        self.assertEqual(Unbaser(62)('10'), 62)
+        self.assertEqual(Unbaser(62)('ZZZ'), 238327)
+        self.assertEqual(Unbaser(95)('!'), 1)
+        self.assertEqual(Unbaser(95)('~~~~'), 95 ** 4 - 1)
+
+    def test_encode(self):
+        for base in self.supported:
+            unbaser = Unbaser(base)
+            for number in list(range(base * 3)) + [base ** 2 - 1, base ** 2, base ** 5 + 7]:
+                self.assertEqual(unbaser(unbaser.encode(number)), number, (base, number))
+
+    def test_unbase_reference(self):
+        for base in self.supported:
+            unbaser = Unbaser(base)
+            alphabet = Unbaser.ALPHABET[62][:base] if base <= 62 else Unbaser.ALPHABET[95]
+            for word in (alphabet[-1], alphabet[1] + alphabet[0], alphabet[0] + alphabet[-1],
+                         alphabet[-1] * 3, alphabet[1:4] * 2):
+                expected = sum(base ** index * alphabet.index(cipher)
+                               for index, cipher in enumerate(reversed(word)))
+                self.assertEqual(unbaser(word), expected, (base, word))
+
+    def test_unsupported(self):
+        for base in (0, 1, 63, 94, 96):
+            with self.assertRaises(TypeError):
+                Unbaser(base)
+            with self.assertRaises(TypeError):
+                Unbaser.for_base(base)
+
+    def test_for_base(self):
+        for base in self.supported:
+            self.assertIs(Unbaser.for_base(base), Unbaser.for_base(base))
+            self.assertEqual(Unbaser.for_base(base).base, base)
+
+    def test_alphabet_unchanged(self):
+        for base in range(37, 62):
+            Unbaser(base)
+        self.assertEqual(sorted(Unbaser.ALPHABET), [62, 95])
@@ -0,0 +1,97 @@
+import os.path
+import sys
+import unittest
+
+from streamlink import Streamlink
+from streamlink.options import Options
+
+sys.path.insert(0, os.path.abspath('..'))
+from plugins.generic import Generic, site_domain  # noqa
+
+
+class TestRankPlaylists(unittest.TestCase):
+
+    def setUp(self):
+        self.plugin = Generic(Streamlink(), 'generic://https://www.example.com/page', Options())
+
+    def make_url_list(self, url_list, url_type='playlist'):
+        return self.plugin._make_url_list(url_list, 'https://www.example.com/page', url_type=url_type)
+
+    def test_rank(self):
+        self.assertEqual(self.make_url_list([
+            'https://cdn.other.net/preview/master.m3u8',
+            'https://cdn.other.net/video_720.mp4',
+            'https://cdn.other.net/live/manifest.mpd',
+            'https://cdn.other.net/live/chunklist.m3u8',
+            'https://cdn.example.com/live/chunklist.m3u8',
+            'https://cdn.other.net/live/master.m3u8',
+        ]), [
+            'https://cdn.other.net/live/master.m3u8',
+            'https://cdn.example.com/live/chunklist.m3u8',
+            'https://cdn.other.net/live/chunklist.m3u8',
+            'https://cdn.other.net/live/manifest.mpd',
+            'https://cdn.other.net/video_720.mp4',
+            'https://cdn.other.net/preview/master.m3u8',
+        ])
+
+    def test_document_order(self):
+        url_list = [
+            'https://www.example.com/z/master.m3u8',
+            'https://www.example.com/b/master.m3u8',
+            'https://www.example.com/z/master.m3u8',
+            'https://www.example.com/a/master.m3u8',
+        ]
+        self.assertEqual(self.make_url_list(url_list), [
+            'https://www.example.com/z/master.m3u8',
+            'https://www.example.com/b/master.m3u8',
+            'https://www.example.com/a/master.m3u8',
+        ])
+
+    def test_unwanted(self):
+        self.assertEqual(self.make_url_list([
+            'https://www.example.com/ad/master.m3u8',
+            'https://www.example.com/promo_1.mp4',
+            'https://www.example.com/trailer.mp4',
+            'https://www.example.com/thumbs/video.mp4',
+            'https://www.example.com/upload/video.mp4',
+        ]), [
+            'https://www.example.com/upload/video.mp4',
+            'https://www.example.com/ad/master.m3u8',
+            'https://www.example.com/promo_1.mp4',
+            'https://www.example.com/trailer.mp4',
+            'https://www.example.com/thumbs/video.mp4',
+        ])
+
+    def test_same_domain(self):
+        url_list = [
+            'https://badexample.com/live/chunklist.m3u8',
+            'https://cdn.example.com:8443/live/chunklist.m3u8',
+        ]
+        for base_url in ('https://www.example.com/page', 'https://www.example.com:8080/page'):
+            self.assertEqual(self.plugin._rank_playlists(url_list, base_url), url_list[::-1])
+
+        url_list = [
+            'https://www.other.co.uk/live/chunklist.m3u8',
+            'https://cdn.bbc.co.uk/live/chunklist.m3u8',
+        ]
+        self.assertEqual(self.plugin._rank_playlists(url_list, 'https://www.bbc.co.uk/live'), url_list[::-1])
+
+    def test_site_domain(self):
+        for host, domain in (
+            ('www.example.com', 'example.com'),
+            ('example.com', 'example.com'),
+            ('www.bbc.co.uk', 'bbc.co.uk'),
+            ('cdn.abc.net.au', 'abc.net.au'),
+            ('www.example.de', 'example.de'),
+            ('localhost', 'localhost'),
+            ('192.168.0.1', '192.168.0.1'),
+        ):
+            self.assertEqual(site_domain(host), domain)
+
+    def test_iframes(self):
+        url_list = [
+            'https://z.example.com/embed',
+            'https://www.other.net/embed',
+            'https://a.example.com/preview',
+        ]
+        self.assertEqual(self.make_url_list(url_list, url_type='iframe'), url_list)
@@ -0,0 +1,55 @@
+import os.path
+import sys
+import unittest
+
+from unittest.mock import patch
+
+from streamlink import Streamlink
+from streamlink.options import Options
+
+sys.path.insert(0, os.path.abspath('..'))
+import plugins.generic  # noqa
+from plugins.generic import CandidateURL, Generic, repair_url  # noqa
+
+
+class TestRepairURL(unittest.TestCase):
+
+    def test_candidate_url(self):
+        url = repair_url('/live/master.m3u8', 'https://example.com/page')
+        self.assertIsInstance(url, CandidateURL)
+        self.assertEqual(url, 'https://example.com/live/master.m3u8')
+        self.assertEqual(url.parsed.netloc, 'example.com')
+        self.assertEqual(url.parsed.path, '/live/master.m3u8')
+
+    def test_cache(self):
+        url = repair_url('/cached.m3u8', 'https://example.com/page')
+        self.assertIs(repair_url('/cached.m3u8', 'https://example.com/page'), url)
+        self.assertEqual(repair_url('/cached.m3u8', 'https://example.org/page'),
+                         'https://example.org/cached.m3u8')
+
+
+class TestMakeURLList(unittest.TestCase):
+
+    def setUp(self):
+        self.plugin = Generic(Streamlink(), 'generic://https://example.com/page', Options())
+
+    def test_parse_once(self):
+        raw = ['/{0}/master.m3u8'.format(i % 10) for i in range(100)]
+        with patch.object(plugins.generic, 'urlparse', wraps=plugins.generic.urlparse) as urlparse:
+            url_list = self.plugin._make_url_list(raw, 'https://example.com/unique', url_type='playlist')
+            self.assertEqual(len(url_list), 10)
+
+            with patch.object(Generic, '_probe_playlist', lambda plugin, url, playlist_type, headers=None: [(url, None)]):
+                streams = list(self.plugin._resolve_playlist(url_list))
+            self.assertEqual(len(streams), 5)
+
+        # the playlist URLs are not parsed again
+        parsed = [c.args[0] for c in urlparse.call_args_list if c.args[0] in url_list]
+        self.assertEqual(sorted(parsed), sorted(url_list))
+
+        self.assertTrue(all(isinstance(url, CandidateURL) for url in url_list))
+
+    def test_plain_url(self):
+        with patch.object(Generic, '_probe_playlist', lambda plugin, url, playlist_type, headers=None: [(playlist_type, None)]):
+            streams = list(self.plugin._resolve_playlist(['https://example.com/live/master.m3u8']))
+        self.assertEqual(streams, [('hls', None)])
@@ -0,0 +1,66 @@
+import os.path
+import sys
+
+sys.path.insert(0, os.path.abspath('..'))
+from plugins.generic import ResText  # noqa
+from tests.common import PluginTestCase  # noqa
+
+playlist = '<video src="http://mocked/live/playlist.m3u8">\n'
+filler = '<p>{0}</p>\n'.format('x' * 1000)
+
+
+class TestResText(PluginTestCase):
+
+    def test_res_text(self):
+        text = filler * 500 + playlist + filler * 500
+        self.mocker.get('http://mocked/page', text=text)
+        self.assertEqual(self.plugin('http://mocked/page')._res_text('http://mocked/page').text, text)
+
+    def test_early_stop(self):
+        text = filler * 100 + playlist + filler * 5000
+        self.mocker.get('http://mocked/page', text=text)
+        plugin = self.plugin('http://mocked/page', early_stop=True)
+        res_text = plugin._res_text('http://mocked/page').text
+        self.assertIn(playlist, res_text)
+        self.assertLess(len(res_text), len(text) // 10)
+        self.assertTrue(text.startswith(res_text))
+
+    def test_early_stop_between_chunks(self):
+        plugin = self.plugin('http://mocked/page', early_stop=True)
+        offset = plugin._stream_chunk_size - 20
+        text = 'x' * offset + playlist + filler * 5000
+        self.mocker.get('http://mocked/page', text=text)
+        res_text = plugin._res_text('http://mocked/page').text
+        self.assertIn(playlist, res_text)
+        self.assertEqual(len(res_text), plugin._stream_chunk_size * 2)
+
+    def test_early_stop_invalid_playlist(self):
+        text = filler * 10 + '<img src="http://mocked/ad/novideo.mp4">\n' + filler * 200 + playlist
+        self.mocker.get('http://mocked/page', text=text)
+        plugin = self.plugin('http://mocked/page', early_stop=True)
+        self.assertEqual(plugin._res_text('http://mocked/page').text, text)
+
+    def test_max_bytes(self):
+        text = filler * 1000
+        self.mocker.get('http://mocked/page', text=text)
+        plugin = self.plugin('http://mocked/page', max_bytes=100000)
+        res_text = plugin._res_text('http://mocked/page').text
+        self.assertEqual(len(res_text), 100000)
+        self.assertTrue(text.startswith(res_text))
+
+        plugin = self.plugin('http://mocked/page', max_bytes=1000)
+        self.assertLessEqual(len(plugin._res_text('http://mocked/page').text), 1000)
+
+    def test_max_bytes_multibyte(self):
+        text = 'ä' * 200000
+        self.mocker.get('http://mocked/page', content=text.encode('utf-8'),
+                        headers={'Content-Type': 'text/html; charset=utf-8'})
+        plugin = self.plugin('http://mocked/page', max_bytes=100001)
+        self.assertEqual(plugin._res_text('http://mocked/page').text, 'ä' * 50000)
+
+    def test_status(self):
+        self.mocker.get('http://mocked/page', [{'text': '<p>page</p>'}, {'status_code': 304}])
+        plugin = self.plugin('http://mocked/page')
+        self.assertEqual(plugin._res_text('http://mocked/page'), ResText('<p>page</p>', 200))
+        # the validators of the caller are valid
+        self.assertEqual(plugin._res_text('http://mocked/page', headers={'If-None-Match': '"v1"'}).status, 304)
@@ -0,0 +1,92 @@
+import os.path
+import sys
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath('..'))
+from plugins.generic import GenericResolveCache  # noqa
+from tests.common import PluginTestCase, text_hls  # noqa
+
+
+class TestGenericResolveCache(unittest.TestCase):
+
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = tmpdir.name
+
+    def test_get_set(self):
+        cache = GenericResolveCache(self.path, ttl=60)
+        self.assertIsNone(cache.get('http://mocked/page'))
+
+        with patch('time.time', return_value=1000.0):
+            cache.set('http://mocked/page', ['http://mocked/a.m3u8'],
+                      ['http://mocked/page', 'http://mocked/iframe'], etag='"abc"')
+        entry = GenericResolveCache(self.path).get('http://mocked/page')
+        self.assertEqual(entry.playlists, ['http://mocked/a.m3u8'])
+        self.assertEqual(entry.page_url, 'http://mocked/iframe')
+        self.assertEqual(entry.expires, 1060.0)
+        self.assertEqual(entry.validators(), {'If-None-Match': '"abc"'})
+
+        with patch('time.time', return_value=2000.0):
+            cache.refresh('http://mocked/page')
+        self.assertEqual(cache.get('http://mocked/page').expires, 2060.0)
+
+        cache.delete('http://mocked/page')
+        self.assertIsNone(cache.get('http://mocked/page'))
+
+    def test_lru(self):
+        cache = GenericResolveCache(self.path, max_entries=2)
+        for now, url in enumerate(('http://mocked/1', 'http://mocked/2')):
+            with patch('time.time', return_value=float(now)):
+                cache.set(url, [], [url])
+        # 1 is used more recently than 2
+        with patch('time.time', return_value=10.0):
+            cache.get('http://mocked/1')
+        with patch('time.time', return_value=20.0):
+            cache.set('http://mocked/3', [], ['http://mocked/3'])
+
+        self.assertIsNotNone(cache.get('http://mocked/1'))
+        self.assertIsNone(cache.get('http://mocked/2'))
+        self.assertIsNotNone(cache.get('http://mocked/3'))
+
+
+class TestGenericResolveCachePlugin(PluginTestCase):
+
+    def setUp(self):
+        super().setUp()
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = tmpdir.name
+        self.options = dict(self.options, cache_dir=self.path)
+        self.playlist = self.mocker.get('http://mocked/cache/master.m3u8', text=text_hls)
+
+    def test_cache_hit(self):
+        page = self.mocker.get('http://mocked/cache/page',
+                               text='<video src="http://mocked/cache/master.m3u8">')
+        self.assertIn('640k', self.streams('http://mocked/cache/page'))
+        self.assertEqual(page.call_count, 1)
+
+        self.assertIn('640k', self.streams('http://mocked/cache/page'))
+        self.assertEqual(page.call_count, 1)
+        self.assertEqual(self.playlist.call_count, 2)
+
+    def test_cache_not_modified(self):
+        page = self.mocker.get('http://mocked/cache/etag', [
+            {'text': '<video src="http://mocked/cache/master.m3u8">', 'headers': {'ETag': '"v1"'}},
+            {'status_code': 304},
+        ])
+        self.assertIn('640k', self.streams('http://mocked/cache/etag', cache_ttl=0))
+        self.assertIn('640k', self.streams('http://mocked/cache/etag', cache_ttl=0))
+        self.assertEqual(page.call_count, 2)
+        self.assertEqual(page.request_history[1].headers['If-None-Match'], '"v1"')
+
+    def test_cache_expired(self):
+        page = self.mocker.get('http://mocked/cache/expired',
+                               text='<video src="http://mocked/cache/master.m3u8">')
+        self.assertIn('640k', self.streams('http://mocked/cache/expired', cache_ttl=0))
+        self.assertIn('640k', self.streams('http://mocked/cache/expired', cache_ttl=0))
+        self.assertEqual(page.call_count, 2)
+        self.assertNotIn('If-None-Match', page.request_history[1].headers)
@@ -0,0 +1,132 @@
+import os.path
+import sys
+import threading
+import time
+
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath('..'))
+from plugins.generic import Generic  # noqa
+from tests.common import PluginTestCase, text_master_hls  # noqa
+
+
+def slow(text, seconds):
+    def callback(request, context):
+        time.sleep(seconds)
+        return text
+    return callback
+
+
+class TestResolvePlaylist(PluginTestCase):
+
+    def resolve(self, playlist_all, **options):
+        return list(self.plugin('http://mocked/page', **options)._resolve_playlist(playlist_all))
+
+    def names(self, streams):
+        return [name for name, stream in streams]
+
+    def test_order(self):
+        self.mocker.get('http://mocked/1.m3u8', text=slow(text_master_hls(1000000), 0.2))
+        self.mocker.get('http://mocked/2.m3u8', text=text_master_hls(2000000))
+        self.mocker.get('http://mocked/3.mpd', text='invalid')
+        playlist_all = [
+            'http://mocked/1.m3u8',
+            'http://mocked/2.m3u8',
+            'http://mocked/3.mpd',
+            'http://mocked/video_720.mp4',
+        ]
+        serial = self.resolve(playlist_all)
+        self.assertEqual(self.names(serial), ['1000k', '2000k', '720p'])
+        for workers in (2, 4):
+            self.assertEqual(self.names(self.resolve(playlist_all, playlist_workers=workers)), self.names(serial))
+
+    def test_concurrent(self):
+        # every playlist waits until all playlists are opened,
+        # the barrier breaks after its timeout if they are opened one after another
+        barrier = threading.Barrier(4, timeout=5)
+
+        def probe(plugin, url, playlist_type, headers=None):
+            barrier.wait()
+            return [(url.rsplit('/', 1)[-1], None)]
+
+        playlist_all = ['http://mocked/{0}.m3u8'.format(i) for i in range(1, 5)]
+        with patch.object(Generic, '_probe_playlist', probe):
+            streams = self.resolve(playlist_all, playlist_workers=4)
+        self.assertFalse(barrier.broken)
+        self.assertEqual(self.names(streams), ['1.m3u8', '2.m3u8', '3.m3u8', '4.m3u8'])
+
+    def test_timeout(self):
+        def probe(plugin, url, playlist_type, headers=None):
+            if url.endswith('/1.m3u8'):
+                time.sleep(0.5)
+            return [(url.rsplit('/', 1)[-1], None)]
+
+        with patch.object(Generic, '_probe_playlist', probe):
+            streams = self.resolve(['http://mocked/1.m3u8', 'http://mocked/2.m3u8'],
+                                   playlist_timeout=0.1, playlist_workers=2)
+        self.assertEqual(self.names(streams), ['2.m3u8'])
+
+    def test_playlist_max(self):
+        playlist_all = []
+        for i in range(1, 6):
+            url = 'http://mocked/{0}.m3u8'.format(i)
+            self.mocker.get(url, text=text_master_hls(i * 1000000))
+            playlist_all.append(url)
+        self.mocker.get('http://mocked/1.m3u8', status_code=404)
+        streams = self.resolve(playlist_all, playlist_max=2, playlist_workers=2)
+        self.assertEqual(self.names(streams), ['2000k', '3000k'])
+
+    def test_first_match(self):
+        probed = []
+
+        def probe(plugin, url, playlist_type, headers=None):
+            probed.append(url)
+            return [(url.rsplit('/', 1)[-1], None)]
+
+        playlist_all = ['http://mocked/{0}.m3u8'.format(i) for i in range(1, 5)]
+        with patch.object(Generic, '_probe_playlist', probe):
+            streams = self.resolve(playlist_all, first_match=True)
+        self.assertEqual(self.names(streams), ['1.m3u8'])
+        self.assertEqual(probed, ['http://mocked/1.m3u8'])
+
+    def test_stream_target(self):
+        probed = []
+
+        def probe(plugin, url, playlist_type, headers=None):
+            probed.append(url)
+            if url.endswith('/1.m3u8'):
+                return []
+            if url.endswith('/2.m3u8'):
+                return [('480p', None)]
+            return [('720p', None), ('1080p', None)]
+
+        playlist_all = ['http://mocked/{0}.m3u8'.format(i) for i in range(1, 6)]
+        with patch.object(Generic, '_probe_playlist', probe):
+            streams = self.resolve(playlist_all, stream_target=['720p', 'best'])
+        self.assertEqual(self.names(streams), ['480p', '720p', '1080p'])
+        self.assertEqual(len(probed), 3)
+
+        with patch.object(Generic, '_probe_playlist', probe):
+            streams = self.resolve(playlist_all, stream_target=['240p'])
+        self.assertEqual(len(streams), 7)
+
+    def test_first_match_workers(self):
+        # the other playlists are still loading, when the streams are returned
+        returned = threading.Event()
+        probed, waited = [], []
+
+        def probe(plugin, url, playlist_type, headers=None):
+            probed.append(url)
+            if not url.endswith('/1.m3u8'):
+                waited.append(returned.wait(5))
+            return [(url.rsplit('/', 1)[-1], None)]
+
+        playlist_all = ['http://mocked/{0}.m3u8'.format(i) for i in range(1, 9)]
+        with patch.object(Generic, '_probe_playlist', probe):
+            try:
+                streams = self.resolve(playlist_all, first_match=True, playlist_workers=2)
+                self.assertEqual(waited, [])
+            finally:
+                returned.set()
+        self.assertEqual(self.names(streams), ['1.m3u8'])
+        self.assertLessEqual(set(probed), set(playlist_all[:2]))
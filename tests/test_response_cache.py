@@ -0,0 +1,97 @@
+import os.path
+import sys
+import unittest
+
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath('..'))
+import plugins.generic  # noqa
+from plugins.generic import GenericResponseCache, ResponseCacheEntry  # noqa
+from tests.common import PluginTestCase, text_hls  # noqa
+
+
+def entry(text, etag='"v1"'):
+    return ResponseCacheEntry('http://mocked/page', text, etag, None)
+
+
+class TestGenericResponseCache(unittest.TestCase):
+
+    def test_lru(self):
+        cache = GenericResponseCache(max_size=100, max_entries=2)
+        cache.set('http://mocked/1', entry('a'))
+        cache.set('http://mocked/2', entry('b'))
+        # 1 is used more recently than 2
+        cache.get('http://mocked/1')
+        cache.set('http://mocked/3', entry('c'))
+        self.assertIsNotNone(cache.get('http://mocked/1'))
+        self.assertIsNone(cache.get('http://mocked/2'))
+        self.assertIsNotNone(cache.get('http://mocked/3'))
+
+    def test_max_size(self):
+        cache = GenericResponseCache(max_size=10)
+        cache.set('http://mocked/1', entry('x' * 6))
+        cache.set('http://mocked/2', entry('x' * 6))
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.size, 6)
+        # bigger than the whole cache
+        cache.set('http://mocked/3', entry('x' * 11))
+        self.assertIsNone(cache.get('http://mocked/3'))
+
+        cache.resize(5, 1000)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.size, 0)
+
+
+class TestGenericResponseCachePlugin(PluginTestCase):
+    options = dict(PluginTestCase.options, response_cache_size=1)
+
+    def setUp(self):
+        super().setUp()
+        self.mocker.get('http://mocked/master.m3u8', text=text_hls)
+
+    def test_not_modified(self):
+        page = self.mocker.get('http://mocked/page', [
+            {'text': '<video src="http://mocked/master.m3u8">', 'headers': {'ETag': '"v1"'}},
+            {'status_code': 304},
+        ])
+        with patch.object(plugins.generic, 'unpack', wraps=plugins.generic.unpack) as unpack:
+            self.assertIn('640k', self.streams('http://mocked/page'))
+            self.assertIn('640k', self.streams('http://mocked/page'))
+        self.assertEqual(page.call_count, 2)
+        self.assertNotIn('If-None-Match', page.request_history[0].headers)
+        self.assertEqual(page.request_history[1].headers['If-None-Match'], '"v1"')
+        # the cached website is not unpacked again
+        self.assertEqual(unpack.call_count, 1)
+
+    def test_modified(self):
+        page = self.mocker.get('http://mocked/page', [
+            {'text': '<p>empty</p>', 'headers': {'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}},
+            {'text': '<video src="http://mocked/master.m3u8">'},
+        ])
+        plugin = self.plugin('http://mocked/page')
+        self.assertEqual(plugin._res_text('http://mocked/page').text, '<p>empty</p>')
+        self.assertIn('640k', self.streams('http://mocked/page'))
+        self.assertEqual(page.request_history[1].headers['If-Modified-Since'], 'Mon, 01 Jan 2024 00:00:00 GMT')
+        # the new website has no validators
+        self.assertIsNone(GenericResponseCache._shared.get('http://mocked/page'))
+
+    def test_permanent_redirect(self):
+        old = self.mocker.get('http://mocked/old', status_code=301, headers={'Location': 'http://mocked/new'})
+        new = self.mocker.get('http://mocked/new', [
+            {'text': '<video src="http://mocked/master.m3u8">', 'headers': {'ETag': '"v1"'}},
+            {'status_code': 304},
+        ])
+        self.assertIn('640k', self.streams('http://mocked/old'))
+        self.assertIn('640k', self.streams('http://mocked/old'))
+        self.assertEqual(old.call_count, 1)
+        self.assertEqual(new.call_count, 2)
+        cached = GenericResponseCache._shared.get('http://mocked/old')
+        self.assertEqual(cached.url, 'http://mocked/new')
+
+    def test_disabled(self):
+        page = self.mocker.get('http://mocked/page', text='<video src="http://mocked/master.m3u8">',
+                               headers={'ETag': '"v1"'})
+        self.streams('http://mocked/page', response_cache_size=0)
+        self.streams('http://mocked/page', response_cache_size=0)
+        self.assertNotIn('If-None-Match', page.last_request.headers)
+        self.assertIsNone(GenericResponseCache._shared)
@@ -0,0 +1,112 @@
+import json
+import os.path
+import sys
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+from streamlink.exceptions import NoPluginError
+
+sys.path.insert(0, os.path.abspath('..'))
+import plugins.generic  # noqa
+from plugins.generic import GenericStats  # noqa
+from tests.common import PluginTestCase, text_hls  # noqa
+
+text_page = (
+    '<iframe src="http://mocked/iframe"></iframe>\n'
+)
+
+text_iframe = (
+    '<video src="http://blocked.com/master.m3u8">\n'
+    '<video src="http://mocked/master.m3u8">\n'
+)
+
+
+class TestGenericStats(unittest.TestCase):
+
+    def test_stage(self):
+        stats = GenericStats()
+        for _ in range(2):
+            with stats.stage('res_text'):
+                pass
+        with self.assertRaises(ValueError):
+            with stats.stage('unpack'):
+                raise ValueError
+        self.assertEqual(stats.stages['res_text']['count'], 2)
+        self.assertEqual(stats.stages['unpack']['count'], 1)
+
+    def test_record(self):
+        stats = GenericStats()
+        stats.add_bytes(100)
+        stats.add_bytes(20)
+        stats.add_candidates('playlist', 3, 1, {'BL-netloc': 1, 'SAME-URL': 1})
+        stats.add_candidates('playlist', 1, 1, {'BL-netloc': 1})
+        stats.add_candidates('', 1, 0, {})
+        record = stats.record(url='http://mocked/page')
+        self.assertEqual(record['url'], 'http://mocked/page')
+        self.assertEqual(record['bytes'], 120)
+        self.assertEqual(record['candidates'], {
+            'playlist': {'found': 4, 'valid': 2},
+            'other': {'found': 1, 'valid': 0},
+        })
+        self.assertEqual(record['removed'], {'BL-netloc': 2, 'SAME-URL': 1})
+        json.dumps(record)
+
+
+class TestGenericStatsPlugin(PluginTestCase):
+    options = dict(PluginTestCase.options, blacklist_netloc=['blocked.com'])
+
+    def setUp(self):
+        super().setUp()
+        self.mocker.get('http://mocked/page', text=text_page)
+        self.mocker.get('http://mocked/iframe', text=text_iframe)
+        self.mocker.get('http://mocked/master.m3u8', text=text_hls)
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.stats_file = os.path.join(tmpdir.name, 'stats.jsonl')
+
+    def test_stats_file(self):
+        self.streams('http://mocked/page', stats_file=self.stats_file)
+        with open(self.stats_file) as f:
+            records = [json.loads(line) for line in f]
+
+        # one record for the website, the iframe uses the same stats
+        self.assertEqual(len(records), 1)
+        record = records[0]
+        self.assertEqual(record['url'], 'http://mocked/page')
+        self.assertIsNone(record['error'])
+        self.assertEqual(record['hops'], 2)
+        self.assertEqual(record['bytes'], len(text_page) + len(text_iframe))
+        self.assertEqual(record['stages']['res_text']['count'], 2)
+        self.assertEqual(record['stages']['unpack']['count'], 2)
+        self.assertEqual(record['stages']['probe_playlist']['count'], 1)
+        for name in ('extract', 'make_url_list'):
+            self.assertIn(name, record['stages'])
+        self.assertEqual(record['candidates'], {
+            'iframe': {'found': 1, 'valid': 1},
+            'playlist': {'found': 2, 'valid': 1},
+        })
+        self.assertEqual(record['removed'], {'BL-netloc': 1})
+
+    def test_early_stop(self):
+        self.streams('http://mocked/page', stats_file=self.stats_file, early_stop=True)
+        with open(self.stats_file) as f:
+            record = json.loads(f.readline())
+        # the partial website checks of --generic-early-stop are not counted
+        self.assertEqual(record['candidates'], {
+            'iframe': {'found': 1, 'valid': 1},
+            'playlist': {'found': 2, 'valid': 1},
+        })
+        self.assertEqual(record['removed'], {'BL-netloc': 1})
+
+    def test_callback(self):
+        records = []
+        self.mocker.get('http://mocked/empty', text='<p>empty</p>')
+        with patch.object(plugins.generic, 'STATS_CALLBACKS', [records.append]):
+            with self.assertRaises(NoPluginError):
+                self.streams('http://mocked/empty')
+            self.streams('http://mocked/page')
+        self.assertEqual([record['url'] for record in records], ['http://mocked/empty', 'http://mocked/page'])
+        self.assertEqual(records[0]['error'], 'NoPluginError: ')
+        self.assertFalse(os.path.exists(self.stats_file))
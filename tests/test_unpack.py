@@ -0,0 +1,81 @@
+import base64
+import os.path
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath('..'))
+from plugins.generic import unpack, unpack_unescape  # noqa
+
+
+def obfuscatorhtml(text, minus=1000):
+    chunks = ', '.join('"{0}"'.format(base64.b64encode('ab{0}c'.format(ord(char) + minus).encode('ascii')).decode('ascii'))
+                       for char in text)
+    return ('<script>var a = ""; var b = [{0}]; b.forEach(function c(value) '
+            '{{ a += String.fromCharCode(parseInt(atob(value).replace(/\\D/g,\'\')) - {1}); }} );</script>'
+            ).format(chunks, minus)
+
+
+class TestUnpack(unittest.TestCase):
+
+    def test_unpack_chain(self):
+        self.assertEqual(unpack("""
+<html>
+<body>
+eval(function(p,a,c,k,e,r){e=String;if(!''.replace(/^/,String)){while(c--)r[c]=k[c]||c;k=[function(e){return r[e]}];e=function(){return'\\w+'};c=1};while(c--)if(k[c])p=p.replace(new RegExp('\\b'+e(c)+'\\b','g'),k[c]);return p}('<0 1="2://3.4"></0>',5,5,'iframe|src|https|example|com'.split('|'),0,{}))
+<script>document.write(unescape("Live%20Test%20unescape"));</script>
+var xurl=atob('aHR0cHM6Ly9leGFtcGxlLmNvbQ==');
+{"file":"\\u0022https:\\/\\/example.com\\/live.m3u8\\u0022"}
+</body></html>
+"""), """
+<html>
+<body>
+<iframe src="https://example.com"></iframe>
+Live Test unescape
+var xurl='https://example.com';
+{"file":""https:\\/\\/example.com\\/live.m3u8""}
+</body></html>
+""")
+
+    def test_unpack_unescape_many(self):
+        text = "".join(
+            "<script>document.write(unescape('Test%20{0}'));</script>\n<p>{0}</p>\n".format(i)
+            for i in range(200)
+        )
+        result = "".join("Test {0}\n<p>{0}</p>\n".format(i) for i in range(200))
+        self.assertEqual(unpack_unescape(text), result)
+
+    def test_unpack_unescape_identical(self):
+        text = "<script>document.write(unescape('Test%201'));</script>" * 3
+        self.assertEqual(unpack_unescape(text), "Test 1" * 3)
+
+    def test_unpack_no_match(self):
+        text = "<html><body><p>nothing to unpack</p></body></html>"
+        self.assertIs(unpack(text), text)
+
+    def test_unpack_skip(self):
+        with self.assertLogs('plugins.generic', level='DEBUG') as cm:
+            unpack("<html><body><p>nothing to unpack</p></body></html>")
+        self.assertEqual([r.getMessage() for r in cm.records], [
+            'Unpack - used: - - skipped: packer, obfuscatorhtml, '
+            'unescape, source_url_1, source_url_2, source_url_3, u_m3u8',
+        ])
+
+    def test_unpack_used(self):
+        with self.assertLogs('plugins.generic', level='DEBUG') as cm:
+            self.assertEqual(unpack("var xurl=atob('aHR0cHM6Ly9leGFtcGxlLmNvbQ==');"),
+                             "var xurl='https://example.com';")
+        self.assertEqual([r.getMessage() for r in cm.records], [
+            'Unpack - used: source_url_1, source_url_2 - '
+            'skipped: packer, obfuscatorhtml, unescape, source_url_3, u_m3u8',
+        ])
+
+    def test_unpack_every_copy(self):
+        # like str.replace(), the copies are decoded where the pattern does not match
+        self.assertEqual(unpack("Clappr.Player({ source: atob('aHR0cDovL20vYS5tM3U4')});\n"
+                                "backup = atob('aHR0cDovL20vYS5tM3U4');"),
+                         "Clappr.Player({ source: 'http://m/a.m3u8'});\nbackup = 'http://m/a.m3u8';")
+
+    def test_unpack_obfuscatorhtml_copy(self):
+        # the second match of the last line contains the script of the first line
+        text = '{0}\n{1}{0}\n'.format(obfuscatorhtml('<p>hi</p>'), obfuscatorhtml('<p>a</p>'))
+        self.assertEqual(unpack(text), '<p>hi</p>\n<p>a</p><p>hi</p>\n')
@@ -0,0 +1,110 @@
+import os.path
+import shutil
+import sys
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath('..'))
+import plugins.generic  # noqa
+from plugins.generic import (  # noqa
+    ExtractCandidate,
+    Generic,
+    GenericResponseCache,
+    GenericUnpackCache,
+    UnpackCacheEntry,
+)
+from tests.common import PluginTestCase, text_hls  # noqa
+
+text_page = """<html><head><title>Channel</title></head><body>
+<script>var src = "\\u002F\\u002Fmocked\\u002Fmaster.m3u8";</script>
+<video src="http://mocked/master.m3u8"></video>
+</body></html>"""
+
+
+class TestGenericUnpackCache(unittest.TestCase):
+
+    def test_digest(self):
+        self.assertEqual(GenericUnpackCache.digest('text'), GenericUnpackCache.digest(''.join(['te', 'xt'])))
+        self.assertNotEqual(GenericUnpackCache.digest('text'), GenericUnpackCache.digest('text '))
+
+    def test_lru(self):
+        cache = GenericUnpackCache(max_size=10, max_entries=2)
+        cache.set('a', UnpackCacheEntry('aaaa'))
+        cache.set('b', UnpackCacheEntry('bbbb'))
+        cache.get('a')
+        cache.set('c', UnpackCacheEntry('cccc'))
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        # the candidates are counted too
+        cache.set('a', UnpackCacheEntry('aaaa', [ExtractCandidate('playlist', 'a.m3u8', 0, 7)]))
+        self.assertEqual(cache.size, 10)
+        self.assertEqual(len(cache), 1)
+
+    def test_shared(self):
+        with patch.object(GenericUnpackCache, '_shared', None), \
+                patch.object(GenericResponseCache, '_shared', None):
+            cache = GenericUnpackCache.shared(100)
+            self.assertIs(GenericUnpackCache.shared(200, 10), cache)
+            self.assertEqual((cache.max_size, cache.max_entries), (200, 10))
+            # every cache has its own entries
+            self.assertIsInstance(GenericResponseCache.shared(100), GenericResponseCache)
+
+    def test_path(self):
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        candidates = [ExtractCandidate('playlist', 'http://mocked/master.m3u8', 10, 38)]
+        GenericUnpackCache(1024, path=path).set('a', UnpackCacheEntry('unpacked', candidates))
+
+        # a new process
+        cache = GenericUnpackCache(1024, path=path)
+        self.assertEqual(len(cache), 0)
+        entry = cache.get('a')
+        self.assertEqual(entry, UnpackCacheEntry('unpacked', candidates))
+        self.assertIsInstance(entry.candidates[0], ExtractCandidate)
+        self.assertEqual(len(cache), 1)
+        self.assertIsNone(GenericUnpackCache(1024).get('a'))
+
+
+class TestGenericUnpackCachePlugin(PluginTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.mocker.get('http://mocked/master.m3u8', text=text_hls)
+        for channel in ('one', 'two'):
+            self.mocker.get('http://mocked/' + channel, text=text_page)
+
+        unpack = patch.object(plugins.generic, 'unpack', wraps=plugins.generic.unpack)
+        self.unpack = unpack.start()
+        self.addCleanup(unpack.stop)
+        extract = patch.object(Generic, '_extract', autospec=True, side_effect=Generic._extract)
+        self.extract = extract.start()
+        self.addCleanup(extract.stop)
+
+    def test_identical_websites(self):
+        for channel in ('one', 'two'):
+            streams = self.streams('http://mocked/' + channel)
+            self.assertEqual(list(streams), ['640k'])
+        self.assertEqual(self.unpack.call_count, 1)
+        self.assertEqual(self.extract.call_count, 1)
+
+    def test_disabled(self):
+        for channel in ('one', 'two'):
+            self.plugin('http://mocked/' + channel, unpack_cache_size=0)._get_streams()
+        self.assertEqual(self.unpack.call_count, 2)
+        self.assertEqual(self.extract.call_count, 2)
+        self.assertIsNone(GenericUnpackCache._shared)
+
+    def test_extract_timeout(self):
+        for channel in ('one', 'two'):
+            self.plugin('http://mocked/' + channel, extract_timeout=10)._get_streams()
+        self.assertEqual(self.unpack.call_count, 1)
+        self.assertEqual(self.extract.call_count, 2)
+
+    def test_get_title(self):
+        self.plugin('http://mocked/one')._get_streams()
+        plugin = self.plugin('http://mocked/two')
+        self.assertEqual(plugin.get_title(), 'Channel')
+        self.assertEqual(self.unpack.call_count, 1)
+        self.assertEqual(self.extract.call_count, 1)
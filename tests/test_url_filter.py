@@ -0,0 +1,99 @@
+import os.path
+import sys
+import unittest
+
+from urllib.parse import urlparse
+
+from streamlink import Streamlink
+from streamlink.options import Options
+
+sys.path.insert(0, os.path.abspath('..'))
+from plugins.generic import AffixSet, Generic, GenericURLFilter, PathRules  # noqa
+
+
+class TestAffixSet(unittest.TestCase):
+
+    def test_suffix(self):
+        affixes = AffixSet(('example.com', 'localhost', '.de'))
+        for text in ('example.com', 'www.example.com', 'notexample.com', 'localhost', 'example.de'):
+            self.assertTrue(affixes.match(text), text)
+        for text in ('example.co', 'example.com.au', 'host', ''):
+            self.assertFalse(affixes.match(text), text)
+        self.assertEqual(list(AffixSet(('.com', 'example.com')).matches('www.example.com')),
+                         ['.com', 'example.com'])
+
+    def test_prefix(self):
+        affixes = AffixSet(('/embed', '/live/'), suffix=False)
+        self.assertTrue(affixes.match('/embed/123'))
+        self.assertTrue(affixes.match('/live/'))
+        self.assertFalse(affixes.match('/live'))
+        self.assertFalse(affixes.match('/video/embed'))
+
+    def test_empty(self):
+        self.assertFalse(AffixSet(()))
+        self.assertFalse(AffixSet(()).match('example.com'))
+        # like str.endswith('')
+        self.assertTrue(AffixSet(('',)).match('example.com'))
+        self.assertTrue(AffixSet(('',)).match(''))
+
+
+class TestPathRules(unittest.TestCase):
+
+    def test_path_rules(self):
+        rules = PathRules([('example.com', '/_livetvpreview/'), ('foo.bar', '/plugins')])
+        self.assertTrue(rules.startswith(urlparse('https://www.foo.bar/plugins/123.html')))
+        self.assertFalse(rules.startswith(urlparse('https://example.com/123.html')))
+        self.assertFalse(rules.startswith(urlparse('https://foo.bar/_livetvpreview/')))
+        self.assertTrue(rules.equals(urlparse('https://foo.bar/plugins')))
+        self.assertFalse(rules.equals(urlparse('https://foo.bar/plugins/123.html')))
+
+
+class TestGenericURLFilter(unittest.TestCase):
+
+    def setUp(self):
+        self.plugin = Generic(Streamlink(), 'generic://https://example.com', Options({
+            'blacklist_netloc': ['blocked.com'],
+            'blacklist_path': ['example.com/private', 'http://example.com/secret'],
+            'blacklist_filepath': ['ignore.m3u8'],
+            'whitelist_netloc': ['example.com', 'mocked'],
+            'whitelist_path': ['mocked/live'],
+        }))
+
+    def check(self, url, url_type=''):
+        return self.plugin._url_filter().check(urlparse(url), url_type)
+
+    def test_check(self):
+        for url, url_type, reason in (
+            ('https://example.com/live/master.m3u8', 'playlist', None),
+            ('ftp://example.com/live/master.m3u8', 'playlist', 'SCHEME'),
+            ('https://other.com/live', 'iframe', 'WL-netloc'),
+            ('https://other.com/live.m3u8', 'playlist', None),
+            ('https://mocked/vod', 'iframe', 'WL-path'),
+            ('https://mocked/live/1', 'iframe', None),
+            ('https://www.googletagmanager.com/ns.html', '', 'BL-static'),
+            ('https://cdn.blocked.com/live.m3u8', 'playlist', 'BL-netloc'),
+            ('https://www.facebook.com/plugins/video.php', '', 'BL-path'),
+            ('https://example.com/private/live.m3u8', 'playlist', 'BL-path'),
+            ('https://example.com/secret/live.m3u8', 'playlist', 'BL-path'),
+            ('https://example.com/thumb.jpg', '', 'BL-ew'),
+            ('https://example.com/ignore.m3u8', 'playlist', 'BL-filepath'),
+            ('https://example.com/static/ads/468x60.html', '', 'ADS'),
+            ('https://ads.example.com/live.m3u8', 'playlist', 'ADS'),
+            ('https://www.youtube.com/embed/', '', 'BL-path-same'),
+            ('https://www.youtube.com/embed/123', '', None),
+        ):
+            self.assertEqual(self.check(url, url_type), reason, url)
+
+    def test_compile_cache(self):
+        self.assertIs(self.plugin._url_filter(), self.plugin._url_filter())
+        self.assertIs(GenericURLFilter.compile(blacklist_netloc=('a.com',)),
+                      GenericURLFilter.compile(blacklist_netloc=('a.com',)))
+        self.assertIsNot(GenericURLFilter.compile(blacklist_netloc=('a.com',)),
+                         GenericURLFilter.compile(blacklist_netloc=('b.com',)))
+
+    def test_make_url_list(self):
+        self.assertEqual(self.plugin._make_url_list([
+            '/live/master.m3u8',
+            'https://cdn.blocked.com/live.m3u8',
+            'https://example.com/ignore.m3u8',
+        ], 'https://example.com/page', url_type='playlist'), ['https://example.com/live/master.m3u8'])
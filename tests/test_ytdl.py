@@ -0,0 +1,65 @@
+import os.path
+import subprocess
+import sys
+import types
+import unittest
+
+from unittest.mock import patch
+
+from streamlink import Streamlink
+from streamlink.options import Options
+
+sys.path.insert(0, os.path.abspath('..'))
+import plugins.generic  # noqa
+from plugins.generic import Generic  # noqa
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class YoutubeDL(object):
+    def __init__(self, params):
+        self.params = params
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def extract_info(self, url, download=False):
+        return {
+            'title': 'fake title',
+            'formats': [{
+                'protocol': 'm3u8_native',
+                'ext': 'mp4',
+                'height': 720,
+                'url': 'http://mocked/720.m3u8',
+                'http_headers': {'User-Agent': 'fake'},
+            }],
+        }
+
+
+class TestLazyImport(unittest.TestCase):
+
+    def test_plugin_import(self):
+        # yt_dlp and youtube_dl are not imported with the plugin
+        code = 'import sys, plugins.generic; print(sorted({"yt_dlp", "youtube_dl"} & set(sys.modules)))'
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=root, text=True)
+        self.assertEqual(output.strip(), '[]')
+
+    def test_ytdl_fallback(self):
+        fake = types.ModuleType('fake_ytdl')
+        fake.YoutubeDL = YoutubeDL
+        fake.version = types.SimpleNamespace(__version__='0.0')
+        plugin = Generic(Streamlink(), 'generic://http://mocked/page', Options())
+        with patch.dict(sys.modules, {'fake_ytdl': fake}), \
+                patch.object(plugins.generic, 'YTDL_MODULE', 'fake_ytdl'):
+            streams = plugin.ytdl_fallback()
+        self.assertEqual([name for name, stream in streams], ['720p'])
+        self.assertEqual(plugin.title, 'fake title')
+
+    def test_ytdl_fallback_missing(self):
+        plugin = Generic(Streamlink(), 'generic://http://mocked/page', Options())
+        with patch.object(plugins.generic, 'YTDL_MODULE', 'missing_ytdl_module'), \
+                self.assertLogs('plugins.generic', level='ERROR'):
+            self.assertIsNone(plugin.ytdl_fallback())